@@ -1,11 +1,12 @@
 import copy
 import json
 import logging
+from collections import OrderedDict
+from http import HTTPStatus
 from typing import List, Text, Optional, Dict, Any, TYPE_CHECKING, Tuple, Set, Union
 
 import aiohttp
 import rasa.core
-from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 from rasa.core.policies.policy import PolicyPrediction
 from rasa.nlu.constants import (
     RESPONSE_SELECTOR_DEFAULT_INTENT,
@@ -75,6 +76,19 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# key in the action endpoint configuration to enable delta payloads
+DELTA_PAYLOADS_CONFIG_KEY = "delta_payloads"
+# keys of delta payloads and the corresponding acknowledgements of the action server
+DOMAIN_DIGEST_KEY = "domain_digest"
+TRACKER_EVENTS_OFFSET_KEY = "tracker_events_offset"
+
+# maximum number of conversations for which acknowledgements are remembered
+MAX_ACKNOWLEDGED_CONVERSATIONS = 10_000
+
+# number of events which the action server acknowledged, number of events of the
+# tracker at that time and the serialised last event of the tracker
+_Acknowledgement = Tuple[int, int, Optional[Dict[Text, Any]]]
+
 
 def default_actions(action_endpoint: Optional[EndpointConfig] = None) -> List["Action"]:
     """List default actions."""
@@ -610,6 +624,138 @@ class ActionDeactivateLoop(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+class ActionServerPayloadCache:
+    """Remembers which parts of the payloads were cached by action servers.
+
+    This is used to send delta payloads to action servers: the domain is only sent
+    until the action server acknowledged its digest and only the events which the
+    action server didn't acknowledge yet are sent for a conversation.
+    """
+
+    def __init__(self, max_conversations: int = MAX_ACKNOWLEDGED_CONVERSATIONS) -> None:
+        """Creates the cache.
+
+        Args:
+            max_conversations: Maximum number of conversations for which the
+                acknowledged events are remembered. The least recently used
+                conversations are forgotten first.
+        """
+        self._max_conversations = max_conversations
+        self._domain_digests: Dict[Text, Text] = {}
+        # maps action server URL and sender ID to the acknowledged events
+        self._conversations: "OrderedDict[Tuple[Text, Text], _Acknowledgement]" = (
+            OrderedDict()
+        )
+
+    def has_domain(self, url: Text, domain_digest: Text) -> bool:
+        """Checks if the action server acknowledged a domain.
+
+        Args:
+            url: The URL of the action server.
+            domain_digest: The fingerprint of the domain.
+
+        Returns:
+            `True` if the action server has the domain cached.
+        """
+        return self._domain_digests.get(url) == domain_digest
+
+    def acknowledge_domain(self, url: Text, domain_digest: Text) -> None:
+        """Remembers that the action server cached a domain.
+
+        Args:
+            url: The URL of the action server.
+            domain_digest: The fingerprint of the domain.
+        """
+        self._domain_digests[url] = domain_digest
+
+    def unacknowledged_events(
+        self, url: Text, tracker: DialogueStateTracker
+    ) -> Tuple[int, List[Event]]:
+        """Returns the events of a conversation which the action server doesn't have.
+
+        Args:
+            url: The URL of the action server.
+            tracker: The tracker of the conversation.
+
+        Returns:
+            The number of events which the action server has cached for the
+            conversation and the events of the tracker which follow them. If the
+            last acknowledged event isn't part of the tracker anymore, all events are
+            returned together with an offset of `0`.
+        """
+        all_events = list(tracker.events)
+        acknowledged = self._conversations.get((url, tracker.sender_id))
+        if not acknowledged:
+            return 0, all_events
+
+        self._conversations.move_to_end((url, tracker.sender_id))
+        offset, number_of_tracker_events, last_event = acknowledged
+        if last_event is None:
+            return 0, all_events
+
+        if (
+            0 < number_of_tracker_events <= len(all_events)
+            and all_events[number_of_tracker_events - 1].as_dict() == last_event
+        ):
+            return offset, all_events[number_of_tracker_events:]
+
+        # the tracker only contains the most recent events of the conversation, e.g.
+        # because its event history is limited
+        for index in reversed(range(len(all_events))):
+            if all_events[index].as_dict() == last_event:
+                return offset, all_events[index + 1 :]
+
+        return 0, all_events
+
+    def acknowledge_events(
+        self, url: Text, tracker: DialogueStateTracker, number_of_events: int
+    ) -> None:
+        """Remembers that the action server cached all events of a conversation.
+
+        Args:
+            url: The URL of the action server.
+            tracker: The tracker of the conversation.
+            number_of_events: The number of events which the action server has
+                cached for the conversation.
+        """
+        last_event = tracker.events[-1].as_dict() if tracker.events else None
+        self._conversations[(url, tracker.sender_id)] = (
+            number_of_events,
+            len(tracker.events),
+            last_event,
+        )
+        self._conversations.move_to_end((url, tracker.sender_id))
+
+        while len(self._conversations) > self._max_conversations:
+            self._conversations.popitem(last=False)
+
+    def forget(self, url: Text, sender_id: Text) -> None:
+        """Forgets what the action server acknowledged for a conversation.
+
+        Args:
+            url: The URL of the action server.
+            sender_id: The ID of the conversation.
+        """
+        self._conversations.pop((url, sender_id), None)
+
+    def forget_domain(self, url: Text) -> None:
+        """Forgets which domain the action server acknowledged.
+
+        Args:
+            url: The URL of the action server.
+        """
+        self._domain_digests.pop(url, None)
+
+    def clear(self) -> None:
+        """Forgets all acknowledgements."""
+        self._domain_digests.clear()
+        self._conversations.clear()
+
+
+# shared by all `RemoteAction`s as they are created for every prediction
+action_server_payload_cache = ActionServerPayloadCache()
+
+
 class RemoteAction(Action):
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
@@ -632,6 +778,88 @@ class RemoteAction(Action):
             "version": rasa.__version__,
         }
 
+    def _delta_action_call_format(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Tuple[Dict[Text, Any], int]:
+        """Create the request json containing only what the action server lacks.
+
+        Returns:
+            The request json and the number of events which the action server will
+            have cached for the conversation after processing the request.
+        """
+        from rasa.shared.core.trackers import EventVerbosity
+
+        url = self.action_endpoint.url
+        (
+            offset,
+            unacknowledged_events,
+        ) = action_server_payload_cache.unacknowledged_events(url, tracker)
+
+        tracker_state = tracker.current_state(EventVerbosity.NONE)
+        tracker_state["events"] = [event.as_dict() for event in unacknowledged_events]
+
+        json_body = {
+            "next_action": self._name,
+            "sender_id": tracker.sender_id,
+            "tracker": tracker_state,
+            TRACKER_EVENTS_OFFSET_KEY: offset,
+            DOMAIN_DIGEST_KEY: domain.fingerprint(),
+            "version": rasa.__version__,
+        }
+        if not action_server_payload_cache.has_domain(url, domain.fingerprint()):
+            json_body["domain"] = domain.as_dict()
+
+        return json_body, offset + len(unacknowledged_events)
+
+    def _uses_delta_payloads(self) -> bool:
+        return bool(self.action_endpoint.kwargs.get(DELTA_PAYLOADS_CONFIG_KEY, False))
+
+    async def _request_with_delta_payload(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Dict[Text, Any]:
+        """Calls the action server with a delta payload.
+
+        If the action server reports that it misses cached data, the call is
+        repeated with the full domain and all events of the tracker.
+        """
+        try:
+            return await self._request_and_acknowledge(tracker, domain)
+        except ClientResponseError as e:
+            if e.status != HTTPStatus.CONFLICT:
+                raise
+
+            logger.debug(
+                f"Action server is missing cached data for conversation "
+                f"'{tracker.sender_id}'. Sending the full payload instead."
+            )
+            action_server_payload_cache.forget_domain(self.action_endpoint.url)
+            action_server_payload_cache.forget(
+                self.action_endpoint.url, tracker.sender_id
+            )
+            return await self._request_and_acknowledge(tracker, domain)
+
+    async def _request_and_acknowledge(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Dict[Text, Any]:
+        url = self.action_endpoint.url
+        json_body, number_of_events = self._delta_action_call_format(tracker, domain)
+        response = await self.action_endpoint.request(json=json_body, method="post")
+
+        self._validate_action_result(response)
+
+        if response.get(DOMAIN_DIGEST_KEY) == json_body[DOMAIN_DIGEST_KEY]:
+            action_server_payload_cache.acknowledge_domain(
+                url, json_body[DOMAIN_DIGEST_KEY]
+            )
+        if response.get(TRACKER_EVENTS_OFFSET_KEY) == number_of_events:
+            action_server_payload_cache.acknowledge_events(
+                url, tracker, number_of_events
+            )
+        else:
+            action_server_payload_cache.forget(url, tracker.sender_id)
+
+        return response
+
     @staticmethod
     def action_response_format_spec() -> Dict[Text, Any]:
         """Expected response schema for an Action endpoint.
@@ -643,6 +871,8 @@ class RemoteAction(Action):
             "properties": {
                 "events": EVENTS_SCHEMA,
                 "responses": {"type": "array", "items": {"type": "object"}},
+                DOMAIN_DIGEST_KEY: {"type": "string"},
+                TRACKER_EVENTS_OFFSET_KEY: {"type": "integer"},
             },
         }
         return schema
@@ -704,7 +934,6 @@ class RemoteAction(Action):
         domain: "Domain",
     ) -> List[Event]:
         """Runs action. Please see parent class for the full docstring."""
-        json_body = self._action_call_format(tracker, domain)
         if not self.action_endpoint:
             raise RasaException(
                 f"Failed to execute custom action '{self.name()}' "
@@ -719,11 +948,15 @@ class RemoteAction(Action):
             logger.debug(
                 "Calling action endpoint to run action '{}'.".format(self.name())
             )
-            response = await self.action_endpoint.request(
-                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
-            )
+            if self._uses_delta_payloads():
+                response = await self._request_with_delta_payload(tracker, domain)
+            else:
+                json_body = self._action_call_format(tracker, domain)
+                response = await self.action_endpoint.request(
+                    json=json_body, method="post"
+                )
 
-            self._validate_action_result(response)
+                self._validate_action_result(response)
 
             events_json = response.get("events", [])
             responses = response.get("responses", [])
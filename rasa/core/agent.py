@@ -21,7 +21,6 @@ from aiohttp import ClientError
 
 from rasa.core import jobs
 from rasa.core.channels.channel import OutputChannel, UserMessage
-from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
 from rasa.shared.core.domain import Domain
 from rasa.core.exceptions import AgentNotReady
@@ -30,6 +29,7 @@ from rasa.core.lock_store import InMemoryLockStore, LockStore
 from rasa.core.nlg import NaturalLanguageGenerator
 from rasa.core.policies.policy import PolicyPrediction
 from rasa.core.processor import MessageProcessor
+from rasa.engine.runner.executor import GraphRunExecutor
 from rasa.core.tracker_store import (
     FailSafeTrackerStore,
     InMemoryTrackerStore,
@@ -123,59 +123,54 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
-        try:
-            params = model_server.combine_parameters()
-            async with session.request(
-                "GET",
-                model_server.url,
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                headers=headers,
-                params=params,
-            ) as resp:
-
-                if resp.status in [204, 304]:
-                    logger.debug(
-                        "Model server returned {} status code, "
-                        "indicating that no new model is available. "
-                        "Current fingerprint: {}"
-                        "".format(resp.status, fingerprint)
-                    )
-                    return None
-                elif resp.status == 404:
-                    logger.debug(
-                        "Model server could not find a model at the requested "
-                        "endpoint '{}'. It's possible that no model has been "
-                        "trained, or that the requested tag hasn't been "
-                        "assigned.".format(model_server.url)
-                    )
-                    return None
-                elif resp.status != 200:
-                    logger.debug(
-                        "Tried to fetch model from server, but server response "
-                        "status code is {}. We'll retry later..."
-                        "".format(resp.status)
-                    )
-                    return None
-
-                model_path = Path(model_directory) / resp.headers.get(
-                    "filename", "model.tar.gz"
+    try:
+        params = model_server.combine_parameters()
+        async with model_server.pooled_session().request(
+            "GET", model_server.url, headers=headers, params=params,
+        ) as resp:
+
+            if resp.status in [204, 304]:
+                logger.debug(
+                    "Model server returned {} status code, "
+                    "indicating that no new model is available. "
+                    "Current fingerprint: {}"
+                    "".format(resp.status, fingerprint)
+                )
+                return None
+            elif resp.status == 404:
+                logger.debug(
+                    "Model server could not find a model at the requested "
+                    "endpoint '{}'. It's possible that no model has been "
+                    "trained, or that the requested tag hasn't been "
+                    "assigned.".format(model_server.url)
                 )
-                with open(model_path, "wb") as file:
-                    file.write(await resp.read())
+                return None
+            elif resp.status != 200:
+                logger.debug(
+                    "Tried to fetch model from server, but server response "
+                    "status code is {}. We'll retry later..."
+                    "".format(resp.status)
+                )
+                return None
+
+            model_path = Path(model_directory) / resp.headers.get(
+                "filename", "model.tar.gz"
+            )
+            with open(model_path, "wb") as file:
+                file.write(await resp.read())
 
-                logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
+            logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
 
-                # return the new fingerprint
-                return resp.headers.get("ETag")
+            # return the new fingerprint
+            return resp.headers.get("ETag")
 
-        except aiohttp.ClientError as e:
-            logger.debug(
-                "Tried to fetch model from server, but "
-                "couldn't reach server. We'll retry later... "
-                "Error: {}.".format(e)
-            )
-            return None
+    except aiohttp.ClientError as e:
+        logger.debug(
+            "Tried to fetch model from server, but "
+            "couldn't reach server. We'll retry later... "
+            "Error: {}.".format(e)
+        )
+        return None
 
 
 async def _run_model_pulling_worker(model_server: EndpointConfig, agent: Agent) -> None:
@@ -227,6 +222,7 @@ async def load_agent(
 
     tracker_store = None
     lock_store = None
+    graph_executor = None
     generator = None
     action_endpoint = None
     http_interpreter = None
@@ -237,6 +233,7 @@ async def load_agent(
             endpoints.tracker_store, event_broker=broker
         )
         lock_store = LockStore.create(endpoints.lock_store)
+        graph_executor = GraphRunExecutor.create(endpoints.graph_runner)
         generator = endpoints.nlg
         action_endpoint = endpoints.action
         model_server = endpoints.model if endpoints.model else model_server
@@ -251,6 +248,7 @@ async def load_agent(
         model_server=model_server,
         remote_storage=remote_storage,
         http_interpreter=http_interpreter,
+        graph_executor=graph_executor,
     )
 
     try:
@@ -312,6 +310,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        graph_executor: Optional[GraphRunExecutor] = None,
     ):
         """Initializes an `Agent`."""
         self.domain = domain
@@ -320,6 +319,7 @@ class Agent:
         self.nlg = NaturalLanguageGenerator.create(generator, self.domain)
         self.tracker_store = self._create_tracker_store(tracker_store, self.domain)
         self.lock_store = self._create_lock_store(lock_store)
+        self.graph_executor = GraphRunExecutor.create(graph_executor)
         self.action_endpoint = action_endpoint
         self.http_interpreter = http_interpreter
 
@@ -340,6 +340,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        graph_executor: Optional[GraphRunExecutor] = None,
     ) -> Agent:
         """Constructs a new agent and loads the processer and model."""
         agent = Agent(
@@ -352,6 +353,7 @@ class Agent:
             model_server=model_server,
             remote_storage=remote_storage,
             http_interpreter=http_interpreter,
+            graph_executor=graph_executor,
         )
         agent.load_model(model_path=model_path, fingerprint=fingerprint)
         return agent
@@ -367,6 +369,7 @@ class Agent:
             action_endpoint=self.action_endpoint,
             generator=self.nlg,
             http_interpreter=self.http_interpreter,
+            graph_executor=self.graph_executor,
         )
         self.domain = self.processor.domain
 
@@ -377,6 +380,55 @@ class Agent:
         if hasattr(self.nlg, "responses"):
             self.nlg.responses = self.domain.responses if self.domain else {}
 
+    def http_endpoints(self) -> List[EndpointConfig]:
+        """Returns the HTTP endpoints which are used by the agent."""
+        endpoints = [
+            self.action_endpoint,
+            self.model_server,
+            getattr(self.nlg, "nlg_endpoint", None),
+            self.http_interpreter.endpoint_config if self.http_interpreter else None,
+        ]
+
+        unique_endpoints = []
+        for endpoint in endpoints:
+            if endpoint is not None and not any(
+                endpoint is other for other in unique_endpoints
+            ):
+                unique_endpoints.append(endpoint)
+
+        return unique_endpoints
+
+    async def close_http_sessions(
+        self, still_used_endpoints: Optional[List[EndpointConfig]] = None
+    ) -> None:
+        """Closes the connections to the HTTP endpoints of the agent.
+
+        Args:
+            still_used_endpoints: Endpoints which are shared with another agent and
+                hence have to stay open.
+        """
+        still_used_endpoints = still_used_endpoints or []
+        for endpoint in self.http_endpoints():
+            if not any(endpoint is other for other in still_used_endpoints):
+                await endpoint.close()
+
+    async def close(self, successor: Optional[Agent] = None) -> None:
+        """Releases the resources of the agent.
+
+        Args:
+            successor: An agent which replaces this agent (e.g. because a new model
+                was loaded). Resources which are shared with it stay open.
+        """
+        await self.close_http_sessions(
+            still_used_endpoints=successor.http_endpoints() if successor else None
+        )
+
+        if self.graph_executor.is_shared or (
+            successor and successor.graph_executor is self.graph_executor
+        ):
+            return
+        self.graph_executor.shutdown()
+
     @property
     def model_id(self) -> Optional[Text]:
         """Returns the model_id from processor's model_metadata."""
@@ -437,13 +489,13 @@ class Agent:
         return await self.processor.predict_next_for_sender_id(sender_id)
 
     @agent_must_be_ready
-    def predict_next_with_tracker(
+    async def predict_next_with_tracker(
         self,
         tracker: DialogueStateTracker,
         verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
     ) -> Optional[Dict[Text, Any]]:
         """Predicts the next action."""
-        return self.processor.predict_next_with_tracker(tracker, verbosity)
+        return await self.processor.predict_next_with_tracker(tracker, verbosity)
 
     @agent_must_be_ready
     async def log_message(self, message: UserMessage,) -> DialogueStateTracker:
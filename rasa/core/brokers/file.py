@@ -1,10 +1,10 @@
-import json
 import logging
 import typing
 from asyncio import AbstractEventLoop
 from typing import Optional, Text, Dict
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.shared.core import event_codec
 
 if typing.TYPE_CHECKING:
     from rasa.utils.endpoints import EndpointConfig
@@ -55,5 +55,5 @@ class FileEventBroker(EventBroker):
     def publish(self, event: Dict) -> None:
         """Write event to file."""
 
-        self.event_logger.info(json.dumps(event))
+        self.event_logger.info(event_codec.dumps(event))
         self.event_logger.handlers[0].flush()
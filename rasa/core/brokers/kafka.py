@@ -1,11 +1,11 @@
 import os
-import json
 import logging
 from asyncio import AbstractEventLoop
 from typing import Any, Text, List, Optional, Union, Dict
 import time
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.shared.core import event_codec
 from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.endpoints import EndpointConfig
 from rasa.shared.exceptions import RasaException
@@ -178,7 +178,9 @@ class KafkaEventBroker(EventBroker):
             self.producer = kafka.KafkaProducer(
                 client_id=self.client_id,
                 bootstrap_servers=self.url,
-                value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                value_serializer=lambda v: event_codec.dumps(v).encode(
+                    DEFAULT_ENCODING
+                ),
                 **authentication_params,
             )
         except AssertionError as e:
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import os
 import ssl
@@ -13,6 +12,7 @@ import aio_pika
 from rasa.shared.exceptions import RasaException
 from rasa.shared.constants import DOCS_URL_PIKA_EVENT_BROKER
 from rasa.core.brokers.broker import EventBroker
+from rasa.shared.core import event_codec
 import rasa.shared.utils.io
 from rasa.utils.endpoints import EndpointConfig
 from rasa.shared.utils.io import DEFAULT_ENCODING
@@ -284,7 +284,7 @@ class PikaEventBroker(EventBroker):
     def _message(
         self, event: Dict[Text, Any], headers: Optional[Dict[Text, Text]]
     ) -> aio_pika.Message:
-        body = json.dumps(event)
+        body = event_codec.dumps(event)
         return aio_pika.Message(
             bytes(body, DEFAULT_ENCODING),
             headers=headers,
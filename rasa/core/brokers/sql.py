@@ -1,5 +1,4 @@
 import contextlib
-import json
 import logging
 from asyncio import AbstractEventLoop
 from typing import Any, Dict, Optional, Text, Generator
@@ -10,6 +9,7 @@ from sqlalchemy import Column, Integer, String
 from sqlalchemy import Text as SqlAlchemyText  # to avoid name clash with typing.Text
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.shared.core import event_codec
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
@@ -78,7 +78,7 @@ class SQLEventBroker(EventBroker):
         with self.session_scope() as session:
             session.add(
                 self.SQLBrokerEvent(
-                    sender_id=event.get("sender_id"), data=json.dumps(event)
+                    sender_id=event.get("sender_id"), data=event_codec.dumps(event)
                 )
             )
             session.commit()
@@ -249,7 +249,9 @@ class TwilioVoiceInput(InputChannel):
             # If the user doesn't respond resend the last message.
             else:
                 # Get last user utterance from tracker.
-                tracker = request.app.agent.tracker_store.retrieve(sender_id)
+                tracker = await request.app.agent.tracker_store.retrieve_async(
+                    sender_id
+                )
                 last_response = None
                 if tracker:
                     last_response = next(
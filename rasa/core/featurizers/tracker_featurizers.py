@@ -11,12 +11,16 @@ import numpy as np
 
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.core.featurizers.precomputation import MessageContainerForCoreFeaturization
+from rasa.core.featurizers.training_tracker_states import (
+    TrainingTrackerStates,
+    unfreeze_states,
+)
 from rasa.core.exceptions import InvalidTrackerFeaturizerUsageError
 import rasa.shared.core.trackers
 import rasa.shared.utils.io
 from rasa.shared.nlu.constants import TEXT, INTENT, ENTITIES, ACTION_NAME
 from rasa.shared.nlu.training_data.features import Features
-from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.core.trackers import DialogueStateTracker, FrozenState
 from rasa.shared.core.domain import State, Domain
 from rasa.shared.core.events import Event, ActionExecuted, UserUttered
 from rasa.shared.core.constants import (
@@ -90,6 +94,47 @@ class TrackerFeaturizer:
             rule_only_data=rule_only_data,
         )
 
+    def _create_training_states(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        omit_unset_slots: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
+    ) -> Tuple[List[State], List[FrozenState]]:
+        """Creates the states of a training tracker and their frozen form.
+
+        Args:
+            tracker: The training tracker to transform to states.
+            domain: The domain of the tracker.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
+
+        Returns:
+            The states and the frozen (hashable) states of the tracker.
+        """
+        frozen_states = None
+        # the shared states include the initial values of slots
+        if training_tracker_states is not None and not omit_unset_slots:
+            frozen_states = training_tracker_states.frozen_states(tracker)
+        if frozen_states is not None:
+            return unfreeze_states(frozen_states), frozen_states
+
+        states = self._create_states(tracker, domain, omit_unset_slots=omit_unset_slots)
+        return (
+            states,
+            [DialogueStateTracker.freeze_current_state(state) for state in states],
+        )
+
+    @staticmethod
+    def _applied_events(
+        tracker: DialogueStateTracker,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
+    ) -> List[Event]:
+        if training_tracker_states is not None:
+            return training_tracker_states.applied_events(tracker)
+        return tracker.applied_events()
+
     def _featurize_states(
         self,
         trackers_as_states: List[List[State]],
@@ -103,15 +148,34 @@ class TrackerFeaturizer:
             precomputations: Contains precomputed features and attributes.
 
         Returns:
-            Featurized tracker states.
+            Featurized tracker states. Equal states share the same encoding.
         """
-        return [
-            [
-                self.state_featurizer.encode_state(state, precomputations)
-                for state in tracker_states
-            ]
-            for tracker_states in trackers_as_states
-        ]
+        # The same states occur in many trackers (especially if the trackers are
+        # windows of a longer dialogue), hence every distinct state is only encoded
+        # once.
+        encoded_states: Dict[FrozenState, Dict[Text, List[Features]]] = {}
+        number_of_states = 0
+
+        tracker_state_features = []
+        for tracker_states in trackers_as_states:
+            state_features = []
+            for state in tracker_states:
+                frozen_state = DialogueStateTracker.freeze_current_state(state)
+                encoded_state = encoded_states.get(frozen_state)
+                if encoded_state is None:
+                    encoded_state = self.state_featurizer.encode_state(
+                        state, precomputations
+                    )
+                    encoded_states[frozen_state] = encoded_state
+                state_features.append(encoded_state)
+            number_of_states += len(tracker_states)
+            tracker_state_features.append(state_features)
+
+        logger.debug(
+            f"Encoded {len(encoded_states)} distinct states of "
+            f"{number_of_states} states in {len(trackers_as_states)} trackers."
+        )
+        return tracker_state_features
 
     @staticmethod
     def _convert_labels_to_ids(
@@ -205,6 +269,7 @@ class TrackerFeaturizer:
         domain: Domain,
         omit_unset_slots: bool = False,
         ignore_action_unlikely_intent: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> Tuple[List[List[State]], List[List[Text]]]:
         """Transforms trackers to states and labels.
 
@@ -214,6 +279,8 @@ class TrackerFeaturizer:
             omit_unset_slots: If `True` do not include the initial values of slots.
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training states.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             Trackers as states and labels.
@@ -227,6 +294,7 @@ class TrackerFeaturizer:
             domain,
             omit_unset_slots=omit_unset_slots,
             ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+            training_tracker_states=training_tracker_states,
         )
         return trackers_as_states, trackers_as_labels
 
@@ -237,6 +305,7 @@ class TrackerFeaturizer:
         domain: Domain,
         omit_unset_slots: bool = False,
         ignore_action_unlikely_intent: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> Tuple[List[List[State]], List[List[Text]], List[List[Dict[Text, Any]]]]:
         """Transforms trackers to states, labels, and entity data.
 
@@ -246,6 +315,8 @@ class TrackerFeaturizer:
             omit_unset_slots: If `True` do not include the initial values of slots.
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training states.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             Trackers as states, labels, and entity data.
@@ -283,6 +354,7 @@ class TrackerFeaturizer:
         precomputations: Optional[MessageContainerForCoreFeaturization],
         bilou_tagging: bool = False,
         ignore_action_unlikely_intent: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> Tuple[
         List[List[Dict[Text, List[Features]]]],
         np.ndarray,
@@ -297,6 +369,8 @@ class TrackerFeaturizer:
             bilou_tagging: indicates whether BILOU tagging should be used or not
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training state features.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             - a dictionary of state types (INTENT, TEXT, ACTION_NAME, ACTION_TEXT,
@@ -317,6 +391,7 @@ class TrackerFeaturizer:
             trackers,
             domain,
             ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+            training_tracker_states=training_tracker_states,
         )
 
         tracker_state_features = self._featurize_states(
@@ -478,6 +553,20 @@ class TrackerFeaturizer:
             if not _is_prev_action_unlikely_intent_in_state(state)
         ]
 
+    @staticmethod
+    def _remove_action_unlikely_intent_from_training_states(
+        states: List[State], frozen_states: List[FrozenState]
+    ) -> Tuple[List[State], List[FrozenState]]:
+        kept_indices = [
+            index
+            for index, state in enumerate(states)
+            if not _is_prev_action_unlikely_intent_in_state(state)
+        ]
+        return (
+            [states[index] for index in kept_indices],
+            [frozen_states[index] for index in kept_indices],
+        )
+
     @staticmethod
     def _remove_action_unlikely_intent_from_events(events: List[Event]) -> List[Event]:
         return [
@@ -502,6 +591,7 @@ class FullDialogueTrackerFeaturizer(TrackerFeaturizer):
         domain: Domain,
         omit_unset_slots: bool = False,
         ignore_action_unlikely_intent: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> Tuple[
         List[List[State]], List[List[Optional[Text]]], List[List[Dict[Text, Any]]]
     ]:
@@ -513,6 +603,8 @@ class FullDialogueTrackerFeaturizer(TrackerFeaturizer):
             omit_unset_slots: If `True` do not include the initial values of slots.
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training states.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             Trackers as states, action labels, and entity data.
@@ -532,10 +624,14 @@ class FullDialogueTrackerFeaturizer(TrackerFeaturizer):
             disable=rasa.shared.utils.io.is_logging_disabled(),
         )
         for tracker in pbar:
-            states = self._create_states(
-                tracker, domain, omit_unset_slots=omit_unset_slots
-            )
-            events = tracker.applied_events()
+            states = None
+            if training_tracker_states is not None and not omit_unset_slots:
+                states = training_tracker_states.states(tracker)
+            if states is None:
+                states = self._create_states(
+                    tracker, domain, omit_unset_slots=omit_unset_slots
+                )
+            events = self._applied_events(tracker, training_tracker_states)
 
             if ignore_action_unlikely_intent:
                 states = self._remove_action_unlikely_intent_from_states(states)
@@ -674,23 +770,22 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         return states[-slice_length:]
 
     @staticmethod
-    def _hash_example(states: List[State], labels: Optional[List[Text]] = None) -> int:
+    def _hash_example(
+        frozen_states: Tuple[FrozenState, ...], labels: Optional[List[Text]] = None
+    ) -> int:
         """Hashes states (and optionally label).
 
         Produces a hash of the tracker state sequence (and optionally the labels).
         If `labels` is `None`, labels don't get hashed.
 
         Args:
-            states: The tracker state sequence to hash.
+            frozen_states: The frozen tracker state sequence to hash (see
+                `DialogueStateTracker.freeze_current_state`).
             labels: Label strings associated with this state sequence.
 
         Returns:
             The hash of the states and (optionally) the label.
         """
-        frozen_states = tuple(
-            s if s is None else DialogueStateTracker.freeze_current_state(s)
-            for s in states
-        )
         if labels is not None:
             frozen_labels = tuple(labels)
             return hash((frozen_states, frozen_labels))
@@ -703,6 +798,7 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         domain: Domain,
         omit_unset_slots: bool = False,
         ignore_action_unlikely_intent: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> Tuple[List[List[State]], List[List[Text]], List[List[Dict[Text, Any]]]]:
         """Transforms trackers to states, action labels, and entity data.
 
@@ -712,6 +808,8 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
             omit_unset_slots: If `True` do not include the initial values of slots.
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training states.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             Trackers as states, labels, and entity data.
@@ -735,15 +833,16 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         )
         for tracker in pbar:
 
-            for states, label, entities in self._extract_examples(
+            for states, frozen_states, label, entities in self._extract_examples(
                 tracker,
                 domain,
                 omit_unset_slots=omit_unset_slots,
                 ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+                training_tracker_states=training_tracker_states,
             ):
 
                 if self.remove_duplicates:
-                    hashed = self._hash_example(states, label)
+                    hashed = self._hash_example(frozen_states, label)
                     if hashed in hashed_examples:
                         continue
                     hashed_examples.add(hashed)
@@ -766,27 +865,39 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         domain: Domain,
         omit_unset_slots: bool = False,
         ignore_action_unlikely_intent: bool = False,
-    ) -> Iterator[Tuple[List[State], List[Text], List[Dict[Text, Any]]]]:
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
+    ) -> Iterator[
+        Tuple[List[State], Tuple[FrozenState, ...], List[Text], List[Dict[Text, Any]]]
+    ]:
         """Creates an iterator over training examples from a tracker.
 
         Args:
-            trackers: The tracker from which to extract training examples.
+            tracker: The tracker from which to extract training examples.
             domain: The domain of the training data.
             omit_unset_slots: If `True` do not include the initial values of slots.
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training states.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
-            An iterator over example states, labels, and entity data.
+            An iterator over example states, their frozen form, labels, and entity
+            data.
         """
-        tracker_states = self._create_states(
-            tracker, domain, omit_unset_slots=omit_unset_slots
+        tracker_states, frozen_tracker_states = self._create_training_states(
+            tracker,
+            domain,
+            omit_unset_slots=omit_unset_slots,
+            training_tracker_states=training_tracker_states,
         )
-        events = tracker.applied_events()
+        events = self._applied_events(tracker, training_tracker_states)
 
         if ignore_action_unlikely_intent:
-            tracker_states = self._remove_action_unlikely_intent_from_states(
-                tracker_states
+            (
+                tracker_states,
+                frozen_tracker_states,
+            ) = self._remove_action_unlikely_intent_from_training_states(
+                tracker_states, frozen_tracker_states
             )
             events = self._remove_action_unlikely_intent_from_events(events)
 
@@ -807,10 +918,13 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
                 sliced_states = self.slice_state_history(
                     tracker_states[:label_index], self.max_history
                 )
+                frozen_sliced_states = self.slice_state_history(
+                    frozen_tracker_states[:label_index], self.max_history
+                )
                 label = [event.action_name or event.action_text]
                 entities = [entity_data]
 
-                yield sliced_states, label, entities
+                yield sliced_states, tuple(frozen_sliced_states), label, entities
 
                 # reset entity_data for the the next turn
                 entity_data = {}
@@ -939,6 +1053,7 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
         domain: Domain,
         omit_unset_slots: bool = False,
         ignore_action_unlikely_intent: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> Tuple[List[List[State]], List[List[Text]], List[List[Dict[Text, Any]]]]:
         """Transforms trackers to states, intent labels, and entity data.
 
@@ -948,11 +1063,14 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
             omit_unset_slots: If `True` do not include the initial values of slots.
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training states.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             Trackers as states, labels, and entity data.
         """
         example_states = []
+        example_state_hashes = []
         example_entities = []
 
         # Store of example hashes (of both states and labels) for removing
@@ -974,21 +1092,22 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
         )
         for tracker in pbar:
 
-            for states, label, entities in self._extract_examples(
+            for states, frozen_states, label, entities in self._extract_examples(
                 tracker,
                 domain,
                 omit_unset_slots=omit_unset_slots,
                 ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+                training_tracker_states=training_tracker_states,
             ):
 
                 if self.remove_duplicates:
-                    hashed = self._hash_example(states, label)
+                    hashed = self._hash_example(frozen_states, label)
                     if hashed in hashed_examples:
                         continue
                     hashed_examples.add(hashed)
 
                 # Store all positive labels associated with a training state.
-                state_hash = self._hash_example(states)
+                state_hash = self._hash_example(frozen_states)
 
                 # Only add unique example states unless `remove_duplicates` is `False`.
                 if (
@@ -996,6 +1115,7 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
                     or state_hash not in state_hash_to_label_set
                 ):
                     example_states.append(states)
+                    example_state_hashes.append(state_hash)
                     example_entities.append(entities)
 
                 state_hash_to_label_set[state_hash].add(label[0])
@@ -1004,8 +1124,8 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
 
         # Collect positive labels for each state example.
         example_labels = [
-            list(state_hash_to_label_set[self._hash_example(state)])
-            for state in example_states
+            list(state_hash_to_label_set[state_hash])
+            for state_hash in example_state_hashes
         ]
 
         self._remove_user_text_if_intent(example_states)
@@ -1020,7 +1140,10 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
         domain: Domain,
         omit_unset_slots: bool = False,
         ignore_action_unlikely_intent: bool = False,
-    ) -> Iterator[Tuple[List[State], List[Text], List[Dict[Text, Any]]]]:
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
+    ) -> Iterator[
+        Tuple[List[State], Tuple[FrozenState, ...], List[Text], List[Dict[Text, Any]]]
+    ]:
         """Creates an iterator over training examples from a tracker.
 
         Args:
@@ -1029,18 +1152,27 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
             omit_unset_slots: If `True` do not include the initial values of slots.
             ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
                 from training states.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
-            An iterator over example states, labels, and entity data.
+            An iterator over example states, their frozen form, labels, and entity
+            data.
         """
-        tracker_states = self._create_states(
-            tracker, domain, omit_unset_slots=omit_unset_slots
+        tracker_states, frozen_tracker_states = self._create_training_states(
+            tracker,
+            domain,
+            omit_unset_slots=omit_unset_slots,
+            training_tracker_states=training_tracker_states,
         )
-        events = tracker.applied_events()
+        events = self._applied_events(tracker, training_tracker_states)
 
         if ignore_action_unlikely_intent:
-            tracker_states = self._remove_action_unlikely_intent_from_states(
-                tracker_states
+            (
+                tracker_states,
+                frozen_tracker_states,
+            ) = self._remove_action_unlikely_intent_from_training_states(
+                tracker_states, frozen_tracker_states
             )
             events = self._remove_action_unlikely_intent_from_events(events)
 
@@ -1055,10 +1187,13 @@ class IntentMaxHistoryTrackerFeaturizer(MaxHistoryTrackerFeaturizer):
                 sliced_states = self.slice_state_history(
                     tracker_states[:label_index], self.max_history
                 )
+                frozen_sliced_states = self.slice_state_history(
+                    frozen_tracker_states[:label_index], self.max_history
+                )
                 label = [event.intent_name or event.text]
                 entities = [{}]
 
-                yield sliced_states, label, entities
+                yield sliced_states, tuple(frozen_sliced_states), label, entities
 
     @staticmethod
     def _cleanup_last_user_state_with_action_listen(
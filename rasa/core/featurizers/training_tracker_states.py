@@ -0,0 +1,244 @@
+from __future__ import annotations
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Text
+
+from rasa.engine.graph import ExecutionContext, GraphComponent
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.shared.core.domain import Domain, State
+from rasa.shared.core.events import Event
+from rasa.shared.core.generator import TrackerWithCachedStates
+from rasa.shared.core.trackers import DialogueStateTracker, FrozenState
+import rasa.shared.utils.io
+
+logger = logging.getLogger(__name__)
+
+
+def unfreeze_states(frozen_states: List[FrozenState]) -> List[State]:
+    """Converts frozen states back to state dictionaries.
+
+    Args:
+        frozen_states: States in the form which is returned by
+            `DialogueStateTracker.freeze_current_state`.
+
+    Returns:
+        The states as dictionaries.
+    """
+    return [
+        {key: dict(sub_state) for key, sub_state in frozen_state}
+        for frozen_state in frozen_states
+    ]
+
+
+class TrainingTrackerStates:
+    """The states of the training trackers which all policies share.
+
+    Every policy transforms the training trackers into states to create its training
+    examples. The states don't depend on the policy, hence they are computed once and
+    shared by all policies. The states are kept in their frozen (hashable) form, so
+    that the featurizers can deduplicate training examples without freezing the
+    states of every example again.
+
+    The states are associated with the trackers they were created from by the position
+    of the trackers in the list of training trackers (see `bind`).
+    """
+
+    STATES_FILE_NAME = "states.json"
+
+    def __init__(
+        self, frozen_states: List[List[FrozenState]], event_counts: List[int]
+    ) -> None:
+        """Creates the container.
+
+        Args:
+            frozen_states: The frozen states of every training tracker.
+            event_counts: The number of events of every training tracker. They are
+                used to check that the states belong to the trackers they are bound to.
+        """
+        self._frozen_states = frozen_states
+        self._event_counts = event_counts
+        self._bound_trackers: Optional[List[DialogueStateTracker]] = None
+        self._tracker_indices: Dict[int, int] = {}
+        self._applied_events: Dict[int, List[Event]] = {}
+
+    @classmethod
+    def from_trackers(
+        cls, trackers: List[TrackerWithCachedStates], domain: Domain
+    ) -> TrainingTrackerStates:
+        """Creates the states of the given trackers.
+
+        Args:
+            trackers: The training trackers.
+            domain: The domain of the training trackers.
+
+        Returns:
+            The states of the trackers which are bound to the trackers.
+        """
+        training_tracker_states = cls(
+            [list(tracker.past_states_for_hashing(domain)) for tracker in trackers],
+            [len(tracker.events) for tracker in trackers],
+        )
+        training_tracker_states.bind(trackers)
+        return training_tracker_states
+
+    def __len__(self) -> int:
+        return len(self._frozen_states)
+
+    def bind(self, trackers: List[DialogueStateTracker]) -> None:
+        """Associates the states with the training trackers they were created from.
+
+        If the trackers don't match the states, the states aren't used and the
+        featurizers compute the states of the trackers themselves.
+
+        Args:
+            trackers: All training trackers in the order in which they were passed
+                to `from_trackers` (e.g. the trackers of a later training run if the
+                states were loaded from the cache).
+        """
+        if trackers is self._bound_trackers:
+            return
+
+        self._bound_trackers = trackers
+        self._applied_events = {}
+        if [len(tracker.events) for tracker in trackers] != self._event_counts:
+            logger.debug(
+                "The shared training tracker states don't match the training "
+                "trackers. The states of the trackers are created again."
+            )
+            self._tracker_indices = {}
+            return
+
+        self._tracker_indices = {
+            id(tracker): index for index, tracker in enumerate(trackers)
+        }
+
+    def frozen_states(
+        self, tracker: DialogueStateTracker
+    ) -> Optional[List[FrozenState]]:
+        """Returns the frozen states of a training tracker.
+
+        Args:
+            tracker: One of the bound training trackers.
+
+        Returns:
+            The frozen states or `None` if the states of the tracker aren't known.
+        """
+        index = self._tracker_indices.get(id(tracker))
+        if index is None:
+            return None
+        return self._frozen_states[index]
+
+    def states(self, tracker: DialogueStateTracker) -> Optional[List[State]]:
+        """Returns the states of a training tracker.
+
+        Args:
+            tracker: One of the bound training trackers.
+
+        Returns:
+            New state dictionaries (which can be modified by the caller) or `None` if
+            the states of the tracker aren't known.
+        """
+        frozen_states = self.frozen_states(tracker)
+        if frozen_states is None:
+            return None
+        return unfreeze_states(frozen_states)
+
+    def applied_events(self, tracker: DialogueStateTracker) -> List[Event]:
+        """Returns the applied events of a training tracker.
+
+        The applied events of the bound trackers are only determined once.
+
+        Args:
+            tracker: A training tracker.
+
+        Returns:
+            The events which were applied to the tracker. They must not be modified.
+        """
+        index = self._tracker_indices.get(id(tracker))
+        if index is None:
+            return tracker.applied_events()
+
+        events = self._applied_events.get(index)
+        if events is None:
+            events = tracker.applied_events()
+            self._applied_events[index] = events
+        return events
+
+    def _serialized_states(self) -> List[List[State]]:
+        return [
+            unfreeze_states(tracker_states) for tracker_states in self._frozen_states
+        ]
+
+    def fingerprint(self) -> Text:
+        """Returns the fingerprint of the states."""
+        return rasa.shared.utils.io.get_text_hash(
+            json.dumps([self._serialized_states(), self._event_counts], sort_keys=True)
+        )
+
+    def to_cache(self, directory: Path, model_storage: ModelStorage) -> None:
+        """Persists the states to the cache (see parent class for full docstring)."""
+        rasa.shared.utils.io.dump_obj_as_json_to_file(
+            directory / self.STATES_FILE_NAME,
+            {"states": self._serialized_states(), "event_counts": self._event_counts},
+        )
+
+    @classmethod
+    def from_cache(
+        cls,
+        node_name: Text,
+        directory: Path,
+        model_storage: ModelStorage,
+        output_fingerprint: Text,
+    ) -> TrainingTrackerStates:
+        """Loads the states from the cache (see parent class for full docstring)."""
+        serialized = rasa.shared.utils.io.read_json_file(
+            directory / cls.STATES_FILE_NAME
+        )
+        # json dumps tuples as lists, so we need to convert them back
+        frozen_states = [
+            [
+                DialogueStateTracker.freeze_current_state(
+                    {
+                        key: {
+                            name: tuple(value) if isinstance(value, list) else value
+                            for name, value in sub_state.items()
+                        }
+                        for key, sub_state in state.items()
+                    }
+                )
+                for state in tracker_states
+            ]
+            for tracker_states in serialized["states"]
+        ]
+        return cls(frozen_states, serialized["event_counts"])
+
+
+class TrainingTrackerStatesProvider(GraphComponent):
+    """Creates the states of the training trackers once for all policies."""
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict[Text, Any],
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+    ) -> TrainingTrackerStatesProvider:
+        """Creates a new instance (see parent class for full docstring)."""
+        return cls()
+
+    def provide(
+        self, training_trackers: List[TrackerWithCachedStates], domain: Domain
+    ) -> TrainingTrackerStates:
+        """Creates the states of the training trackers.
+
+        Args:
+            training_trackers: The trackers which the policies are trained on.
+            domain: The domain of the model.
+
+        Returns:
+            The states of the training trackers.
+        """
+        return TrainingTrackerStates.from_trackers(training_trackers, domain)
@@ -1,5 +1,3 @@
-import aiohttp
-
 import logging
 
 from typing import Text, Dict, Any, Optional
@@ -63,17 +61,18 @@ class RasaNLUHttpInterpreter:
 
         # noinspection PyBroadException
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=params) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    else:
-                        response_text = await resp.text()
-                        logger.error(
-                            f"Failed to parse text '{text}' using rasa NLU over "
-                            f"http. Error: {response_text}"
-                        )
-                        return None
+            async with self.endpoint_config.pooled_session().post(
+                url, json=params
+            ) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+                else:
+                    response_text = await resp.text()
+                    logger.error(
+                        f"Failed to parse text '{text}' using rasa NLU over "
+                        f"http. Error: {response_text}"
+                    )
+                    return None
         except Exception:  # skipcq: PYL-W0703
             # need to catch all possible exceptions when doing http requests
             # (timeouts, value errors, parser errors, ...)
@@ -1,17 +1,30 @@
 import asyncio
-import json
 import logging
 import os
+import time
+from collections import deque
 
 from async_generator import asynccontextmanager
-from typing import Text, Union, Optional, AsyncGenerator
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    List,
+    Optional,
+    Text,
+    TYPE_CHECKING,
+    Union,
+)
 
 from rasa.shared.exceptions import RasaException, ConnectionException
 import rasa.shared.utils.common
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
-from rasa.core.lock import TicketLock
+from rasa.core.lock import Ticket, TicketLock
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from redis.client import PubSubWorkerThread, Script
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +36,58 @@ LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
 DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX = "lock:"
+# the release of the lock of a conversation is published to the channel
+# `<key prefix>released:<conversation ID>`
+REDIS_LOCK_RELEASE_CHANNEL_INFIX = "released:"
+
+# The lock of a conversation is stored in two keys which share the hash tag
+# `{<conversation ID>}` so that they are stored on the same node of a Redis cluster:
+# - a sorted set of the numbers of the issued tickets scored by their expiry time
+# - the number of tickets which were issued for the conversation
+REDIS_LOCK_TICKETS_KEY_SUFFIX = ":tickets"
+REDIS_LOCK_TICKET_COUNTER_KEY_SUFFIX = ":ticket_counter"
+
+# KEYS: tickets, ticket counter
+# ARGV: current time, expiry time of the new ticket
+_REDIS_ISSUE_TICKET_SCRIPT = """
+redis.call("zremrangebyscore", KEYS[1], "-inf", "(" .. ARGV[1])
+local ticket_number = redis.call("incr", KEYS[2]) - 1
+redis.call("zadd", KEYS[1], ARGV[2], ticket_number)
+
+local latest_expiry = redis.call("zrange", KEYS[1], -1, -1, "WITHSCORES")[2]
+latest_expiry = math.ceil(tonumber(latest_expiry))
+redis.call("expireat", KEYS[1], latest_expiry)
+redis.call("expireat", KEYS[2], latest_expiry)
+
+return ticket_number
+"""
+
+# KEYS: tickets, ticket counter
+# returns `nil` if the lock doesn't exist, or the number of issued tickets and the
+# tickets with their expiry times
+_REDIS_GET_LOCK_SCRIPT = """
+local ticket_counter = redis.call("get", KEYS[2])
+if not ticket_counter then
+    return nil
+end
+
+return {ticket_counter, redis.call("zrange", KEYS[1], 0, -1, "WITHSCORES")}
+"""
+
+# KEYS: tickets, ticket counter
+# ARGV: number of the served ticket, current time, release channel,
+#       `1` if the lock should be deleted if no one is waiting for it
+_REDIS_FINISH_SERVING_SCRIPT = """
+redis.call("zrem", KEYS[1], ARGV[1])
+redis.call("zremrangebyscore", KEYS[1], "-inf", "(" .. ARGV[2])
+redis.call("publish", ARGV[3], "")
+
+if ARGV[4] == "1" and redis.call("zcard", KEYS[1]) == 0 then
+    return redis.call("del", KEYS[1], KEYS[2])
+end
+
+return 0
+"""
 
 
 # noinspection PyUnresolvedReferences
@@ -36,7 +101,48 @@ class LockError(RasaException):
     pass
 
 
+class LockReleases:
+    """Wakes up coroutines which wait for the release of a lock.
+
+    Waiting and notifying has to happen in the same event loop.
+    """
+
+    def __init__(self) -> None:
+        """Creates the notifications."""
+        self._releases: Dict[Text, asyncio.Event] = {}
+
+    async def wait(self, conversation_id: Text, timeout_in_seconds: float) -> None:
+        """Waits until a lock is released or `timeout_in_seconds` have passed.
+
+        Args:
+            conversation_id: ID of the conversation whose lock is waited for.
+            timeout_in_seconds: Maximum time to wait.
+        """
+        release = self._releases.get(conversation_id)
+        if release is None:
+            release = self._releases[conversation_id] = asyncio.Event()
+
+        try:
+            await asyncio.wait_for(release.wait(), timeout_in_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def notify(self, conversation_id: Text) -> None:
+        """Wakes up all coroutines which wait for the release of a lock.
+
+        Args:
+            conversation_id: ID of the conversation whose lock was released.
+        """
+        release = self._releases.pop(conversation_id, None)
+        if release is not None:
+            release.set()
+
+
 class LockStore:
+    def __init__(self) -> None:
+        """Creates a lock store."""
+        self._lock_releases = LockReleases()
+
     @staticmethod
     def create(obj: Union["LockStore", EndpointConfig, None]) -> "LockStore":
         """Factory to create a lock store."""
@@ -135,14 +241,39 @@ class LockStore:
                 f"Retrying in {wait_time_in_seconds} seconds ..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
+            # wait for the next release and update lock
+            await self._wait_for_lock_release(conversation_id, wait_time_in_seconds)
             self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, wait_time_in_seconds: float
+    ) -> None:
+        """Waits until a ticket for `conversation_id` might have been served.
+
+        Lock stores which notify waiters in `_notify_lock_release` return as soon
+        as the lock is released. Lock stores which don't notify waiters poll the lock
+        store every `wait_time_in_seconds` seconds. In either case, the lock is
+        checked again after `wait_time_in_seconds` seconds at the latest, so that
+        expired tickets are removed.
+
+        Args:
+            conversation_id: ID of the conversation whose lock is waited for.
+            wait_time_in_seconds: Maximum time to wait.
+        """
+        await asyncio.sleep(wait_time_in_seconds)
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Notifies waiters that a ticket for `conversation_id` was served.
+
+        Args:
+            conversation_id: ID of the conversation whose lock was released.
+        """
+        pass
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
 
@@ -182,6 +313,7 @@ class LockStore:
         if lock:
             lock.remove_ticket_for(ticket_number)
             self.save_lock(lock)
+            self._notify_lock_release(conversation_id)
 
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
         """Remove lock for `conversation_id` if no one is waiting."""
@@ -242,8 +374,30 @@ class RedisLockStore(LockStore):
             logger.debug(f"Setting non-default redis key prefix: '{key_prefix}'.")
             self._set_key_prefix(key_prefix)
 
+        self._release_listener: Optional["PubSubWorkerThread"] = None
+        self._release_listener_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._register_scripts()
+
         super().__init__()
 
+    def _register_scripts(self) -> None:
+        """Registers the Lua scripts which modify the locks atomically.
+
+        Every operation on a lock is a single script call, so that it takes a single
+        round trip to Redis and can't interleave with operations of other Rasa
+        instances.
+        """
+        self._issue_ticket_script: "Script" = self.red.register_script(
+            _REDIS_ISSUE_TICKET_SCRIPT
+        )
+        self._get_lock_script: "Script" = self.red.register_script(
+            _REDIS_GET_LOCK_SCRIPT
+        )
+        self._finish_serving_script: "Script" = self.red.register_script(
+            _REDIS_FINISH_SERVING_SCRIPT
+        )
+
     def _set_key_prefix(self, key_prefix: Text) -> None:
         if isinstance(key_prefix, str) and key_prefix.isalnum():
             self.key_prefix = key_prefix + ":" + DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
@@ -253,21 +407,165 @@ class RedisLockStore(LockStore):
                 f"Using default '{self.key_prefix}' instead."
             )
 
+    def _release_channel(self, conversation_id: Text) -> Text:
+        return f"{self.key_prefix}{REDIS_LOCK_RELEASE_CHANNEL_INFIX}{conversation_id}"
+
+    def _tickets_key(self, conversation_id: Text) -> Text:
+        return f"{self.key_prefix}{{{conversation_id}}}{REDIS_LOCK_TICKETS_KEY_SUFFIX}"
+
+    def _ticket_counter_key(self, conversation_id: Text) -> Text:
+        return (
+            f"{self.key_prefix}{{{conversation_id}}}"
+            f"{REDIS_LOCK_TICKET_COUNTER_KEY_SUFFIX}"
+        )
+
+    def _lock_keys(self, conversation_id: Text) -> List[Text]:
+        return [
+            self._tickets_key(conversation_id),
+            self._ticket_counter_key(conversation_id),
+        ]
+
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, wait_time_in_seconds: float
+    ) -> None:
+        """Waits for the release of a lock (see parent docstring for more details)."""
+        if not self._listen_to_lock_releases():
+            return await super()._wait_for_lock_release(
+                conversation_id, wait_time_in_seconds
+            )
+
+        await self._lock_releases.wait(conversation_id, wait_time_in_seconds)
+
+    def _listen_to_lock_releases(self) -> bool:
+        """Subscribes to the releases of locks which are published to Redis.
+
+        The messages are received in a background thread which wakes up the waiters
+        in the event loop which is running when subscribing.
+
+        Returns:
+            `True` if the lock store is subscribed to the releases of locks.
+        """
+        loop = asyncio.get_event_loop()
+        if self._release_listener is not None and self._release_listener.is_alive():
+            return self._release_listener_loop is loop
+
+        def on_release(message: Dict[Text, Any]) -> None:
+            channel = message["channel"].decode()
+            conversation_id = channel[len(self._release_channel("")) :]
+            try:
+                loop.call_soon_threadsafe(self._lock_releases.notify, conversation_id)
+            except RuntimeError:
+                # the event loop was closed
+                pass
+
+        import redis.exceptions
+
+        try:
+            pubsub = self.red.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(**{self._release_channel("*"): on_release})
+            self._release_listener = pubsub.run_in_thread(
+                sleep_time=DEFAULT_SOCKET_TIMEOUT_IN_SECONDS / 2, daemon=True
+            )
+            self._release_listener_loop = loop
+        except redis.exceptions.RedisError as e:
+            logger.debug(
+                f"Failed to subscribe to the releases of locks. Polling the locks "
+                f"instead. Error: {e}"
+            )
+            return False
+
+        return True
+
+    def issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
+    ) -> int:
+        """Issues a ticket (see parent docstring for more information).
+
+        Expired tickets are removed and the new ticket is issued in a single atomic
+        operation.
+        """
+        logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
+        now = time.time()
+        try:
+            return int(
+                self._issue_ticket_script(
+                    keys=self._lock_keys(conversation_id),
+                    args=[now, now + lock_lifetime],
+                )
+            )
+        except Exception as e:
+            raise LockError(f"Error while acquiring lock. Error:\n{e}")
+
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
         """Retrieves lock (see parent docstring for more information)."""
-        serialised_lock = self.red.get(self.key_prefix + conversation_id)
-        if serialised_lock:
-            return TicketLock.from_dict(json.loads(serialised_lock))
+        stored_lock = self._get_lock_script(keys=self._lock_keys(conversation_id))
+        if stored_lock is None:
+            return None
+
+        _, tickets_with_expiry = stored_lock
+        tickets = [
+            Ticket(int(number), float(expires))
+            for number, expires in zip(
+                tickets_with_expiry[::2], tickets_with_expiry[1::2]
+            )
+        ]
+        tickets.sort(key=lambda ticket: ticket.number)
+
+        return TicketLock(conversation_id, deque(tickets))
 
-        return None
+    def update_lock(self, conversation_id: Text) -> None:
+        """Removes expired tickets from the lock for `conversation_id`."""
+        self.red.zremrangebyscore(
+            self._tickets_key(conversation_id), "-inf", f"({time.time()}"
+        )
+
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        """Removes the served ticket and publishes the release of the lock.
+
+        The release is published to all Rasa instances using this Redis.
+        """
+        self._finish_serving(conversation_id, ticket_number, delete_unused_lock=False)
+
+    def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
+        """Finishes serving the ticket and deletes the lock if no one is waiting."""
+        deleted_keys = self._finish_serving(
+            conversation_id, ticket_number, delete_unused_lock=True
+        )
+        if deleted_keys:
+            self._log_deletion(conversation_id, deletion_successful=True)
+
+    def _finish_serving(
+        self, conversation_id: Text, ticket_number: int, delete_unused_lock: bool
+    ) -> int:
+        return self._finish_serving_script(
+            keys=self._lock_keys(conversation_id),
+            args=[
+                ticket_number,
+                time.time(),
+                self._release_channel(conversation_id),
+                int(delete_unused_lock),
+            ],
+        )
 
     def delete_lock(self, conversation_id: Text) -> None:
         """Deletes lock for conversation ID."""
-        deletion_successful = self.red.delete(self.key_prefix + conversation_id)
+        deletion_successful = self.red.delete(*self._lock_keys(conversation_id))
         self._log_deletion(conversation_id, deletion_successful)
 
     def save_lock(self, lock: TicketLock) -> None:
-        self.red.set(self.key_prefix + lock.conversation_id, lock.dumps())
+        """Replaces the stored lock for the conversation of `lock`."""
+        tickets_key, ticket_counter_key = self._lock_keys(lock.conversation_id)
+
+        pipeline = self.red.pipeline(transaction=True)
+        pipeline.delete(tickets_key)
+        if lock.tickets:
+            pipeline.zadd(
+                tickets_key,
+                {str(ticket.number): ticket.expires for ticket in lock.tickets},
+            )
+        # the next issued ticket follows the last ticket of `lock`
+        pipeline.set(ticket_counter_key, lock.last_issued + 1)
+        pipeline.execute()
 
 
 class InMemoryLockStore(LockStore):
@@ -289,6 +587,16 @@ class InMemoryLockStore(LockStore):
     def save_lock(self, lock: TicketLock) -> None:
         self.conversation_locks[lock.conversation_id] = lock
 
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, wait_time_in_seconds: float
+    ) -> None:
+        """Waits for the release of a lock (see parent docstring for more details)."""
+        await self._lock_releases.wait(conversation_id, wait_time_in_seconds)
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Wakes up the waiters for the released lock."""
+        self._lock_releases.notify(conversation_id)
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -20,6 +20,7 @@ from rasa.shared.core.events import ActionExecuted
 from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
 from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturizer
 from rasa.core.featurizers.tracker_featurizers import FEATURIZER_FILE
+from rasa.core.featurizers.training_tracker_states import TrainingTrackerStates
 from rasa.shared.exceptions import FileIOException
 from rasa.core.policies.policy import (
     PolicyPrediction,
@@ -165,8 +166,23 @@ class MemoizationPolicy(Policy):
         self,
         training_trackers: List[TrackerWithCachedStates],
         domain: Domain,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
         **kwargs: Any,
     ) -> Resource:
+        """Trains the policy on given training trackers.
+
+        Args:
+            training_trackers: The list of the trackers.
+            domain: The domain.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
+
+        Returns:
+            The resource which can be used to load the trained policy.
+        """
+        if training_tracker_states is not None:
+            training_tracker_states.bind(training_trackers)
+
         # only considers original trackers (no augmented ones)
         training_trackers = [
             t
@@ -180,7 +196,9 @@ class MemoizationPolicy(Policy):
         (
             trackers_as_states,
             trackers_as_actions,
-        ) = self.featurizer.training_states_and_labels(training_trackers, domain)
+        ) = self.featurizer.training_states_and_labels(
+            training_trackers, domain, training_tracker_states=training_tracker_states
+        )
         self.lookup = self._create_lookup_from_states(
             trackers_as_states, trackers_as_actions
         )
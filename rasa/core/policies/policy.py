@@ -27,6 +27,7 @@ from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
 from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturizer
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.core.featurizers.tracker_featurizers import FEATURIZER_FILE
+from rasa.core.featurizers.training_tracker_states import TrainingTrackerStates
 import rasa.utils.common
 import rasa.shared.utils.io
 from rasa.shared.exceptions import RasaException, FileIOException
@@ -211,6 +212,7 @@ class Policy(GraphComponent):
         domain: Domain,
         precomputations: Optional[MessageContainerForCoreFeaturization],
         bilou_tagging: bool = False,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
         **kwargs: Any,
     ) -> Tuple[
         List[List[Dict[Text, List[Features]]]],
@@ -228,6 +230,8 @@ class Policy(GraphComponent):
             domain: the :class:`rasa.shared.core.domain.Domain`
             precomputations: Contains precomputed features and attributes.
             bilou_tagging: indicates whether BILOU tagging should be used or not
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             - a dictionary of attribute (INTENT, TEXT, ACTION_NAME, ACTION_TEXT,
@@ -246,6 +250,7 @@ class Policy(GraphComponent):
             bilou_tagging=bilou_tagging,
             ignore_action_unlikely_intent=self.supported_data()
             == SupportedData.ML_DATA,
+            training_tracker_states=training_tracker_states,
         )
 
         max_training_samples = kwargs.get("max_training_samples")
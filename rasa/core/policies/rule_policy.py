@@ -1,7 +1,9 @@
 from __future__ import annotations
 import functools
+import itertools
 import logging
-from typing import Any, List, Dict, Text, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, List, Dict, Text, Optional, Set, Tuple, Iterable, Iterator
 
 from tqdm import tqdm
 import numpy as np
@@ -13,7 +15,7 @@ from rasa.engine.recipes.default_recipe import DefaultV1Recipe
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.constants import DOCS_URL_RULES
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import RasaException, FileIOException
 import rasa.shared.utils.io
 from rasa.shared.core.events import (
     LoopInterrupted,
@@ -21,6 +23,7 @@ from rasa.shared.core.events import (
     ActionExecuted,
 )
 from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
+from rasa.core.featurizers.training_tracker_states import TrainingTrackerStates
 from rasa.core.policies.memoization import MemoizationPolicy
 from rasa.core.policies.policy import SupportedData, PolicyPrediction
 from rasa.shared.core.trackers import (
@@ -51,11 +54,12 @@ from rasa.shared.core.constants import (
     LOOP_NAME,
     SLOTS,
     ACTIVE_LOOP,
+    USER,
     RULE_ONLY_SLOTS,
     RULE_ONLY_LOOPS,
 )
 from rasa.shared.core.domain import InvalidDomain, State, Domain
-from rasa.shared.nlu.constants import ACTION_NAME, INTENT_NAME_KEY
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT_NAME_KEY, INTENT
 import rasa.core.test
 import rasa.core.training.training
 
@@ -73,6 +77,8 @@ RULES = "rules"
 RULES_FOR_LOOP_UNHAPPY_PATH = "rules_for_loop_unhappy_path"
 RULES_NOT_IN_STORIES = "rules_not_in_stories"
 
+RULE_INDEX_FILE = "rule_index.json"
+
 LOOP_WAS_INTERRUPTED = "loop_was_interrupted"
 DO_NOT_PREDICT_LOOP_ACTION = "do_not_predict_loop_action"
 
@@ -95,6 +101,253 @@ class InvalidRule(RasaException):
         )
 
 
+# Signature of rule states which apply to conversation starts only.
+_CONVERSATION_START = "__conversation_start__"
+
+
+class RuleIndex:
+    """Finds the rules which are applicable to a conversation without scanning them.
+
+    The rules are stored in a trie of their reversed states, i.e. rules which end in
+    the same states share the nodes for these states. The children of each node are
+    grouped by the previous action, the intent and the active loop which their state
+    requires. Hence only the rule states which agree with the conversation on these
+    features have to be fully checked (e.g. for slots or entities) while walking
+    back through the conversation.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty index."""
+        self._root = _RuleIndexNode()
+        self._number_of_rules = 0
+
+    @classmethod
+    def from_rule_keys(cls, rule_keys: Iterable[Text]) -> RuleIndex:
+        """Creates an index for rules given as feature keys.
+
+        Args:
+            rule_keys: Feature keys of the rules as created by
+                `RulePolicy._create_feature_key`.
+
+        Returns:
+            The index containing all given rules.
+        """
+        index = cls()
+        for rule_key in rule_keys:
+            index.add(rule_key, RulePolicy._rule_key_to_state(rule_key))
+        return index
+
+    def __len__(self) -> int:
+        """Returns the number of indexed rules."""
+        return self._number_of_rules
+
+    def add(self, rule_key: Text, rule_states: List[State]) -> None:
+        """Adds a rule to the index.
+
+        Args:
+            rule_key: The feature key of the rule.
+            rule_states: The states of the rule.
+        """
+        node = self._root
+        for rule_state in reversed(rule_states):
+            node = node.child_for(rule_state)
+
+        if node.rule_key is None:
+            self._number_of_rules += 1
+        node.rule_key = rule_key
+
+    def remove(self, rule_key: Text) -> None:
+        """Removes a rule from the index.
+
+        Nodes which are no longer needed by any other rule are removed as well.
+
+        Args:
+            rule_key: The feature key of the rule.
+        """
+        path = [self._root]
+        for rule_state in reversed(RulePolicy._rule_key_to_state(rule_key)):
+            child = path[-1].existing_child_for(rule_state)
+            if child is None:
+                return
+            path.append(child)
+
+        if path[-1].rule_key is None:
+            return
+        path[-1].rule_key = None
+        self._number_of_rules -= 1
+
+        for parent, child in reversed(list(zip(path, path[1:]))):
+            if child.rule_key is not None or child.children:
+                break
+            parent.remove_child(child)
+
+    def applicable_rules(self, states: List[State]) -> Iterator[Text]:
+        """Finds the rules which are applicable to the given conversation states.
+
+        This returns the same rules as checking every rule with
+        `RulePolicy._is_rule_applicable` for every conversation turn.
+
+        Args:
+            states: The states of the conversation.
+
+        Returns:
+            The keys of the applicable rules.
+        """
+        reversed_states = list(reversed(states))
+        nodes_to_visit = [(self._root, 0)]
+
+        while nodes_to_visit:
+            node, turn_index = nodes_to_visit.pop()
+            if node.rule_key is not None:
+                yield node.rule_key
+
+            if turn_index >= len(reversed_states):
+                # rules which are longer than the conversation are applicable if
+                # they match all turns of the conversation
+                yield from node.rule_keys_of_descendants()
+                continue
+
+            conversation_state = reversed_states[turn_index]
+            for child in node.matching_children(conversation_state):
+                nodes_to_visit.append((child, turn_index + 1))
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns a serializable representation of the index."""
+        return self._root.as_dict()
+
+    @classmethod
+    def from_dict(cls, data: Dict[Text, Any]) -> RuleIndex:
+        """Restores an index from its serialized representation.
+
+        Args:
+            data: The output of `as_dict`.
+
+        Returns:
+            The restored index.
+        """
+        index = cls()
+        index._root = _RuleIndexNode.from_dict(data)
+        index._number_of_rules = sum(1 for _ in index._root.rule_keys_of_descendants())
+        return index
+
+
+class _RuleIndexNode:
+    """Node of a `RuleIndex` which represents one state of one or more rules."""
+
+    def __init__(self, state: Optional[State] = None) -> None:
+        self.state = state
+        # key of the rule which ends with this state (rules are stored reversed)
+        self.rule_key: Optional[Text] = None
+        # children grouped by signature and then by the json dump of their state
+        self.children: Dict[Tuple, Dict[Text, _RuleIndexNode]] = {}
+
+    @staticmethod
+    def _signature_value(value: Any) -> Any:
+        if value == SHOULD_NOT_BE_SET:
+            return SHOULD_NOT_BE_SET
+        # a missing or empty value doesn't restrict the conversation
+        return value or None
+
+    @classmethod
+    def _signature(cls, rule_state: State) -> Tuple:
+        if not rule_state.get(PREVIOUS_ACTION):
+            return _CONVERSATION_START, None, None
+
+        return (
+            cls._signature_value(rule_state[PREVIOUS_ACTION].get(ACTION_NAME)),
+            cls._signature_value(rule_state.get(USER, {}).get(INTENT)),
+            cls._signature_value(rule_state.get(ACTIVE_LOOP, {}).get(LOOP_NAME)),
+        )
+
+    @staticmethod
+    def _matching_signature_values(value: Any) -> Tuple[Any, Any]:
+        if value and value != SHOULD_NOT_BE_SET:
+            # the rule can require exactly this value or not restrict it at all
+            return value, None
+        # the rule can require that the value is not set or not restrict it at all
+        return SHOULD_NOT_BE_SET, None
+
+    @classmethod
+    def _matching_signatures(cls, conversation_state: State) -> Iterator[Tuple]:
+        if not conversation_state.get(PREVIOUS_ACTION):
+            return iter([(_CONVERSATION_START, None, None)])
+
+        return itertools.product(
+            cls._matching_signature_values(
+                conversation_state[PREVIOUS_ACTION].get(ACTION_NAME)
+            ),
+            cls._matching_signature_values(
+                conversation_state.get(USER, {}).get(INTENT)
+            ),
+            cls._matching_signature_values(
+                conversation_state.get(ACTIVE_LOOP, {}).get(LOOP_NAME)
+            ),
+        )
+
+    def child_for(self, rule_state: State) -> _RuleIndexNode:
+        """Returns the child for `rule_state` and creates it if necessary."""
+        children = self.children.setdefault(self._signature(rule_state), {})
+        state_key = json.dumps(rule_state, sort_keys=True)
+        if state_key not in children:
+            children[state_key] = _RuleIndexNode(rule_state)
+        return children[state_key]
+
+    def existing_child_for(self, rule_state: State) -> Optional[_RuleIndexNode]:
+        """Returns the child for `rule_state` if there is one."""
+        return self.children.get(self._signature(rule_state), {}).get(
+            json.dumps(rule_state, sort_keys=True)
+        )
+
+    def remove_child(self, child: _RuleIndexNode) -> None:
+        """Removes the given child of this node."""
+        signature = self._signature(child.state)
+        children = self.children[signature]
+        del children[json.dumps(child.state, sort_keys=True)]
+        if not children:
+            del self.children[signature]
+
+    def matching_children(self, conversation_state: State) -> Iterator[_RuleIndexNode]:
+        """Returns the children whose state matches the state of the conversation."""
+        for signature in self._matching_signatures(conversation_state):
+            for child in self.children.get(signature, {}).values():
+                if RulePolicy._does_rule_state_match_turn(
+                    child.state, conversation_state
+                ):
+                    yield child
+
+    def rule_keys_of_descendants(self) -> Iterator[Text]:
+        """Returns the keys of all rules which continue after this node."""
+        for children in self.children.values():
+            for child in children.values():
+                if child.rule_key is not None:
+                    yield child.rule_key
+                yield from child.rule_keys_of_descendants()
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns a serializable representation of the node and its children."""
+        return {
+            "state": self.state,
+            "rule_key": self.rule_key,
+            "children": [
+                child.as_dict()
+                for children in self.children.values()
+                for child in children.values()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[Text, Any]) -> _RuleIndexNode:
+        """Restores a node and its children from its serialized representation."""
+        node = cls(data["state"])
+        node.rule_key = data["rule_key"]
+        for child_data in data["children"]:
+            child = cls.from_dict(child_data)
+            node.children.setdefault(cls._signature(child.state), {})[
+                json.dumps(child.state, sort_keys=True)
+            ] = child
+        return node
+
+
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.POLICY_WITHOUT_END_TO_END_SUPPORT, is_trainable=True
 )
@@ -164,6 +417,8 @@ class RulePolicy(MemoizationPolicy):
         self._check_for_contradictions = config["check_for_contradictions"]
 
         self._rules_sources = defaultdict(list)
+        # compiled indices for the rule lookups together with the indexed lookup
+        self._rule_indices: Dict[Text, Tuple[Dict[Text, Text], RuleIndex]] = {}
 
     @classmethod
     def raise_if_incompatible_with_domain(
@@ -572,7 +827,7 @@ class RulePolicy(MemoizationPolicy):
             return []
 
         if self._should_delete(prediction_source, tracker, predicted_action_name):
-            self.lookup[RULES].pop(prediction_source)
+            self._remove_rule(RULES, prediction_source)
             return []
 
         tracker_type = "rule" if tracker.is_rule_tracker else "story"
@@ -734,6 +989,7 @@ class RulePolicy(MemoizationPolicy):
         rule_trackers: List[TrackerWithCachedStates],
         story_trackers: List[TrackerWithCachedStates],
         domain: Domain,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> None:
         (
             rule_trackers_as_states,
@@ -750,7 +1006,9 @@ class RulePolicy(MemoizationPolicy):
         (
             story_trackers_as_states,
             story_trackers_as_actions,
-        ) = self.featurizer.training_states_and_labels(story_trackers, domain)
+        ) = self.featurizer.training_states_and_labels(
+            story_trackers, domain, training_tracker_states=training_tracker_states
+        )
 
         if self._check_for_contradictions:
             (
@@ -775,6 +1033,7 @@ class RulePolicy(MemoizationPolicy):
         self,
         training_trackers: List[TrackerWithCachedStates],
         domain: Domain,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
         **kwargs: Any,
     ) -> Resource:
         """Trains the policy on given training trackers.
@@ -782,11 +1041,15 @@ class RulePolicy(MemoizationPolicy):
         Args:
             training_trackers: The list of the trackers.
             domain: The domain.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
 
         Returns:
             The resource which can be used to load the trained policy.
         """
         self.raise_if_incompatible_with_domain(self.config, domain)
+        if training_tracker_states is not None:
+            training_tracker_states.bind(training_trackers)
 
         # only consider original trackers (no augmented ones)
         training_trackers = [
@@ -802,7 +1065,12 @@ class RulePolicy(MemoizationPolicy):
         # trackers from ML-based training data
         story_trackers = [t for t in training_trackers if not t.is_rule_tracker]
 
-        self._create_lookup_from_trackers(rule_trackers, story_trackers, domain)
+        self._create_lookup_from_trackers(
+            rule_trackers,
+            story_trackers,
+            domain,
+            training_tracker_states=training_tracker_states,
+        )
 
         # make this configurable because checking might take a lot of time
         if self._check_for_contradictions:
@@ -875,10 +1143,18 @@ class RulePolicy(MemoizationPolicy):
         if turn_index >= len(reversed_rule_states):
             return True
 
+        return self._does_rule_state_match_turn(
+            reversed_rule_states[turn_index], conversation_state
+        )
+
+    @classmethod
+    def _does_rule_state_match_turn(
+        cls, rule_state: State, conversation_state: State
+    ) -> bool:
         # a state has previous action if and only if it is not a conversation start
         # state
         current_previous_action = conversation_state.get(PREVIOUS_ACTION)
-        rule_previous_action = reversed_rule_states[turn_index].get(PREVIOUS_ACTION)
+        rule_previous_action = rule_state.get(PREVIOUS_ACTION)
 
         # current conversation state and rule state are conversation starters.
         # any slots with initial_value set will necessarily be in both states and don't
@@ -895,22 +1171,41 @@ class RulePolicy(MemoizationPolicy):
             return False
 
         # check: current rule state features are present in current conversation state
-        return self._does_rule_match_state(
-            reversed_rule_states[turn_index], conversation_state
-        )
+        return cls._does_rule_match_state(rule_state, conversation_state)
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
-        for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
-                )
-            )
-        return possible_keys
+    def _rule_index(self, lookup_name: Text) -> RuleIndex:
+        """Returns the index for the rules in `self.lookup[lookup_name]`.
+
+        The index is rebuilt if the rules changed since it was built (e.g. because
+        contradicting rules were removed during training).
+        """
+        lookup = self.lookup.get(lookup_name, {})
+        indexed_lookup, index = self._rule_indices.get(lookup_name, (None, None))
+        if indexed_lookup is not lookup or len(index) != len(lookup):
+            index = RuleIndex.from_rule_keys(lookup.keys())
+            self._rule_indices[lookup_name] = (lookup, index)
+
+        return index
+
+    def _remove_rule(self, lookup_name: Text, rule_key: Text) -> None:
+        """Removes a rule from `self.lookup[lookup_name]` and its index.
+
+        The rule is removed from an already built index instead of rebuilding the
+        index for every removed rule.
+        """
+        lookup = self.lookup[lookup_name]
+        lookup.pop(rule_key)
+        indexed_lookup, index = self._rule_indices.get(lookup_name, (None, None))
+        if indexed_lookup is lookup:
+            index.remove(rule_key)
+
+    def _get_possible_keys(self, lookup_name: Text, states: List[State]) -> Set[Text]:
+        lookup = self.lookup.get(lookup_name, {})
+        return {
+            rule_key
+            for rule_key in self._rule_index(lookup_name).applicable_rules(states)
+            if rule_key in lookup
+        }
 
     @staticmethod
     def _find_action_from_default_actions(
@@ -1019,7 +1314,7 @@ class RulePolicy(MemoizationPolicy):
         # to skip the validation of slots for its first execution after an unhappy path.
         returning_from_unhappy_path = False
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_keys = self._get_possible_keys(RULES, states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -1033,7 +1328,7 @@ class RulePolicy(MemoizationPolicy):
         if active_loop_name:
             # find rules for unhappy path of the loop
             loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
+                RULES_FOR_LOOP_UNHAPPY_PATH, states
             )
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
@@ -1234,6 +1529,47 @@ class RulePolicy(MemoizationPolicy):
             rasa.shared.utils.io.dump_obj_as_json_to_file(
                 directory / "rule_only_data.json", rule_only_data
             )
+            rasa.shared.utils.io.dump_obj_as_json_to_file(
+                directory / RULE_INDEX_FILE,
+                {
+                    lookup_name: self._rule_index(lookup_name).as_dict()
+                    for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]
+                },
+            )
+
+    @classmethod
+    def load(
+        cls,
+        config: Dict[Text, Any],
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+        **kwargs: Any,
+    ) -> RulePolicy:
+        """Loads a trained policy (see parent class for full docstring)."""
+        policy = super().load(
+            config, model_storage, resource, execution_context, **kwargs
+        )
+
+        try:
+            with model_storage.read_from(resource) as path:
+                index_file = Path(path) / RULE_INDEX_FILE
+                # models trained with older versions don't contain an index. It's
+                # then built when it's used for the first time.
+                if index_file.is_file():
+                    indices = rasa.shared.utils.io.read_json_file(index_file)
+                    for lookup_name, index in indices.items():
+                        policy._rule_indices[lookup_name] = (
+                            policy.lookup.get(lookup_name, {}),
+                            RuleIndex.from_dict(index),
+                        )
+        except (ValueError, FileNotFoundError, FileIOException):
+            logger.warning(
+                f"Couldn't load the rule index for policy '{cls.__name__}'. The "
+                f"index will be rebuilt."
+            )
+
+        return policy
 
     def _metadata(self) -> Dict[Text, Any]:
         return {
@@ -19,6 +19,7 @@ import rasa.core.actions.action
 from rasa.core.featurizers.precomputation import MessageContainerForCoreFeaturization
 from rasa.core.featurizers.tracker_featurizers import TrackerFeaturizer
 from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturizer
+from rasa.core.featurizers.training_tracker_states import TrainingTrackerStates
 from rasa.shared.exceptions import RasaException
 from rasa.shared.nlu.constants import (
     ACTION_TEXT,
@@ -585,6 +586,7 @@ class TEDPolicy(Policy):
         trackers: List[TrackerWithCachedStates],
         domain: Domain,
         precomputations: MessageContainerForCoreFeaturization,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
         **kwargs: Any,
     ) -> Tuple[RasaModelData, np.ndarray]:
         """Prepares data to be fed into the model.
@@ -593,6 +595,8 @@ class TEDPolicy(Policy):
             trackers: List of training trackers to be featurized.
             domain: Domain of the assistant.
             precomputations: Contains precomputed features and attributes.
+            training_tracker_states: The states of the training trackers which were
+                shared by all policies.
             **kwargs: Any other arguments.
 
         Returns:
@@ -605,6 +609,7 @@ class TEDPolicy(Policy):
             domain,
             precomputations=precomputations,
             bilou_tagging=self.config[BILOU_FLAG],
+            training_tracker_states=training_tracker_states,
             **kwargs,
         )
 
@@ -685,6 +690,7 @@ class TEDPolicy(Policy):
         training_trackers: List[TrackerWithCachedStates],
         domain: Domain,
         precomputations: Optional[MessageContainerForCoreFeaturization] = None,
+        training_tracker_states: Optional[TrainingTrackerStates] = None,
     ) -> Resource:
         """Trains the policy (see parent class for full docstring)."""
         if not training_trackers:
@@ -697,12 +703,18 @@ class TEDPolicy(Policy):
             )
             return self._resource
 
+        if training_tracker_states is not None:
+            training_tracker_states.bind(training_trackers)
+
         training_trackers = SupportedData.trackers_for_supported_data(
             self.supported_data(), training_trackers
         )
 
         model_data, label_ids = self._prepare_for_training(
-            training_trackers, domain, precomputations,
+            training_trackers,
+            domain,
+            precomputations,
+            training_tracker_states=training_tracker_states,
         )
 
         if model_data.is_empty():
@@ -11,6 +11,7 @@ from rasa.core.http_interpreter import RasaNLUHttpInterpreter
 from rasa.engine import loader
 from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
 from rasa.engine.runner.dask import DaskGraphRunner
+from rasa.engine.runner.executor import GraphRunExecutor
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.storage import ModelMetadata
 from rasa.model import get_latest_model
@@ -85,6 +86,7 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         on_circuit_break: Optional[LambdaType] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        graph_executor: Optional[GraphRunExecutor] = None,
     ) -> None:
         """Initializes a `MessageProcessor`."""
         self.nlg = generator
@@ -99,6 +101,7 @@ class MessageProcessor:
         self.model_path = Path(model_path)
         self.domain = self.model_metadata.domain
         self.http_interpreter = http_interpreter
+        self.graph_executor = GraphRunExecutor.create(graph_executor)
 
     @staticmethod
     def _load_model(
@@ -136,7 +139,7 @@ class MessageProcessor:
         tracker = await self.log_message(message, should_save_tracker=False)
 
         if self.model_metadata.training_type == TrainingType.NLU:
-            self.save_tracker(tracker)
+            await self.save_tracker(tracker)
             rasa.shared.utils.io.raise_warning(
                 "No core model. Skipping action prediction and execution.",
                 docs=DOCS_URL_POLICIES,
@@ -147,7 +150,7 @@ class MessageProcessor:
 
         await self._run_prediction_loop(message.output_channel, tracker)
 
-        self.save_tracker(tracker)
+        await self.save_tracker(tracker)
 
         if isinstance(message.output_channel, CollectingOutputChannel):
             return message.output_channel.messages
@@ -193,14 +196,14 @@ class MessageProcessor:
             The prediction for the next action. `None` if no domain or policies loaded.
         """
         tracker = await self.fetch_tracker_and_update_session(sender_id)
-        result = self.predict_next_with_tracker(tracker)
+        result = await self.predict_next_with_tracker(tracker)
 
         # save tracker state to continue conversation from this state
-        self.save_tracker(tracker)
+        await self.save_tracker(tracker)
 
         return result
 
-    def predict_next_with_tracker(
+    async def predict_next_with_tracker(
         self,
         tracker: DialogueStateTracker,
         verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
@@ -221,7 +224,7 @@ class MessageProcessor:
             )
             return None
 
-        prediction = self._predict_next_with_tracker(tracker)
+        prediction = await self._predict_next_with_tracker(tracker)
 
         scores = [
             {"action": a, "score": p}
@@ -292,7 +295,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker(sender_id)
 
         await self._update_tracker_session(tracker, output_channel, metadata)
 
@@ -315,7 +318,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker(sender_id)
 
         # run session start only if the tracker is empty
         if not tracker.events:
@@ -323,7 +326,7 @@ class MessageProcessor:
 
         return tracker
 
-    def get_tracker(self, conversation_id: Text) -> DialogueStateTracker:
+    async def get_tracker(self, conversation_id: Text) -> DialogueStateTracker:
         """Get the tracker for a conversation.
 
         In contrast to `fetch_tracker_and_update_session` this does not add any
@@ -340,13 +343,13 @@ class MessageProcessor:
         """
         conversation_id = conversation_id or DEFAULT_SENDER_ID
 
-        tracker = self.tracker_store.get_or_create_tracker(
+        tracker = await self.tracker_store.get_or_create_tracker_async(
             conversation_id, append_action_listen=False
         )
         tracker.model_id = self.model_metadata.model_id
         return tracker
 
-    def get_trackers_for_all_conversation_sessions(
+    async def get_trackers_for_all_conversation_sessions(
         self, conversation_id: Text
     ) -> List[DialogueStateTracker]:
         """Fetches all trackers for a conversation.
@@ -363,7 +366,7 @@ class MessageProcessor:
         """
         conversation_id = conversation_id or DEFAULT_SENDER_ID
 
-        tracker = self.tracker_store.retrieve_full_tracker(conversation_id)
+        tracker = await self.tracker_store.retrieve_full_tracker_async(conversation_id)
 
         return rasa.shared.core.trackers.get_trackers_for_conversation_sessions(tracker)
 
@@ -383,7 +386,7 @@ class MessageProcessor:
         await self._handle_message_with_tracker(message, tracker)
 
         if should_save_tracker:
-            self.save_tracker(tracker)
+            await self.save_tracker(tracker)
 
         return tracker
 
@@ -419,11 +422,11 @@ class MessageProcessor:
         await self._run_action(action, tracker, output_channel, nlg, prediction)
 
         # save tracker state to continue conversation from this state
-        self.save_tracker(tracker)
+        await self.save_tracker(tracker)
 
         return tracker
 
-    def predict_next_with_tracker_if_should(
+    async def predict_next_with_tracker_if_should(
         self, tracker: DialogueStateTracker
     ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
         """Predicts the next action the bot should take after seeing x.
@@ -446,7 +449,7 @@ class MessageProcessor:
                 "The limit of actions to predict has been reached."
             )
 
-        prediction = self._predict_next_with_tracker(tracker)
+        prediction = await self._predict_next_with_tracker(tracker)
 
         action = rasa.core.actions.action.action_for_index(
             prediction.max_confidence_index, self.domain, self.action_endpoint
@@ -564,7 +567,7 @@ class MessageProcessor:
 
         await self._run_prediction_loop(output_channel, tracker)
         # save tracker state to continue conversation from this state
-        self.save_tracker(tracker)
+        await self.save_tracker(tracker)
 
     @staticmethod
     def _log_slots(tracker: DialogueStateTracker) -> None:
@@ -632,7 +635,9 @@ class MessageProcessor:
         if self.http_interpreter:
             parse_data = await self.http_interpreter.parse(message)
         else:
-            parse_data = self._parse_message_with_graph(message, only_output_properties)
+            parse_data = await self._parse_message_with_graph(
+                message, only_output_properties
+            )
 
         logger.debug(
             "Received user message '{}' with intent '{}' "
@@ -645,7 +650,7 @@ class MessageProcessor:
 
         return parse_data
 
-    def _parse_message_with_graph(
+    async def _parse_message_with_graph(
         self, message: UserMessage, only_output_properties: bool = True
     ) -> Dict[Text, Any]:
         """Interprets the passed message.
@@ -656,12 +661,14 @@ class MessageProcessor:
         Returns:
             Parsed data extracted from the message.
         """
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_MESSAGE: [message]},
-            targets=[self.model_metadata.nlu_target],
+        # concurrently parsed messages are run through the graph together if batching
+        # is enabled for the graph runner
+        parsed_message = await self.graph_executor.run_batched(
+            self.graph_runner,
+            PLACEHOLDER_MESSAGE,
+            message,
+            self.model_metadata.nlu_target,
         )
-        parsed_messages = results[self.model_metadata.nlu_target]
-        parsed_message = parsed_messages[0]
         parse_data = {
             TEXT: "",
             INTENT: {INTENT_NAME_KEY: None, PREDICTED_CONFIDENCE_KEY: 0.0},
@@ -747,7 +754,9 @@ class MessageProcessor:
         while should_predict_another_action and self._should_handle_message(tracker):
             # this actually just calls the policy's method by the same name
             try:
-                action, prediction = self.predict_next_with_tracker_if_should(tracker)
+                action, prediction = await self.predict_next_with_tracker_if_should(
+                    tracker
+                )
             except ActionLimitReached:
                 logger.warning(
                     "Circuit breaker tripped. Stopped predicting "
@@ -956,15 +965,15 @@ class MessageProcessor:
 
         return has_expired
 
-    def save_tracker(self, tracker: DialogueStateTracker) -> None:
+    async def save_tracker(self, tracker: DialogueStateTracker) -> None:
         """Save the given tracker to the tracker store.
 
         Args:
             tracker: Tracker to be saved.
         """
-        self.tracker_store.save(tracker)
+        await self.tracker_store.save_async(tracker)
 
-    def _predict_next_with_tracker(
+    async def _predict_next_with_tracker(
         self, tracker: DialogueStateTracker
     ) -> PolicyPrediction:
         """Collect predictions from ensemble and return action and predictions."""
@@ -987,8 +996,8 @@ class MessageProcessor:
         if not target:
             raise ValueError("Cannot predict next action if there is no core target.")
 
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target],
+        results = await self.graph_executor.run(
+            self.graph_runner, inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target],
         )
         policy_prediction = results[target]
         return policy_prediction
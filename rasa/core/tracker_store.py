@@ -1,9 +1,13 @@
+import asyncio
 import contextlib
+import functools
 import itertools
-import json
 import logging
 import os
+import re
+import threading
 
+from collections import OrderedDict
 from time import sleep
 from typing import (
     Any,
@@ -14,6 +18,7 @@ from typing import (
     List,
     Optional,
     Text,
+    Tuple,
     Union,
     TYPE_CHECKING,
     Generator,
@@ -34,8 +39,9 @@ from rasa.core.constants import (
     POSTGRESQL_POOL_SIZE,
 )
 from rasa.shared.core.conversation import Dialogue
+from rasa.shared.core import event_codec
 from rasa.shared.core.domain import Domain
-from rasa.shared.core.events import SessionStarted
+from rasa.shared.core.events import Event, SessionStarted
 from rasa.shared.core.trackers import (
     ActionExecuted,
     DialogueStateTracker,
@@ -48,10 +54,14 @@ import sqlalchemy as sa
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Row
+    from sqlalchemy.sql import Select
+    from sqlalchemy.sql.elements import ColumnElement
     import boto3.resources.factory.dynamodb.Table
+    import redis.client
     from sqlalchemy.engine.url import URL
     from sqlalchemy.engine.base import Engine
-    from sqlalchemy.orm import Session, Query
+    from sqlalchemy.orm import Session
     from sqlalchemy import Sequence
 
 logger = logging.getLogger(__name__)
@@ -60,8 +70,34 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# number of conversations for which `SQLTrackerStore` caches the start of their
+# latest conversation session
+SQL_SESSION_START_CACHE_SIZE = 10_000
+
+# maximum number of events which `MongoTrackerStore` stores in a single document
+MONGO_MAX_EVENTS_PER_BUCKET = 1000
+# counters of the events which `MongoTrackerStore` stores for each conversation
+MONGO_CURRENT_BUCKET_KEY = "current_bucket"
+MONGO_CURRENT_BUCKET_SIZE_KEY = "current_bucket_size"
+MONGO_SESSION_BUCKET_KEY = "session_bucket"
+MONGO_SESSION_EVENTS_KEY = "number_of_session_events"
+MONGO_INITIAL_COUNTERS = {
+    MONGO_CURRENT_BUCKET_KEY: 0,
+    MONGO_CURRENT_BUCKET_SIZE_KEY: 0,
+    MONGO_SESSION_BUCKET_KEY: 0,
+    MONGO_SESSION_EVENTS_KEY: 0,
+}
+
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
+# suffixes of the keys in which RedisTrackerStore stores a conversation
+REDIS_EVENTS_KEY_SUFFIX = "events"
+REDIS_SESSION_EVENTS_KEY_SUFFIX = "session"
+REDIS_CONVERSATION_KEY_PATTERN = re.compile(
+    rf"\{{(?P<sender_id>.*)\}}:(?P<suffix>{REDIS_EVENTS_KEY_SUFFIX}|"
+    rf"{REDIS_SESSION_EVENTS_KEY_SUFFIX})",
+    re.DOTALL,
+)
 
 
 class TrackerDeserialisationException(RasaException):
@@ -69,7 +105,14 @@ class TrackerDeserialisationException(RasaException):
 
 
 class TrackerStore:
-    """Represents common behavior and interface for all `TrackerStore`s."""
+    """Represents common behavior and interface for all `TrackerStore`s.
+
+    Every method which accesses the stored trackers has an `async` counterpart (e.g.
+    `retrieve_async` for `retrieve`) which is used while handling messages, so that
+    waiting for the database doesn't block the event loop. By default these run the
+    blocking methods in a worker thread of the event loop's default executor. Tracker
+    stores whose database has an `asyncio` client can override them.
+    """
 
     def __init__(
         self,
@@ -220,10 +263,16 @@ class TrackerStore:
 
     def stream_events(self, tracker: DialogueStateTracker) -> None:
         """Streams events to a message broker"""
-        offset = self.number_of_existing_events(tracker.sender_id)
-        events = tracker.events
-        for event in list(itertools.islice(events, offset, len(events))):
-            body = {"sender_id": tracker.sender_id}
+        events = tracker.events_since_persisted_events()
+        if events is None:
+            offset = self.number_of_existing_events(tracker.sender_id)
+            events = list(itertools.islice(tracker.events, offset, len(tracker.events)))
+
+        self._publish_events(tracker.sender_id, events)
+
+    def _publish_events(self, sender_id: Text, events: Iterable[Event]) -> None:
+        for event in events:
+            body = {"sender_id": sender_id}
             body.update(event.as_dict())
             self.event_broker.publish(body)
 
@@ -237,12 +286,95 @@ class TrackerStore:
         """Returns the set of values for the tracker store's primary key"""
         raise NotImplementedError()
 
+    async def _run_blocking(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Runs a blocking method of the tracker store in a worker thread."""
+        return await asyncio.get_event_loop().run_in_executor(
+            None, functools.partial(function, *args, **kwargs)
+        )
+
+    async def get_or_create_tracker_async(
+        self,
+        sender_id: Text,
+        max_event_history: Optional[int] = None,
+        append_action_listen: bool = True,
+    ) -> DialogueStateTracker:
+        """Returns tracker or creates one if the retrieval returns None.
+
+        See `get_or_create_tracker` for the arguments.
+        """
+        self.max_event_history = max_event_history
+
+        tracker = await self.retrieve_async(sender_id)
+
+        if tracker is None:
+            tracker = await self.create_tracker_async(
+                sender_id, append_action_listen=append_action_listen
+            )
+
+        return tracker
+
+    async def create_tracker_async(
+        self, sender_id: Text, append_action_listen: bool = True
+    ) -> DialogueStateTracker:
+        """Creates a new tracker for `sender_id`.
+
+        See `create_tracker` for the arguments.
+        """
+        tracker = self.init_tracker(sender_id)
+
+        if append_action_listen:
+            tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+        await self.save_async(tracker)
+
+        return tracker
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker without blocking the event loop (see `save`)."""
+        await self._run_blocking(self.save, tracker)
+
+    async def exists_async(self, conversation_id: Text) -> bool:
+        """Checks if tracker exists without blocking the event loop (see `exists`)."""
+        return await self._run_blocking(self.exists, conversation_id)
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker without blocking the event loop (see `retrieve`)."""
+        return await self._run_blocking(self.retrieve, sender_id)
+
+    async def retrieve_full_tracker_async(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Retrieves the full tracker without blocking the event loop.
+
+        See `retrieve_full_tracker` for the arguments.
+        """
+        return await self._run_blocking(self.retrieve_full_tracker, conversation_id)
+
+    async def keys_async(self) -> Iterable[Text]:
+        """Returns the keys without blocking the event loop (see `keys`)."""
+        return await self._run_blocking(self.keys)
+
+    async def stream_events_async(self, tracker: DialogueStateTracker) -> None:
+        """Streams events to a message broker without blocking the event loop."""
+        events = tracker.events_since_persisted_events()
+        if events is None:
+            offset = await self.number_of_existing_events_async(tracker.sender_id)
+            events = list(itertools.islice(tracker.events, offset, len(tracker.events)))
+
+        self._publish_events(tracker.sender_id, events)
+
+    async def number_of_existing_events_async(self, sender_id: Text) -> int:
+        """Return number of stored events without blocking the event loop."""
+        return await self._run_blocking(self.number_of_existing_events, sender_id)
+
     @staticmethod
     def serialise_tracker(tracker: DialogueStateTracker) -> Text:
         """Serializes the tracker, returns representation of the tracker."""
         dialogue = tracker.as_dialogue()
 
-        return json.dumps(dialogue.as_dict())
+        return event_codec.dumps(dialogue.as_dict())
 
     def deserialise_tracker(
         self, sender_id: Text, serialised_tracker: Union[Text, bytes]
@@ -250,8 +382,18 @@ class TrackerStore:
         """Deserializes the tracker and returns it."""
         tracker = self.init_tracker(sender_id)
 
+        tracker.recreate_from_dialogue(self._deserialise_dialogue(serialised_tracker))
+
+        return tracker
+
+    @staticmethod
+    def _deserialise_dialogue(serialised_tracker: Union[Text, bytes]) -> Dialogue:
         try:
-            dialogue = Dialogue.from_parameters(json.loads(serialised_tracker))
+            if isinstance(serialised_tracker, bytes):
+                serialised_tracker = serialised_tracker.decode(
+                    rasa.shared.utils.io.DEFAULT_ENCODING
+                )
+            return Dialogue.from_parameters(event_codec.loads(serialised_tracker))
         except UnicodeDecodeError as e:
             raise TrackerDeserialisationException(
                 "Tracker cannot be deserialised. "
@@ -259,9 +401,14 @@ class TrackerStore:
                 "Support for deserialising pickled trackers has been removed."
             ) from e
 
-        tracker.recreate_from_dialogue(dialogue)
+    @staticmethod
+    def _current_tracker_state_without_events(tracker: DialogueStateTracker) -> Dict:
+        # get current tracker state and remove `events` key from state
+        # since events are stored separately
+        state = tracker.current_state(EventVerbosity.ALL)
+        state.pop("events", None)
 
-        return tracker
+        return state
 
 
 class InMemoryTrackerStore(TrackerStore):
@@ -282,11 +429,14 @@ class InMemoryTrackerStore(TrackerStore):
             self.stream_events(tracker)
         serialised = InMemoryTrackerStore.serialise_tracker(tracker)
         self.store[tracker.sender_id] = serialised
+        tracker.mark_events_as_persisted()
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         if sender_id in self.store:
             logger.debug(f"Recreating tracker for id '{sender_id}'")
-            return self.deserialise_tracker(sender_id, self.store[sender_id])
+            tracker = self.deserialise_tracker(sender_id, self.store[sender_id])
+            tracker.mark_events_as_persisted()
+            return tracker
 
         logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
 
@@ -296,9 +446,24 @@ class InMemoryTrackerStore(TrackerStore):
         """Returns sender_ids of the Tracker Store in memory"""
         return self.store.keys()
 
+    async def _run_blocking(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        # accessing the trackers in memory doesn't block
+        return function(*args, **kwargs)
+
 
 class RedisTrackerStore(TrackerStore):
-    """Stores conversation history in Redis"""
+    """Stores conversation history in Redis.
+
+    Every conversation is stored in two keys:
+    - a list with all events of the conversation, and
+    - a list with the events of the latest conversation session.
+
+    Saving a tracker appends its new events to the lists instead of rewriting the
+    whole conversation. Conversations which were stored as one serialised dialogue
+    by previous versions are migrated once they are accessed.
+    """
 
     def __init__(
         self,
@@ -339,25 +504,171 @@ class RedisTrackerStore(TrackerStore):
     def _get_key_prefix(self) -> Text:
         return self.key_prefix
 
+    def _key(self, sender_id: Text, suffix: Text) -> Text:
+        # the hash tag keeps all keys of a conversation in the same slot when using
+        # Redis Cluster, so that they can be updated in one transaction
+        return f"{self.key_prefix}{{{sender_id}}}:{suffix}"
+
+    def _legacy_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + sender_id
+
     def save(
         self, tracker: DialogueStateTracker, timeout: Optional[float] = None
     ) -> None:
-        """Saves the current conversation state."""
+        """Saves the current conversation state.
+
+        Only the events which were added to the tracker since it was stored are sent
+        to Redis.
+        """
         if self.event_broker:
             self.stream_events(tracker)
 
+        additional_events, replaces_session = self._additional_events(tracker)
+
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
-            self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+        pipeline = self.red.pipeline()
+        self._write_events(
+            pipeline, tracker.sender_id, additional_events, replaces_session, timeout
         )
+        pipeline.execute()
+
+        tracker.mark_events_as_persisted()
+
+    def _additional_events(
+        self, tracker: DialogueStateTracker
+    ) -> Tuple[List[Event], bool]:
+        """Returns the events of the tracker which aren't stored yet.
+
+        Args:
+            tracker: Tracker to inspect.
+
+        Returns:
+            The events which aren't stored yet and whether they replace the stored
+            latest session instead of continuing it. The latter happens if the tracker
+            doesn't contain the stored events, e.g. if it was created from scratch.
+        """
+        additional_events = tracker.events_since_persisted_events()
+        if additional_events is not None:
+            return additional_events, False
+
+        number_of_stored_events, last_stored_event = self._latest_stored_event(
+            tracker.sender_id
+        )
+        events = list(tracker.events)
+
+        if not number_of_stored_events:
+            return events, False
+
+        if (
+            number_of_stored_events <= len(events)
+            and events[number_of_stored_events - 1].as_dict() == last_stored_event
+        ):
+            return events[number_of_stored_events:], False
+
+        # the tracker only contains the most recent events of the session, e.g.
+        # because its event history is limited
+        for index in reversed(range(len(events))):
+            if events[index].as_dict() == last_stored_event:
+                return events[index + 1 :], False
+
+        return events, True
+
+    def _latest_stored_event(
+        self, sender_id: Text
+    ) -> Tuple[int, Optional[Dict[Text, Any]]]:
+        """Returns number of events in the latest session and the last stored event."""
+        session_key = self._key(sender_id, REDIS_SESSION_EVENTS_KEY_SUFFIX)
+
+        pipeline = self.red.pipeline(transaction=False)
+        pipeline.llen(session_key)
+        pipeline.lindex(session_key, -1)
+        pipeline.exists(self._legacy_key(sender_id))
+        (
+            number_of_stored_events,
+            last_stored_event,
+            has_legacy_tracker,
+        ) = pipeline.execute()
+
+        if has_legacy_tracker:
+            self._migrate_legacy_tracker(sender_id)
+            return self._latest_stored_event(sender_id)
+
+        if last_stored_event is None:
+            return 0, None
+
+        return number_of_stored_events, event_codec.loads(last_stored_event)
+
+    def _write_events(
+        self,
+        pipeline: "redis.client.Pipeline",
+        sender_id: Text,
+        additional_events: List[Event],
+        replaces_session: bool,
+        timeout: Optional[float],
+    ) -> None:
+        events_key = self._key(sender_id, REDIS_EVENTS_KEY_SUFFIX)
+        session_key = self._key(sender_id, REDIS_SESSION_EVENTS_KEY_SUFFIX)
+
+        serialised_events = [
+            event_codec.serialise_event(event) for event in additional_events
+        ]
+        if serialised_events:
+            pipeline.rpush(events_key, *serialised_events)
+
+        session_start = next(
+            (
+                index
+                for index in reversed(range(len(additional_events)))
+                if isinstance(additional_events[index], SessionStarted)
+            ),
+            None,
+        )
+        if session_start is not None:
+            pipeline.delete(session_key)
+            pipeline.rpush(session_key, *serialised_events[session_start:])
+        elif replaces_session:
+            pipeline.delete(session_key)
+            if serialised_events:
+                pipeline.rpush(session_key, *serialised_events)
+        elif serialised_events:
+            pipeline.rpush(session_key, *serialised_events)
+
+        if timeout:
+            for key in [events_key, session_key]:
+                pipeline.expire(key, int(timeout))
+
+    def _migrate_legacy_tracker(self, sender_id: Text) -> None:
+        """Converts a conversation which was stored as one serialised dialogue."""
+        legacy_key = self._legacy_key(sender_id)
+
+        def migrate(pipeline: "redis.client.Pipeline") -> None:
+            serialised_tracker = pipeline.get(legacy_key)
+            if serialised_tracker is None:
+                # another process migrated the conversation in the meantime
+                return
+
+            events = self._deserialise_dialogue(serialised_tracker).events
+            time_to_live = pipeline.ttl(legacy_key)
+
+            pipeline.multi()
+            self._write_events(
+                pipeline,
+                sender_id,
+                events,
+                True,
+                time_to_live if time_to_live and time_to_live > 0 else None,
+            )
+            pipeline.delete(legacy_key)
+
+        self.red.transaction(migrate, legacy_key)
+        logger.debug(f"Migrated stored tracker for conversation ID '{sender_id}'.")
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
 
-        The Redis key is formed by appending a prefix to sender_id.
+        The events are fetched in one round trip.
 
         Args:
             sender_id: Conversation ID to fetch the tracker for.
@@ -365,19 +676,80 @@ class RedisTrackerStore(TrackerStore):
         Returns:
             Tracker containing events from the latest conversation sessions.
         """
-        stored = self.red.get(self.key_prefix + sender_id)
-        if stored is not None:
-            return self.deserialise_tracker(sender_id, stored)
-        else:
+        return self._retrieve(sender_id, REDIS_SESSION_EVENTS_KEY_SUFFIX)
+
+    def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Fetching all tracker events across conversation sessions."""
+        return self._retrieve(conversation_id, REDIS_EVENTS_KEY_SUFFIX)
+
+    def _retrieve(
+        self, sender_id: Text, events_key_suffix: Text
+    ) -> Optional[DialogueStateTracker]:
+        events_key = self._key(sender_id, events_key_suffix)
+
+        pipeline = self.red.pipeline(transaction=False)
+        pipeline.lrange(events_key, 0, -1)
+        pipeline.exists(self._legacy_key(sender_id))
+        serialised_events, has_legacy_tracker = pipeline.execute()
+
+        if has_legacy_tracker:
+            self._migrate_legacy_tracker(sender_id)
+            serialised_events = self.red.lrange(events_key, 0, -1)
+
+        if not serialised_events:
             return None
 
+        tracker = DialogueStateTracker.from_dict(
+            sender_id,
+            [event_codec.loads(event) for event in serialised_events],
+            self.domain.slots if self.domain else None,
+            max_event_history=self.max_event_history,
+        )
+        tracker.mark_events_as_persisted()
+
+        return tracker
+
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        number_of_stored_events, _ = self._latest_stored_event(sender_id)
+        return number_of_stored_events
+
+    def exists(self, conversation_id: Text) -> bool:
+        """Checks if tracker exists for the specified ID."""
+        return (
+            self.red.exists(
+                self._key(conversation_id, REDIS_SESSION_EVENTS_KEY_SUFFIX),
+                self._legacy_key(conversation_id),
+            )
+            > 0
+        )
+
     def keys(self) -> Iterable[Text]:
-        """Returns keys of the Redis Tracker Store."""
-        return self.red.keys(self.key_prefix + "*")
+        """Returns sender_ids of the Redis Tracker Store."""
+        sender_ids = set()
+        for key in self.red.scan_iter(match=self.key_prefix + "*"):
+            key = key.decode(rasa.shared.utils.io.DEFAULT_ENCODING)
+            key = key[len(self.key_prefix) :]
+
+            match = REDIS_CONVERSATION_KEY_PATTERN.fullmatch(key)
+            if not match:
+                # conversation which wasn't migrated yet
+                sender_ids.add(key)
+            elif match.group("suffix") == REDIS_SESSION_EVENTS_KEY_SUFFIX:
+                sender_ids.add(match.group("sender_id"))
+
+        return sender_ids
 
 
 class DynamoTrackerStore(TrackerStore):
-    """Stores conversation history in DynamoDB"""
+    """Stores conversation history in DynamoDB.
+
+    boto3 resources must not be shared between threads. As the tracker store is
+    accessed from worker threads (see `TrackerStore._run_blocking`), every thread
+    uses its own table resource.
+    """
 
     def __init__(
         self,
@@ -403,9 +775,27 @@ class DynamoTrackerStore(TrackerStore):
         self.client = boto3.client("dynamodb", region_name=region)
         self.region = region
         self.table_name = table_name
-        self.db = self.get_or_create_table(table_name)
+        self._thread_local = threading.local()
+        self._thread_local.table = self.get_or_create_table(table_name)
         super().__init__(domain, event_broker, **kwargs)
 
+    @property
+    def db(self) -> "boto3.resources.factory.dynamodb.Table":
+        """Returns the table resource of the current thread."""
+        table = getattr(self._thread_local, "table", None)
+        if table is None:
+            import boto3.session
+
+            # the default session must not be shared between threads either
+            table = (
+                boto3.session.Session()
+                .resource("dynamodb", region_name=self.region)
+                .Table(self.table_name)
+            )
+            self._thread_local.table = table
+
+        return table
+
     def get_or_create_table(
         self, table_name: Text
     ) -> "boto3.resources.factory.dynamodb.Table":
@@ -439,6 +829,7 @@ class DynamoTrackerStore(TrackerStore):
         serialized = self.serialise_tracker(tracker)
 
         self.db.put_item(Item=serialized)
+        tracker.mark_events_as_persisted()
 
     def serialise_tracker(self, tracker: "DialogueStateTracker") -> Dict:
         """Serializes the tracker, returns object with decimal types."""
@@ -466,9 +857,12 @@ class DynamoTrackerStore(TrackerStore):
         # `float`s are stored as `Decimal` objects - we need to convert them back
         events_with_floats = core_utils.replace_decimals_with_floats(events)
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             sender_id, events_with_floats, self.domain.slots
         )
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the `DynamoTrackerStore`."""
@@ -488,8 +882,17 @@ class DynamoTrackerStore(TrackerStore):
 class MongoTrackerStore(TrackerStore):
     """Stores conversation history in Mongo.
 
+    Every conversation is stored in a document of `collection` which contains the
+    current conversation state and counters for the stored events. The events are
+    stored in bucket documents of the collection `<collection>.events`. A bucket
+    contains the events of a single conversation session, but not more than
+    `MONGO_MAX_EVENTS_PER_BUCKET` events. This keeps the size of documents bounded
+    and allows reading the latest conversation session without reading the
+    previous ones.
+
     Property methods:
         conversations: returns the current conversation
+        conversation_events: returns the buckets with the conversation events
     """
 
     def __init__(
@@ -527,109 +930,217 @@ class MongoTrackerStore(TrackerStore):
         """Returns the current conversation."""
         return self.db[self.collection]
 
+    @property
+    def conversation_events(self) -> Collection:
+        """Returns the buckets which contain the events of the conversations."""
+        return self.db[f"{self.collection}.events"]
+
     def _ensure_indices(self) -> None:
-        """Create an index on the sender_id."""
+        """Create an index on the sender_id and on the buckets of a sender_id."""
         self.conversations.create_index("sender_id")
-
-    @staticmethod
-    def _current_tracker_state_without_events(tracker: DialogueStateTracker) -> Dict:
-        # get current tracker state and remove `events` key from state
-        # since events are pushed separately in the `update_one()` operation
-        state = tracker.current_state(EventVerbosity.ALL)
-        state.pop("events", None)
-
-        return state
+        self.conversation_events.create_index(
+            [("sender_id", 1), ("bucket", 1)], unique=True
+        )
 
     def save(self, tracker: DialogueStateTracker) -> None:
         """Saves the current conversation state."""
         if self.event_broker:
             self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        counters = self._stored_counters(tracker.sender_id) or dict(
+            MONGO_INITIAL_COUNTERS
+        )
+        additional_events = self._additional_events(
+            tracker, counters[MONGO_SESSION_EVENTS_KEY]
+        )
+
+        buckets = self._add_to_buckets(
+            [event.as_dict() for event in additional_events], counters
+        )
+        self._push_to_buckets(tracker.sender_id, buckets)
 
         self.conversations.update_one(
             {"sender_id": tracker.sender_id},
             {
-                "$set": self._current_tracker_state_without_events(tracker),
-                "$push": {
-                    "events": {"$each": [e.as_dict() for e in additional_events]}
-                },
+                "$set": {
+                    **self._current_tracker_state_without_events(tracker),
+                    **counters,
+                }
             },
             upsert=True,
         )
+        tracker.mark_events_as_persisted()
 
-    def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
+    def _additional_events(
+        self,
+        tracker: DialogueStateTracker,
+        number_of_stored_session_events: Optional[int] = None,
+    ) -> Iterator:
         """Return events from the tracker which aren't currently stored.
 
         Args:
             tracker: Tracker to inspect.
+            number_of_stored_session_events: Number of stored events of the latest
+                conversation session. Read from the database if not provided.
 
         Returns:
             List of serialised events that aren't currently stored.
 
         """
+        additional_events = tracker.events_since_persisted_events()
+        if additional_events is not None:
+            return iter(additional_events)
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
+        if number_of_stored_session_events is None:
+            number_of_stored_session_events = self.number_of_existing_events(
+                tracker.sender_id
+            )
 
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
+        return itertools.islice(
+            tracker.events, number_of_stored_session_events, len(tracker.events)
         )
 
-        return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events of the latest conversation session."""
+        counters = self._stored_counters(sender_id)
+
+        return counters[MONGO_SESSION_EVENTS_KEY] if counters else 0
+
+    def _stored_counters(self, sender_id: Text) -> Optional[Dict[Text, int]]:
+        """Reads the counters of the stored events of a conversation.
+
+        Conversations which were stored with all their events in a single document
+        are moved to buckets.
+
+        Args:
+            sender_id: The conversation ID.
+
+        Returns:
+            The counters or `None` if the conversation isn't stored.
+        """
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, projection=self._counters_projection()
         )
 
-    @staticmethod
-    def _events_from_serialized_tracker(serialised: Dict) -> List[Dict]:
-        return serialised.get("events", [])
+        # look for conversations which have used an `int` sender_id in the past
+        # and update them.
+        if stored is None and sender_id.isdigit():
+            stored = self.conversations.find_one_and_update(
+                {"sender_id": int(sender_id)}, {"$set": {"sender_id": str(sender_id)}}
+            )
+
+        if stored is None:
+            return None
+
+        if MONGO_CURRENT_BUCKET_KEY not in stored:
+            return self._move_events_to_buckets(sender_id)
+
+        return {key: stored[key] for key in MONGO_INITIAL_COUNTERS}
 
     @staticmethod
-    def _events_since_last_session_start(events: List[Dict]) -> List[Dict]:
-        """Retrieve events since and including the latest `SessionStart` event.
+    def _counters_projection() -> Dict[Text, bool]:
+        return {"_id": False, **{key: True for key in MONGO_INITIAL_COUNTERS}}
+
+    def _move_events_to_buckets(self, sender_id: Text) -> Dict[Text, int]:
+        """Moves the events of a conversation which were stored by previous versions.
 
         Args:
-            events: All events for a conversation ID.
+            sender_id: The conversation ID.
 
         Returns:
-            List of serialised events since and including the latest `SessionStarted`
-            event. Returns all events if no such event is found.
+            The counters of the stored events.
+        """
+        stored = self.conversations.find_one({"sender_id": sender_id}) or {}
+        counters = dict(MONGO_INITIAL_COUNTERS)
+        buckets = self._add_to_buckets(stored.get("events", []), counters)
 
+        # the buckets are replaced instead of appended to, so that conversations
+        # which are moved concurrently don't end up with duplicated events
+        self._push_to_buckets(sender_id, buckets, replace=True)
+        self.conversations.update_one(
+            {"sender_id": sender_id}, {"$set": counters, "$unset": {"events": ""}}
+        )
+        logger.debug(f"Moved events of conversation '{sender_id}' to buckets.")
+
+        return counters
+
+    @staticmethod
+    def _add_to_buckets(
+        serialised_events: List[Dict[Text, Any]], counters: Dict[Text, int]
+    ) -> Dict[int, List[Dict[Text, Any]]]:
+        """Assigns new events to buckets.
+
+        Args:
+            serialised_events: The events which are appended to the conversation.
+            counters: The counters of the stored events. They are updated to include
+                the new events.
+
+        Returns:
+            The new events by the number of the bucket they are appended to.
         """
+        buckets = {}
+        for event in serialised_events:
+            is_session_start = event["event"] == SessionStarted.type_name
+            if counters[MONGO_CURRENT_BUCKET_SIZE_KEY] and (
+                is_session_start
+                or counters[MONGO_CURRENT_BUCKET_SIZE_KEY]
+                >= MONGO_MAX_EVENTS_PER_BUCKET
+            ):
+                counters[MONGO_CURRENT_BUCKET_KEY] += 1
+                counters[MONGO_CURRENT_BUCKET_SIZE_KEY] = 0
+
+            if is_session_start:
+                counters[MONGO_SESSION_BUCKET_KEY] = counters[MONGO_CURRENT_BUCKET_KEY]
+                counters[MONGO_SESSION_EVENTS_KEY] = 0
+
+            buckets.setdefault(counters[MONGO_CURRENT_BUCKET_KEY], []).append(event)
+            counters[MONGO_CURRENT_BUCKET_SIZE_KEY] += 1
+            counters[MONGO_SESSION_EVENTS_KEY] += 1
+
+        return buckets
+
+    def _push_to_buckets(
+        self,
+        sender_id: Text,
+        buckets: Dict[int, List[Dict[Text, Any]]],
+        replace: bool = False,
+    ) -> None:
+        from pymongo import UpdateOne
 
-        events_after_session_start = []
-        for event in reversed(events):
-            events_after_session_start.append(event)
-            if event["event"] == SessionStarted.type_name:
-                break
+        if not buckets:
+            return
 
-        return list(reversed(events_after_session_start))
+        self.conversation_events.bulk_write(
+            [
+                UpdateOne(
+                    {"sender_id": sender_id, "bucket": bucket},
+                    {"$set": {"events": events}}
+                    if replace
+                    else {"$push": {"events": {"$each": events}}},
+                    upsert=True,
+                )
+                for bucket, events in buckets.items()
+            ],
+            ordered=False,
+        )
 
     def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[List[Dict[Text, Any]]]:
-        stored = self.conversations.find_one({"sender_id": sender_id})
-
-        # look for conversations which have used an `int` sender_id in the past
-        # and update them.
-        if not stored and sender_id.isdigit():
-            from pymongo import ReturnDocument
-
-            stored = self.conversations.find_one_and_update(
-                {"sender_id": int(sender_id)},
-                {"$set": {"sender_id": str(sender_id)}},
-                return_document=ReturnDocument.AFTER,
-            )
-
-        if not stored:
+        counters = self._stored_counters(sender_id)
+        if not counters:
             return None
 
-        events = self._events_from_serialized_tracker(stored)
-
+        query = {"sender_id": sender_id}
         if not fetch_events_from_all_sessions:
-            events = self._events_since_last_session_start(events)
+            # only the buckets of the latest conversation session are read
+            query["bucket"] = {"$gte": counters[MONGO_SESSION_BUCKET_KEY]}
+
+        buckets = self.conversation_events.find(
+            query, projection={"_id": False, "events": True}
+        ).sort("bucket", 1)
 
-        return events
+        return [event for bucket in buckets for event in bucket["events"]]
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session."""
@@ -638,7 +1149,10 @@ class MongoTrackerStore(TrackerStore):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     def retrieve_full_tracker(
         self, conversation_id: Text
@@ -649,13 +1163,21 @@ class MongoTrackerStore(TrackerStore):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             conversation_id, events, self.domain.slots
         )
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
-        return [c["sender_id"] for c in self.conversations.find()]
+        return [
+            c["sender_id"]
+            for c in self.conversations.find(
+                projection={"_id": False, "sender_id": True}
+            )
+        ]
 
 
 def _create_sequence(table_name: Text) -> "Sequence":
@@ -764,13 +1286,18 @@ class SQLTrackerStore(TrackerStore):
         # `create_sequence` is needed to create a sequence for databases that
         # don't autoincrement Integer primary keys (e.g. Oracle)
         id = sa.Column(sa.Integer, _create_sequence(__tablename__), primary_key=True)
-        sender_id = sa.Column(sa.String(255), nullable=False, index=True)
+        sender_id = sa.Column(sa.String(255), nullable=False)
         type_name = sa.Column(sa.String(255), nullable=False)
         timestamp = sa.Column(sa.Float)
         intent_name = sa.Column(sa.String(255))
         action_name = sa.Column(sa.String(255))
         data = sa.Column(sa.Text)
 
+        # the events of a conversation session are read with a range scan
+        __table_args__ = (
+            sa.Index("ix_events_sender_id_timestamp", "sender_id", "timestamp"),
+        )
+
     def __init__(
         self,
         domain: Optional[Domain] = None,
@@ -807,6 +1334,9 @@ class SQLTrackerStore(TrackerStore):
 
                 try:
                     self.Base.metadata.create_all(self.engine)
+                    # tables which were created by previous versions lack indexes
+                    for index in self.SQLEvent.__table__.indexes:
+                        index.create(self.engine, checkfirst=True)
                 except (
                     sqlalchemy.exc.OperationalError,
                     sqlalchemy.exc.ProgrammingError,
@@ -828,8 +1358,31 @@ class SQLTrackerStore(TrackerStore):
 
         logger.debug(f"Connection to SQL database '{db}' successful.")
 
+        # timestamps of the latest `SessionStarted` events per conversation (`None`
+        # for conversations without `SessionStarted` events)
+        self._session_starts: "OrderedDict[Text, Optional[float]]" = OrderedDict()
+        self._session_starts_lock = threading.Lock()
+
         super().__init__(domain, event_broker, **kwargs)
 
+    @staticmethod
+    def _is_in_memory_sqlite(url: "URL") -> bool:
+        return url.get_backend_name() == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        )
+
+    async def _run_blocking(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        if self._is_in_memory_sqlite(self.engine.url):
+            # every thread has its own in-memory database, hence the database has
+            # to be accessed from the thread which created it
+            return function(*args, **kwargs)
+
+        return await super()._run_blocking(function, *args, **kwargs)
+
     @staticmethod
     def get_db_url(
         dialect: Text = "sqlite",
@@ -974,32 +1527,40 @@ class SQLTrackerStore(TrackerStore):
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[DialogueStateTracker]:
         with self.session_scope() as session:
+            serialised_events = self._read_events(
+                session, sender_id, fetch_events_from_all_sessions, self.SQLEvent.data
+            )
 
-            serialised_events = self._event_query(
-                session,
-                sender_id,
-                fetch_events_from_all_sessions=fetch_events_from_all_sessions,
-            ).all()
+            return self._tracker_from_sql_events(sender_id, serialised_events)
 
-            events = [json.loads(event.data) for event in serialised_events]
+    def _tracker_from_sql_events(
+        self, sender_id: Text, serialised_events: List["Row"]
+    ) -> Optional[DialogueStateTracker]:
+        events = [event_codec.loads(event.data) for event in serialised_events]
 
-            if self.domain and len(events) > 0:
-                logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
-                )
-            else:
-                logger.debug(
-                    f"Can't retrieve tracker matching "
-                    f"sender id '{sender_id}' from SQL storage. "
-                    f"Returning `None` instead."
-                )
-                return None
+        if self.domain and len(events) > 0:
+            logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+            tracker = DialogueStateTracker.from_dict(
+                sender_id, events, self.domain.slots
+            )
+            tracker.mark_events_as_persisted()
+            return tracker
+        else:
+            logger.debug(
+                f"Can't retrieve tracker matching "
+                f"sender id '{sender_id}' from SQL storage. "
+                f"Returning `None` instead."
+            )
+            return None
 
-    def _event_query(
-        self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
-    ) -> "Query":
-        """Provide the query to retrieve the conversation events for a specific sender.
+    def _read_events(
+        self,
+        session: "Session",
+        sender_id: Text,
+        fetch_events_from_all_sessions: bool,
+        *columns: "ColumnElement",
+    ) -> List["Row"]:
+        """Reads the stored events of a conversation.
 
         Args:
             session: Current database session.
@@ -1007,34 +1568,106 @@ class SQLTrackerStore(TrackerStore):
             fetch_events_from_all_sessions: Whether to fetch events from all
                 conversation sessions. If `False`, only fetch events from the
                 latest conversation session.
+            columns: Columns to read in addition to `timestamp` and `type_name`.
 
         Returns:
-            Query to get the conversation events.
+            Rows with the requested columns of the events, ordered by timestamp.
+        """
+        rows = session.execute(
+            self._event_statement(sender_id, fetch_events_from_all_sessions, *columns)
+        ).all()
+
+        return self._events_of_requested_sessions(
+            sender_id, rows, fetch_events_from_all_sessions
+        )
+
+    def _event_statement(
+        self,
+        sender_id: Text,
+        fetch_events_from_all_sessions: bool,
+        *columns: "ColumnElement",
+    ) -> "Select":
+        """Provide the statement to select the conversation events of a sender.
+
+        The statement might select events of previous conversation sessions in
+        addition to the events of the latest one. Pass the results to
+        `_events_of_requested_sessions` to remove them.
         """
+        statement = sa.select(
+            self.SQLEvent.timestamp, self.SQLEvent.type_name, *columns
+        ).where(self.SQLEvent.sender_id == sender_id)
+
+        if not fetch_events_from_all_sessions:
+            statement = statement.where(*self._latest_session_filters(sender_id))
+
+        return statement.order_by(self.SQLEvent.timestamp)
+
+    def _latest_session_filters(self, sender_id: Text) -> List["ColumnElement"]:
+        with self._session_starts_lock:
+            is_session_start_cached = sender_id in self._session_starts
+            session_start = self._session_starts.get(sender_id)
+
+        if is_session_start_cached:
+            # Other processes might have started a new session in the meantime.
+            # Its events are selected as well, as they have later timestamps.
+            if session_start is None:
+                return []
+            return [self.SQLEvent.timestamp >= session_start]
+
         # Subquery to find the timestamp of the latest `SessionStarted` event
         session_start_sub_query = (
-            session.query(sa.func.max(self.SQLEvent.timestamp).label("session_start"))
-            .filter(
+            sa.select(sa.func.max(self.SQLEvent.timestamp).label("session_start"))
+            .where(
                 self.SQLEvent.sender_id == sender_id,
                 self.SQLEvent.type_name == SessionStarted.type_name,
             )
             .subquery()
         )
 
-        event_query = session.query(self.SQLEvent).filter(
-            self.SQLEvent.sender_id == sender_id
-        )
-        if not fetch_events_from_all_sessions:
-            event_query = event_query.filter(
-                # Find events after the latest `SessionStarted` event or return all
-                # events
-                sa.or_(
-                    self.SQLEvent.timestamp >= session_start_sub_query.c.session_start,
-                    session_start_sub_query.c.session_start.is_(None),
-                )
+        # Find events after the latest `SessionStarted` event or return all events
+        return [
+            sa.or_(
+                self.SQLEvent.timestamp >= session_start_sub_query.c.session_start,
+                session_start_sub_query.c.session_start.is_(None),
             )
+        ]
+
+    def _events_of_requested_sessions(
+        self, sender_id: Text, rows: List["Row"], fetch_events_from_all_sessions: bool
+    ) -> List["Row"]:
+        """Removes events of previous sessions and caches the latest session start.
+
+        Args:
+            sender_id: Sender id whose conversation events were selected.
+            rows: The events which were selected by `_event_statement`.
+            fetch_events_from_all_sessions: Whether events from all conversation
+                sessions were requested.
+
+        Returns:
+            The events of the requested conversation sessions.
+        """
+        session_starts = [
+            row.timestamp for row in rows if row.type_name == SessionStarted.type_name
+        ]
+        session_start = max(session_starts, default=None)
+        if rows:
+            # the selected events always include the latest `SessionStarted` event
+            self._cache_session_start(sender_id, session_start)
+
+        if fetch_events_from_all_sessions or session_start is None:
+            return rows
 
-        return event_query.order_by(self.SQLEvent.timestamp)
+        return [row for row in rows if row.timestamp >= session_start]
+
+    def _cache_session_start(
+        self, sender_id: Text, session_start: Optional[float]
+    ) -> None:
+        with self._session_starts_lock:
+            self._session_starts[sender_id] = session_start
+            self._session_starts.move_to_end(sender_id)
+
+            if len(self._session_starts) > SQL_SESSION_START_CACHE_SIZE:
+                self._session_starts.popitem(last=False)
 
     def save(self, tracker: DialogueStateTracker) -> None:
         """Update database with events from the current conversation."""
@@ -1044,38 +1677,57 @@ class SQLTrackerStore(TrackerStore):
 
         with self.session_scope() as session:
             # only store recent events
-            events = self._additional_events(session, tracker)
+            events = list(self._additional_events(session, tracker))
 
-            for event in events:
-                data = event.as_dict()
-                intent = (
-                    data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
-                )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
+            if events:
+                session.execute(
+                    self.SQLEvent.__table__.insert(),
+                    [self._event_row(tracker.sender_id, event) for event in events],
                 )
             session.commit()
 
+        self._cache_session_start_of_new_events(tracker.sender_id, events)
+        tracker.mark_events_as_persisted()
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
+    @staticmethod
+    def _event_row(sender_id: Text, event: Event) -> Dict[Text, Any]:
+        data = event.as_dict()
+        intent = data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
+        action = data.get("name")
+        timestamp = data.get("timestamp")
+
+        return {
+            "sender_id": sender_id,
+            "type_name": event.type_name,
+            "timestamp": timestamp,
+            "intent_name": intent,
+            "action_name": action,
+            "data": event_codec.dumps(data),
+        }
+
+    def _cache_session_start_of_new_events(
+        self, sender_id: Text, events: List[Event]
+    ) -> None:
+        session_starts = [
+            event.timestamp for event in events if isinstance(event, SessionStarted)
+        ]
+        if session_starts:
+            self._cache_session_start(sender_id, max(session_starts))
+
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
     ) -> Iterator:
         """Return events from the tracker which aren't currently stored."""
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id, fetch_events_from_all_sessions=False
-        ).count()
+        additional_events = tracker.events_since_persisted_events()
+        if additional_events is not None:
+            return iter(additional_events)
+
+        number_of_events_since_last_session = len(
+            self._read_events(
+                session, tracker.sender_id, fetch_events_from_all_sessions=False
+            )
+        )
 
         return itertools.islice(
             tracker.events, number_of_events_since_last_session, len(tracker.events)
@@ -1158,6 +1810,30 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
 
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker without blocking the event loop (see `retrieve`)."""
+        try:
+            return await self._tracker_store.retrieve_async(sender_id)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return None
+
+    async def keys_async(self) -> Iterable[Text]:
+        """Returns the keys without blocking the event loop (see `keys`)."""
+        try:
+            return await self._tracker_store.keys_async()
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return []
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker without blocking the event loop (see `save`)."""
+        try:
+            await self._tracker_store.save_async(tracker)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            await self.fallback_tracker_store.save_async(tracker)
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
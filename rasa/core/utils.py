@@ -198,8 +198,18 @@ class AvailableEndpoints:
         )
         lock_store = read_endpoint_config(endpoint_file, endpoint_type="lock_store")
         event_broker = read_endpoint_config(endpoint_file, endpoint_type="event_broker")
-
-        return cls(nlg, nlu, action, model, tracker_store, lock_store, event_broker)
+        graph_runner = read_endpoint_config(endpoint_file, endpoint_type="graph_runner")
+
+        return cls(
+            nlg,
+            nlu,
+            action,
+            model,
+            tracker_store,
+            lock_store,
+            event_broker,
+            graph_runner,
+        )
 
     def __init__(
         self,
@@ -210,6 +220,7 @@ class AvailableEndpoints:
         tracker_store: Optional[EndpointConfig] = None,
         lock_store: Optional[EndpointConfig] = None,
         event_broker: Optional[EndpointConfig] = None,
+        graph_runner: Optional[EndpointConfig] = None,
     ) -> None:
         self.model = model
         self.action = action
@@ -218,6 +229,7 @@ class AvailableEndpoints:
         self.tracker_store = tracker_store
         self.lock_store = lock_store
         self.event_broker = event_broker
+        self.graph_runner = graph_runner
 
 
 def read_endpoints_from_path(
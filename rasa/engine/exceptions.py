@@ -2,6 +2,10 @@ class GraphRunError(Exception):
     """Exception class for errors originating when running a graph."""
 
 
+class GraphRunQueueFull(GraphRunError):
+    """Indicates that too many graph runs are waiting to be executed."""
+
+
 class GraphComponentException(Exception):
     """Exception class for errors originating within a `GraphComponent`."""
 
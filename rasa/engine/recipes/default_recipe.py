@@ -13,6 +13,7 @@ from rasa.core.featurizers.precomputation import (
     CoreFeaturizationInputConverter,
     CoreFeaturizationCollector,
 )
+from rasa.core.featurizers.training_tracker_states import TrainingTrackerStatesProvider
 from rasa.core.policies.ensemble import DefaultPolicyPredictionEnsemble
 
 from rasa.engine.graph import (
@@ -483,6 +484,7 @@ class DefaultV1Recipe(Recipe):
         )
 
         policy_with_end_to_end_support_used = False
+        policy_with_shared_states_used = False
         for idx, config in enumerate(train_config["policies"]):
             component_name = config.pop("name")
             component = self._from_registry(component_name)
@@ -497,6 +499,13 @@ class DefaultV1Recipe(Recipe):
             policy_with_end_to_end_support_used = (
                 policy_with_end_to_end_support_used or requires_end_to_end_data
             )
+            uses_shared_states = (
+                "training_tracker_states"
+                in rasa.shared.utils.common.arguments_of(component.clazz.train)
+            )
+            policy_with_shared_states_used = (
+                policy_with_shared_states_used or uses_shared_states
+            )
 
             train_nodes[f"train_{component_name}{idx}"] = SchemaNode(
                 needs={
@@ -507,6 +516,11 @@ class DefaultV1Recipe(Recipe):
                         if requires_end_to_end_data
                         else {}
                     ),
+                    **(
+                        {"training_tracker_states": "training_tracker_states_provider"}
+                        if uses_shared_states
+                        else {}
+                    ),
                 },
                 uses=component.clazz,
                 constructor_name="load" if self._is_finetuning else "create",
@@ -515,6 +529,20 @@ class DefaultV1Recipe(Recipe):
                 config={**config, **extra_config_from_cli},
             )
 
+        if policy_with_shared_states_used:
+            # the policies share the states of the training trackers instead of each
+            # policy creating them again
+            train_nodes["training_tracker_states_provider"] = SchemaNode(
+                needs={
+                    "training_trackers": "training_tracker_provider",
+                    "domain": "domain_without_responses_provider",
+                },
+                uses=TrainingTrackerStatesProvider,
+                constructor_name="create",
+                fn="provide",
+                config={},
+            )
+
         if self._use_end_to_end and policy_with_end_to_end_support_used:
             self._add_end_to_end_features_for_training(preprocessors, train_nodes)
 
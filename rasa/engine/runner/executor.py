@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+from typing import Any, Dict, List, Optional, Text, Tuple, Union
+
+from rasa.engine.exceptions import GraphRunError, GraphRunQueueFull
+from rasa.engine.runner.interface import GraphRunner
+from rasa.utils.endpoints import EndpointConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 1
+DEFAULT_MAX_BATCH_SIZE = 1
+DEFAULT_MAX_BATCH_WAIT_MS = 10
+
+# executor of everyone who doesn't configure a graph runner (see `create`)
+_shared_executor: Optional[GraphRunExecutor] = None
+
+
+class BatchingMetrics:
+    """Statistics about the batches which were run by a `GraphRunExecutor`."""
+
+    def __init__(self) -> None:
+        """Creates empty statistics."""
+        self.number_of_batches = 0
+        self.number_of_items = 0
+        self.max_batch_size = 0
+        self.total_queue_wait_time = 0.0
+        self.max_queue_wait_time = 0.0
+
+    def add_batch(self, queue_wait_times: List[float]) -> None:
+        """Adds a batch to the statistics.
+
+        Args:
+            queue_wait_times: For every item of the batch the time in seconds it
+                waited for the batch to be run.
+        """
+        self.number_of_batches += 1
+        self.number_of_items += len(queue_wait_times)
+        self.max_batch_size = max(self.max_batch_size, len(queue_wait_times))
+        self.total_queue_wait_time += sum(queue_wait_times)
+        self.max_queue_wait_time = max(
+            self.max_queue_wait_time, max(queue_wait_times, default=0.0)
+        )
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns the statistics in a serializable format."""
+        return {
+            "number_of_batches": self.number_of_batches,
+            "number_of_items": self.number_of_items,
+            "average_batch_size": (
+                self.number_of_items / self.number_of_batches
+                if self.number_of_batches
+                else 0.0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "average_queue_wait_ms": (
+                1000 * self.total_queue_wait_time / self.number_of_items
+                if self.number_of_items
+                else 0.0
+            ),
+            "max_queue_wait_ms": 1000 * self.max_queue_wait_time,
+        }
+
+
+class _PendingBatch:
+    """Items which are waiting to be run as one batch."""
+
+    def __init__(self, timer: asyncio.TimerHandle) -> None:
+        self.timer = timer
+        self.items: List[Any] = []
+        self.futures: List[asyncio.Future] = []
+        self.submission_times: List[float] = []
+
+    def add(self, item: Any, future: asyncio.Future) -> None:
+        self.items.append(item)
+        self.futures.append(future)
+        self.submission_times.append(time.perf_counter())
+
+
+class GraphRunExecutor:
+    """Runs graphs in a pool of worker threads.
+
+    Running a graph for a prediction is CPU-bound. Running it on the thread of the
+    event loop would stall every other conversation which is handled by the same
+    server while the graph is running.
+
+    Graph runs for single items (e.g. messages which should be parsed) can optionally
+    be batched: items which are submitted concurrently are then run through the graph
+    together, so that the components can process them in one go.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_queue_size: Optional[int] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_wait_ms: float = DEFAULT_MAX_BATCH_WAIT_MS,
+    ) -> None:
+        """Creates the executor.
+
+        Args:
+            pool_size: Number of graph runs which are executed in parallel. Use `1` if
+                the components of the graph can't be used from multiple threads at the
+                same time.
+            max_queue_size: Maximum number of graph runs which wait for a free worker.
+                Further runs are rejected with a `GraphRunQueueFull` exception.
+                `None` means that the number of waiting runs is unlimited.
+            max_batch_size: Maximum number of items which are run as one batch. `1`
+                disables batching.
+            max_batch_wait_ms: Maximum time in milliseconds which an item waits for
+                further items before its batch is run.
+        """
+        if pool_size < 1:
+            raise ValueError(
+                f"The pool size of the graph runner has to be at least 1 but is "
+                f"{pool_size}."
+            )
+        if max_queue_size is not None and max_queue_size < 0:
+            raise ValueError(
+                f"The queue size of the graph runner must not be negative but is "
+                f"{max_queue_size}."
+            )
+        if max_batch_size < 1:
+            raise ValueError(
+                f"The batch size of the graph runner has to be at least 1 but is "
+                f"{max_batch_size}."
+            )
+        if max_batch_wait_ms < 0:
+            raise ValueError(
+                f"The batch wait time of the graph runner must not be negative but "
+                f"is {max_batch_wait_ms}."
+            )
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="graph_runner"
+        )
+        self._pool_size = pool_size
+        self._max_queue_size = max_queue_size
+        # only modified from the event loop, hence no lock is required
+        self._number_of_pending_runs = 0
+
+        self._max_batch_size = max_batch_size
+        self._max_batch_wait_time = max_batch_wait_ms / 1000
+        self._pending_batches: Dict[Tuple[GraphRunner, Text, Text], _PendingBatch] = {}
+        self.batching_metrics = BatchingMetrics()
+
+    @classmethod
+    def create(
+        cls, obj: Union[GraphRunExecutor, EndpointConfig, None]
+    ) -> GraphRunExecutor:
+        """Creates an executor from the `graph_runner` section of the endpoints.
+
+        Args:
+            obj: Either an existing executor or the endpoint configuration, e.g.
+
+                graph_runner:
+                  pool_size: 2
+                  max_queue_size: 100
+                  max_batch_size: 16
+                  max_batch_wait_ms: 5
+
+        Returns:
+            The executor. Without a configuration the executor with the default
+            settings is returned which is shared by the whole process, so that no
+            worker threads are left behind if the owner of the executor doesn't shut
+            it down.
+        """
+        global _shared_executor
+
+        if isinstance(obj, GraphRunExecutor):
+            return obj
+
+        if obj is None:
+            if _shared_executor is None:
+                _shared_executor = cls()
+            return _shared_executor
+
+        return cls(
+            pool_size=obj.kwargs.get("pool_size", DEFAULT_POOL_SIZE),
+            max_queue_size=obj.kwargs.get("max_queue_size"),
+            max_batch_size=obj.kwargs.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE),
+            max_batch_wait_ms=obj.kwargs.get(
+                "max_batch_wait_ms", DEFAULT_MAX_BATCH_WAIT_MS
+            ),
+        )
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether this is the executor which is shared by the whole process."""
+        return self is _shared_executor
+
+    @property
+    def number_of_pending_runs(self) -> int:
+        """Returns the number of graph runs which are running or waiting to run."""
+        return self._number_of_pending_runs
+
+    async def run(
+        self,
+        graph_runner: GraphRunner,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        """Runs a graph in the worker pool.
+
+        Args:
+            graph_runner: The runner for the graph.
+            inputs: Input nodes to be added to the graph.
+            targets: Nodes whose output is needed and must always run.
+
+        Returns:
+            A mapping of target node name to output value.
+
+        Raises:
+            GraphRunQueueFull: If the maximum number of waiting graph runs is reached.
+        """
+        if (
+            self._max_queue_size is not None
+            and self._number_of_pending_runs >= self._pool_size + self._max_queue_size
+        ):
+            raise GraphRunQueueFull(
+                f"Rejected graph run since {self._number_of_pending_runs} graph runs "
+                f"are already pending. Increase the 'pool_size' or 'max_queue_size' "
+                f"of the 'graph_runner' in your endpoint configuration if the server "
+                f"has the capacity to handle more requests."
+            )
+
+        self._number_of_pending_runs += 1
+        try:
+            return await graph_runner.run_async(inputs, targets, executor=self._pool)
+        finally:
+            self._number_of_pending_runs -= 1
+
+    async def run_batched(
+        self, graph_runner: GraphRunner, input_name: Text, item: Any, target: Text
+    ) -> Any:
+        """Runs a graph for a single item as part of a batch.
+
+        Items which are submitted for the same graph, input and target while the
+        batch is waiting are run together. The batch is run once it contains
+        `max_batch_size` items or after waiting for `max_batch_wait_ms`.
+
+        Args:
+            graph_runner: The runner for the graph.
+            input_name: Name of the graph input which receives the list of items of
+                the batch.
+            item: The item which should be run.
+            target: Name of the target node. Its output has to be a list with one
+                entry per item.
+
+        Returns:
+            The output of the target node for `item`.
+
+        Raises:
+            GraphRunQueueFull: If the maximum number of waiting graph runs is reached.
+        """
+        if self._max_batch_size == 1:
+            results = await self.run(
+                graph_runner, inputs={input_name: [item]}, targets=[target]
+            )
+            return results[target][0]
+
+        loop = asyncio.get_event_loop()
+        key = (graph_runner, input_name, target)
+        batch = self._pending_batches.get(key)
+        if batch is None:
+            batch = _PendingBatch(
+                loop.call_later(self._max_batch_wait_time, self._start_batch, key)
+            )
+            self._pending_batches[key] = batch
+
+        future = loop.create_future()
+        batch.add(item, future)
+
+        if len(batch.items) >= self._max_batch_size:
+            self._start_batch(key)
+
+        return await future
+
+    def _start_batch(self, key: Tuple[GraphRunner, Text, Text]) -> None:
+        batch = self._pending_batches.pop(key, None)
+        if batch is None:
+            return
+
+        batch.timer.cancel()
+        asyncio.ensure_future(self._run_batch(key, batch))
+
+    async def _run_batch(
+        self, key: Tuple[GraphRunner, Text, Text], batch: _PendingBatch
+    ) -> None:
+        graph_runner, input_name, target = key
+
+        start = time.perf_counter()
+        queue_wait_times = [start - submitted for submitted in batch.submission_times]
+        self.batching_metrics.add_batch(queue_wait_times)
+        logger.debug(
+            f"Running batch of {len(batch.items)} items after waiting up to "
+            f"{1000 * max(queue_wait_times):.1f} ms."
+        )
+
+        try:
+            results = await self.run(
+                graph_runner, inputs={input_name: batch.items}, targets=[target]
+            )
+            outputs = results[target]
+            if len(outputs) != len(batch.items):
+                raise GraphRunError(
+                    f"Target '{target}' returned {len(outputs)} outputs for a "
+                    f"batch of {len(batch.items)} items."
+                )
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, output in zip(batch.futures, outputs):
+            # the caller might have been cancelled in the meantime
+            if not future.done():
+                future.set_result(output)
+
+    def shutdown(self) -> None:
+        """Stops the worker threads once the pending graph runs are done.
+
+        The shared executor (see `create`) must not be shut down.
+        """
+        logger.debug("Shutting down the worker threads of the graph runner.")
+        self._pool.shutdown(wait=False)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import Executor
+import functools
 from typing import Any, Dict, List, Optional, Text
 
 from rasa.engine.graph import ExecutionContext, GraphNodeHook, GraphSchema
@@ -47,3 +50,28 @@ class GraphRunner(ABC):
         Returns: A mapping of target node name to output value.
         """
         ...
+
+    async def run_async(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Dict[Text, Any]:
+        """Runs the instantiated graph without blocking the event loop.
+
+        Running the graph is CPU-bound (e.g. model inference). It's hence run by
+        `executor` so that other coroutines can proceed while the graph is running.
+
+        Args:
+            inputs: Input nodes to be added to the graph. These can be referenced by
+                name in the "needs" key of a node in the schema.
+            targets: Nodes whose output is needed and must always run.
+            executor: The executor which runs the graph. The default executor of the
+                event loop is used if no executor is given.
+
+        Returns: A mapping of target node name to output value.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(self.run, inputs, targets)
+        )
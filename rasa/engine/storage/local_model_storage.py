@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
 import shutil
-from tarsafe import TarSafe
+import tarfile
 import tempfile
 import uuid
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Text, ContextManager, Tuple, Union
+from typing import Any, Text, ContextManager, Tuple, Union
 
 import rasa.utils.common
 import rasa.shared.utils.io
@@ -17,9 +19,13 @@ from rasa.engine.storage.storage import (
     ModelStorage,
 )
 from rasa.engine.graph import GraphModelConfiguration
+import rasa.engine.storage.model_archive
+from rasa.engine.storage.model_archive import ArchiveFormat
+from rasa.engine.storage.model_archive_cache import ModelArchiveCache
 from rasa.engine.storage.resource import Resource
 from rasa.exceptions import UnsupportedModelVersionError
 from rasa.shared.core.domain import Domain
+from rasa.shared.exceptions import FileNotFoundException
 import rasa.model
 
 logger = logging.getLogger(__name__)
@@ -27,6 +33,8 @@ logger = logging.getLogger(__name__)
 # Paths within model archive
 MODEL_ARCHIVE_COMPONENTS_DIR = "components"
 MODEL_ARCHIVE_METADATA_FILE = "metadata.json"
+# Only contained in model archives of Rasa 2
+RASA2_ARCHIVE_FINGERPRINT_FILE = "fingerprint.json"
 
 
 class LocalModelStorage(ModelStorage):
@@ -53,6 +61,20 @@ class LocalModelStorage(ModelStorage):
                 f"empty model storage."
             )
 
+        cached_model = ModelArchiveCache.from_environment().get_or_extract(
+            model_archive_path, cls._extract_archive_to_directory
+        )
+        if cached_model:
+            try:
+                cls._copy_components_to_model_storage(cached_model, storage_path)
+                return cls(storage_path), cls._load_metadata(cached_model)
+            except OSError:
+                logger.debug(
+                    f"Cached model '{cached_model}' was removed from the cache while "
+                    f"copying it. Extracting the model archive instead."
+                )
+                cls._clear_directory(storage_path)
+
         with tempfile.TemporaryDirectory() as temporary_directory:
             temporary_directory = Path(temporary_directory)
 
@@ -75,25 +97,43 @@ class LocalModelStorage(ModelStorage):
         cls, model_archive_path: Union[Text, Path]
     ) -> ModelMetadata:
         """Retrieves metadata from archive (see parent class for full docstring)."""
-        with tempfile.TemporaryDirectory() as temporary_directory:
-            temporary_directory = Path(temporary_directory)
-
-            cls._extract_archive_to_directory(model_archive_path, temporary_directory)
-            metadata = cls._load_metadata(temporary_directory)
+        # only the metadata is read from the archive instead of extracting all of it
+        with rasa.engine.storage.model_archive.open_for_reading(
+            model_archive_path
+        ) as tar:
+            for member in tar:
+                file_name = os.path.normpath(member.name)
+                if file_name == RASA2_ARCHIVE_FINGERPRINT_FILE:
+                    serialized_fingerprint = cls._read_json_member(tar, member)
+                    raise UnsupportedModelVersionError(
+                        model_version=serialized_fingerprint["version"]
+                    )
+
+                if file_name == MODEL_ARCHIVE_METADATA_FILE:
+                    return ModelMetadata.from_dict(cls._read_json_member(tar, member))
+
+        raise FileNotFoundException(
+            f"Failed to read the model metadata, the model archive "
+            f"'{model_archive_path}' doesn't contain a '{MODEL_ARCHIVE_METADATA_FILE}'."
+        )
 
-            return metadata
+    @staticmethod
+    def _read_json_member(tar: tarfile.TarFile, member: tarfile.TarInfo) -> Any:
+        with tar.extractfile(member) as file:
+            return json.loads(file.read().decode(rasa.shared.utils.io.DEFAULT_ENCODING))
 
     @staticmethod
     def _extract_archive_to_directory(
         model_archive_path: Union[Text, Path], temporary_directory: Path,
     ) -> None:
-        with TarSafe.open(model_archive_path, mode="r:gz") as tar:
-            tar.extractall(temporary_directory)
+        rasa.engine.storage.model_archive.extract(
+            model_archive_path, temporary_directory
+        )
         LocalModelStorage._assert_not_rasa2_archive(temporary_directory)
 
     @staticmethod
     def _assert_not_rasa2_archive(temporary_directory: Path,) -> None:
-        fingerprint_file = Path(temporary_directory) / "fingerprint.json"
+        fingerprint_file = Path(temporary_directory) / RASA2_ARCHIVE_FINGERPRINT_FILE
         if fingerprint_file.is_file():
             serialized_fingerprint = rasa.shared.utils.io.read_json_file(
                 fingerprint_file
@@ -111,6 +151,24 @@ class LocalModelStorage(ModelStorage):
                 str(path), str(storage_path),
             )
 
+    @staticmethod
+    def _copy_components_to_model_storage(directory: Path, storage_path: Path) -> None:
+        # the content of the cache is copied as the model storage might be modified,
+        # e.g. when finetuning a model
+        for path in (directory / MODEL_ARCHIVE_COMPONENTS_DIR).glob("*"):
+            if path.is_dir():
+                shutil.copytree(path, storage_path / path.name)
+            else:
+                shutil.copy2(path, storage_path)
+
+    @staticmethod
+    def _clear_directory(directory: Path) -> None:
+        for path in directory.glob("*"):
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
     @staticmethod
     def _load_metadata(directory: Path) -> ModelMetadata:
         serialized_metadata = rasa.shared.utils.io.read_json_file(
@@ -162,23 +220,34 @@ class LocalModelStorage(ModelStorage):
         """Creates model package (see parent class for full docstring)."""
         logger.debug(f"Start to created model package for path '{model_archive_path}'.")
 
+        archive_format = ArchiveFormat.from_environment()
+
         with tempfile.TemporaryDirectory() as temp_dir:
             temporary_directory = Path(temp_dir)
 
-            shutil.copytree(
-                self._storage_path, temporary_directory / MODEL_ARCHIVE_COMPONENTS_DIR
-            )
-
             model_metadata = self._create_model_metadata(domain, model_configuration)
             self._persist_metadata(model_metadata, temporary_directory)
 
             if not model_archive_path.parent.exists():
                 model_archive_path.parent.mkdir(parents=True)
 
-            with TarSafe.open(model_archive_path, "w:gz") as tar:
-                tar.add(temporary_directory, arcname="")
-
-        logger.debug(f"Model package created in path '{model_archive_path}'.")
+            with rasa.engine.storage.model_archive.open_for_writing(
+                model_archive_path, archive_format
+            ) as tar:
+                # the metadata is added first so that it can be read without
+                # decompressing the whole archive
+                tar.add(
+                    temporary_directory / MODEL_ARCHIVE_METADATA_FILE,
+                    arcname=MODEL_ARCHIVE_METADATA_FILE,
+                )
+                # the components are added directly from the model storage instead
+                # of copying them to a temporary directory first
+                tar.add(self._storage_path, arcname=MODEL_ARCHIVE_COMPONENTS_DIR)
+
+        logger.debug(
+            f"Model package created in path '{model_archive_path}' using the "
+            f"archive format '{archive_format.value}'."
+        )
 
         return model_metadata
 
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+import os
+import tarfile
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any, ContextManager, Text, Union
+
+from tarsafe import TarSafe
+
+from rasa.exceptions import MissingDependencyException
+from rasa.shared.exceptions import RasaException
+
+logger = logging.getLogger(__name__)
+
+MODEL_ARCHIVE_FORMAT_ENV = "RASA_MODEL_ARCHIVE_FORMAT"
+
+# Magic numbers at the start of compressed files
+_GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+_ZSTD_MAGIC_NUMBER = b"\x28\xb5\x2f\xfd"
+
+
+class ArchiveFormat(Enum):
+    """Formats in which model archives can be stored.
+
+    The format of an archive is detected from its content when it's read. Archives
+    keep their file name independent of their format.
+    """
+
+    # tar archive compressed with gzip (default)
+    GZIP = "gz"
+    # uncompressed tar archive
+    TAR = "tar"
+    # tar archive compressed with multiple threads using zstandard
+    ZSTD = "zst"
+
+    @classmethod
+    def from_environment(cls) -> ArchiveFormat:
+        """Returns the archive format which is configured via environment variable.
+
+        Raises:
+            RasaException: If the configured archive format is unknown.
+        """
+        value = os.environ.get(MODEL_ARCHIVE_FORMAT_ENV, cls.GZIP.value)
+        try:
+            return cls(value)
+        except ValueError:
+            raise RasaException(
+                f"Unknown model archive format '{value}' in environment variable "
+                f"'{MODEL_ARCHIVE_FORMAT_ENV}'. Valid formats are "
+                f"{', '.join(repr(archive_format.value) for archive_format in cls)}."
+            )
+
+    @classmethod
+    def of_archive(cls, model_archive_path: Union[Text, Path]) -> ArchiveFormat:
+        """Detects the format of an existing archive.
+
+        Args:
+            model_archive_path: The path to the model archive.
+
+        Returns:
+            The format of the archive.
+        """
+        with open(model_archive_path, "rb") as archive:
+            magic_number = archive.read(len(_ZSTD_MAGIC_NUMBER))
+
+        if magic_number.startswith(_GZIP_MAGIC_NUMBER):
+            return cls.GZIP
+        if magic_number == _ZSTD_MAGIC_NUMBER:
+            return cls.ZSTD
+        return cls.TAR
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        raise MissingDependencyException(
+            f"The model archive format '{ArchiveFormat.ZSTD.value}' requires the "
+            f"package 'zstandard'. Please install it using `pip install rasa[zstd]`."
+        )
+
+
+@contextmanager
+def open_for_writing(
+    model_archive_path: Union[Text, Path], archive_format: ArchiveFormat
+) -> ContextManager[tarfile.TarFile]:
+    """Opens a new model archive to add files to it.
+
+    Args:
+        model_archive_path: The path of the model archive.
+        archive_format: The format of the archive.
+
+    Returns:
+        The archive.
+    """
+    if archive_format == ArchiveFormat.ZSTD:
+        compressor = _zstandard().ZstdCompressor(threads=-1)
+        with open(model_archive_path, "wb") as file:
+            with compressor.stream_writer(file, closefd=False) as compressed:
+                with TarSafe.open(fileobj=compressed, mode="w|") as tar:
+                    yield tar
+        return
+
+    mode = "w:gz" if archive_format == ArchiveFormat.GZIP else "w"
+    with TarSafe.open(model_archive_path, mode) as tar:
+        yield tar
+
+
+@contextmanager
+def open_for_reading(
+    model_archive_path: Union[Text, Path]
+) -> ContextManager[tarfile.TarFile]:
+    """Opens a model archive to read its members in order.
+
+    Args:
+        model_archive_path: The path of the model archive.
+
+    Returns:
+        The archive. Its members have to be read in the order in which they
+        are stored.
+    """
+    archive_format = ArchiveFormat.of_archive(model_archive_path)
+
+    if archive_format == ArchiveFormat.ZSTD:
+        decompressor = _zstandard().ZstdDecompressor()
+        with open(model_archive_path, "rb") as file:
+            with decompressor.stream_reader(file, closefd=False) as decompressed:
+                with TarSafe.open(fileobj=decompressed, mode="r|") as tar:
+                    yield tar
+        return
+
+    mode = "r:gz" if archive_format == ArchiveFormat.GZIP else "r:"
+    with TarSafe.open(model_archive_path, mode) as tar:
+        yield tar
+
+
+def extract(model_archive_path: Union[Text, Path], directory: Path) -> None:
+    """Extracts a model archive.
+
+    Args:
+        model_archive_path: The path of the model archive.
+        directory: The directory to extract the archive to.
+    """
+    is_stream = ArchiveFormat.of_archive(model_archive_path) == ArchiveFormat.ZSTD
+
+    with open_for_reading(model_archive_path) as tar:
+        if not is_stream:
+            tar.extractall(directory)
+            return
+
+        # `TarSafe` checks all members before extracting the first one which
+        # requires a seekable archive, hence members of streamed archives are
+        # checked one by one instead
+        for member in tar:
+            _assert_safe_member(member, directory)
+            tarfile.TarFile.extract(tar, member, directory)
+
+
+def _assert_safe_member(member: tarfile.TarInfo, directory: Path) -> None:
+    # model archives only contain files and directories
+    if not (member.isfile() or member.isdir()):
+        raise RasaException(
+            f"Model archive member '{member.name}' is neither a file nor a directory."
+        )
+
+    target = os.path.abspath(os.path.join(directory, member.name))
+    if os.path.commonpath([target, os.path.abspath(directory)]) != os.path.abspath(
+        directory
+    ):
+        raise RasaException(
+            f"Model archive member '{member.name}' would be extracted outside of the "
+            f"target directory."
+        )
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional, Text, Union
+
+import rasa.utils.common
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_CACHE_LOCATION = Path(".rasa", "models")
+# The cache is disabled by default
+DEFAULT_MODEL_CACHE_SIZE_MB = 0
+
+MODEL_CACHE_LOCATION_ENV = "RASA_MODEL_CACHE_DIRECTORY"
+MODEL_CACHE_SIZE_ENV = "RASA_MAX_MODEL_CACHE_SIZE"
+
+# Directories with this prefix are not (yet or anymore) part of the cache
+_PRIVATE_DIRECTORY_PREFIX = "."
+# Maps the path, size and modification time of archives to the hash of their content
+_ARCHIVE_KEYS_DIRECTORY = f"{_PRIVATE_DIRECTORY_PREFIX}archive_keys"
+_HASH_CHUNK_SIZE = 1_048_576
+
+
+class ModelArchiveCache:
+    """Caches extracted model archives on local disk.
+
+    Extracting a model archive means decompressing all of it. Models which were
+    extracted before (e.g. when restarting the server or when switching back to a
+    previous model) are taken from the cache instead.
+
+    Cache entries are keyed by the hash of the archive content. The content is only
+    hashed if the archive wasn't seen before with the same path, size and
+    modification time, so that a cache hit doesn't need to read the archive. Several
+    processes can share the same cache directory: entries only become visible once
+    they were completely extracted and are removed from the cache by an atomic
+    rename before they are deleted.
+    """
+
+    def __init__(self, cache_location: Path, max_cache_size: float) -> None:
+        """Creates cache.
+
+        Args:
+            cache_location: Directory which contains the extracted models.
+            max_cache_size: Maximum size of the cache in MiB. `0` disables the cache.
+        """
+        self._cache_location = cache_location
+        self._max_cache_size = max_cache_size
+
+    @classmethod
+    def from_environment(cls) -> ModelArchiveCache:
+        """Creates a cache which is configured via environment variables."""
+        return cls(
+            Path(
+                os.environ.get(MODEL_CACHE_LOCATION_ENV, DEFAULT_MODEL_CACHE_LOCATION)
+            ),
+            float(os.environ.get(MODEL_CACHE_SIZE_ENV, DEFAULT_MODEL_CACHE_SIZE_MB)),
+        )
+
+    def is_enabled(self) -> bool:
+        """Returns `True` if extracted models should be cached."""
+        return self._max_cache_size > 0.0
+
+    def get_or_extract(
+        self,
+        model_archive_path: Union[Text, Path],
+        extract: Callable[[Union[Text, Path], Path], None],
+    ) -> Optional[Path]:
+        """Returns the cached content of a model archive.
+
+        The archive is extracted into the cache if it wasn't cached before.
+
+        Args:
+            model_archive_path: The path to the model archive.
+            extract: Function which extracts the model archive into a given
+                directory.
+
+        Returns:
+            The directory containing the extracted archive or `None` if the cache is
+            disabled or the extracted archive is too large to be cached.
+        """
+        if not self.is_enabled():
+            return None
+
+        archive_key = self._archive_key(model_archive_path)
+        archive_hash = self._cached_archive_hash(archive_key) or self._content_hash(
+            model_archive_path
+        )
+
+        directory = self._cache_location / archive_hash
+        if directory.is_dir():
+            logger.debug(f"Using cached extracted model '{directory}'.")
+            self._mark_as_used(directory)
+            self._cache_archive_hash(archive_key, archive_hash)
+            return directory
+
+        self._cache_location.mkdir(parents=True, exist_ok=True)
+
+        # extract into a private directory on the same file system, so that the
+        # entry can be added with an atomic rename once it is complete
+        temporary_directory = self._private_directory()
+        try:
+            extract(model_archive_path, temporary_directory)
+
+            size = rasa.utils.common.directory_size_in_mb(temporary_directory)
+            if size > self._max_cache_size:
+                logger.debug(
+                    f"Caching extracted model '{model_archive_path}' was skipped "
+                    f"because it exceeds the maximum cache size of "
+                    f"{self._max_cache_size} MiB."
+                )
+                return None
+
+            try:
+                temporary_directory.rename(directory)
+            except OSError:
+                # another process added the same archive in the meantime
+                logger.debug(f"Extracted model '{directory.name}' is already cached.")
+        finally:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+        self._mark_as_used(directory)
+        self._cache_archive_hash(archive_key, archive_hash)
+        self._drop_least_recently_used_entries(keep=directory)
+
+        return directory
+
+    def _cached_archive_hash(self, archive_key: Text) -> Optional[Text]:
+        try:
+            return (
+                self._cache_location / _ARCHIVE_KEYS_DIRECTORY / archive_key
+            ).read_text()
+        except FileNotFoundError:
+            return None
+
+    def _cache_archive_hash(self, archive_key: Text, archive_hash: Text) -> None:
+        key_file = self._cache_location / _ARCHIVE_KEYS_DIRECTORY / archive_key
+        if key_file.exists():
+            return
+
+        key_file.parent.mkdir(parents=True, exist_ok=True)
+        # write the key atomically as other processes might read it concurrently
+        temporary_key_file = key_file.with_name(
+            f"{_PRIVATE_DIRECTORY_PREFIX}{uuid.uuid4().hex}"
+        )
+        temporary_key_file.write_text(archive_hash)
+        os.replace(temporary_key_file, key_file)
+
+    @staticmethod
+    def _archive_key(model_archive_path: Union[Text, Path]) -> Text:
+        stat = os.stat(model_archive_path)
+        key = f"{Path(model_archive_path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @staticmethod
+    def _content_hash(model_archive_path: Union[Text, Path]) -> Text:
+        archive_hash = hashlib.sha256()
+        with open(model_archive_path, "rb") as archive:
+            for chunk in iter(lambda: archive.read(_HASH_CHUNK_SIZE), b""):
+                archive_hash.update(chunk)
+
+        return archive_hash.hexdigest()
+
+    def _private_directory(self) -> Path:
+        return self._cache_location / f"{_PRIVATE_DIRECTORY_PREFIX}{uuid.uuid4().hex}"
+
+    @staticmethod
+    def _mark_as_used(directory: Path) -> None:
+        try:
+            os.utime(directory)
+        except FileNotFoundError:
+            # the entry was dropped by another process in the meantime
+            pass
+
+    def _entries(self) -> List[Path]:
+        return [
+            path
+            for path in self._cache_location.glob("*")
+            if path.is_dir() and not path.name.startswith(_PRIVATE_DIRECTORY_PREFIX)
+        ]
+
+    def _drop_least_recently_used_entries(self, keep: Path) -> None:
+        entries, sizes = [], {}
+        for entry in self._entries():
+            try:
+                last_used = entry.stat().st_mtime
+                sizes[entry] = rasa.utils.common.directory_size_in_mb(entry)
+            except FileNotFoundError:
+                # the entry was dropped by another process in the meantime
+                continue
+            entries.append((last_used, entry))
+
+        cache_size = sum(sizes.values())
+
+        for _, entry in sorted(entries):
+            if cache_size <= self._max_cache_size:
+                break
+            if entry == keep:
+                continue
+
+            self._drop_entry(entry)
+            cache_size -= sizes[entry]
+
+    def _drop_entry(self, entry: Path) -> None:
+        removed = self._private_directory()
+        try:
+            entry.rename(removed)
+        except OSError:
+            # the entry was dropped by another process in the meantime
+            return
+
+        shutil.rmtree(removed, ignore_errors=True)
+        logger.debug(f"Deleted extracted model '{entry.name}' to free space.")
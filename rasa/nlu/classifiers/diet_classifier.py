@@ -931,6 +931,74 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
         model_data = self._create_model_data([message], training=False)
         return self.model.run_inference(model_data)
 
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, Union[np.ndarray, Dict[Text, Any]]]]]:
+        """Runs the model for several messages at once.
+
+        The messages are run in batches which are at most as large as the largest
+        configured batch size.
+
+        Args:
+            messages: The messages which should be predicted.
+
+        Returns:
+            For every message the same output as `_predict` returns for it.
+        """
+        if (
+            self.model is None
+            or len(messages) < 2
+            # diagnostic data isn't split up by message
+            or self._execution_context.should_add_diagnostic_data
+        ):
+            return [self._predict(message) for message in messages]
+
+        batch_sizes = self.component_config[BATCH_SIZES]
+        max_batch_size = (
+            max(batch_sizes) if isinstance(batch_sizes, list) else batch_sizes
+        )
+
+        outputs = []
+        for start in range(0, len(messages), max_batch_size):
+            batch = messages[start : start + max_batch_size]
+            model_data = self._create_model_data(batch, training=False)
+            batch_out = self.model.run_inference(model_data, batch_size=len(batch))
+            sequence_lengths = model_data.get(TEXT, SEQUENCE_LENGTH)
+            outputs.extend(
+                self._output_for_message(batch_out, index, sequence_lengths)
+                for index in range(len(batch))
+            )
+        return outputs
+
+    @staticmethod
+    def _output_for_message(
+        batch_out: Dict[Text, Union[np.ndarray, Dict[Text, Any]]],
+        index: int,
+        sequence_lengths: List[FeatureArray],
+    ) -> Dict[Text, np.ndarray]:
+        """Extracts the output for one message from the output for a batch.
+
+        The sequences of the batch are padded to the longest sequence. The entity
+        predictions are cut to the length they have if the message is predicted on
+        its own, so that the padding doesn't affect the extracted entities.
+        """
+        out = {}
+        for key, value in batch_out.items():
+            if not isinstance(value, np.ndarray):
+                continue
+
+            value = value[index : index + 1]
+            if key.startswith("e_") and sequence_lengths:
+                # the predictions might contain further positions after the
+                # sequence (e.g. for the sentence features)
+                lengths = sequence_lengths[0]
+                number_of_extra_positions = value.shape[1] - max(lengths)
+                value = value[:, : lengths[index] + number_of_extra_positions]
+
+            out[key] = value
+
+        return out
+
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
@@ -999,9 +1067,7 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
 
     def process(self, messages: List[Message]) -> List[Message]:
         """Augments the message with intents, entities, and diagnostic data."""
-        for message in messages:
-            out = self._predict(message)
-
+        for message, out in zip(messages, self._predict_batch(messages)):
             if self.component_config[INTENT_CLASSIFICATION]:
                 label, label_ranking = self._predict_label(out)
 
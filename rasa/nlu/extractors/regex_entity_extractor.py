@@ -1,7 +1,6 @@
 from __future__ import annotations
 import logging
-import re
-from typing import Any, Dict, List, Optional, Text
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple
 
 from rasa.engine.graph import GraphComponent, ExecutionContext
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe
@@ -73,7 +72,7 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         config: Dict[Text, Any],
         model_storage: ModelStorage,
         resource: Resource,
-        patterns: Optional[List[Dict[Text, Text]]] = None,
+        patterns: Optional[List[Dict[Text, Any]]] = None,
     ) -> None:
         """Creates a new instance.
 
@@ -92,6 +91,15 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         # extractor
         self.case_sensitive = self._config["case_sensitive"]
         self.patterns = patterns or []
+        self._pattern_matchers = self._create_pattern_matchers()
+
+    def _create_pattern_matchers(self) -> List[Callable[[Text], List[Tuple[int, int]]]]:
+        return [
+            pattern_utils.create_pattern_matcher(
+                pattern, self.case_sensitive, self._config["use_word_boundaries"]
+            )
+            for pattern in self.patterns
+        ]
 
     def train(self, training_data: TrainingData) -> Resource:
         """Extract patterns from the training data.
@@ -104,8 +112,8 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
             use_lookup_tables=self._config["use_lookup_tables"],
             use_regexes=self._config["use_regexes"],
             use_only_entities=True,
-            use_word_boundaries=self._config["use_word_boundaries"],
         )
+        self._pattern_matchers = self._create_pattern_matchers()
 
         if not self.patterns:
             rasa.shared.utils.io.raise_warning(
@@ -159,17 +167,8 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         """
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-            matches = list(matches)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        for pattern, find_matches in zip(self.patterns, self._pattern_matchers):
+            for start_index, end_index in find_matches(message.get(TEXT)):
                 entities.append(
                     {
                         ENTITY_ATTRIBUTE_TYPE: pattern["name"],
@@ -16,6 +16,7 @@ import rasa.shared.utils.io
 import rasa.core.utils
 from rasa.nlu.tokenizers.tokenizer import Token, Tokenizer
 from rasa.nlu.featurizers.dense_featurizer.dense_featurizer import DenseFeaturizer
+from rasa.nlu.featurizers.dense_featurizer.embedding_cache import EmbeddingCache
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.constants import (
@@ -70,6 +71,13 @@ class ConveRTFeaturizer(DenseFeaturizer, GraphComponent):
             **DenseFeaturizer.get_default_config(),
             # Remote URL/Local path to model files
             "model_url": None,
+            # number of texts whose embeddings are kept in memory to not compute
+            # them again if the same text is featurized again (`0` disables it)
+            "embeddings_cache_size": 0,
+            # an optional path to a directory in which the embeddings of all
+            # training examples are cached, so that retraining only has to
+            # compute the embeddings of new training examples
+            "embeddings_cache_dir": None,
         }
 
     @staticmethod
@@ -103,7 +111,7 @@ class ConveRTFeaturizer(DenseFeaturizer, GraphComponent):
             name: An identifier for this featurizer.
             config: The configuration.
         """
-        super().__init__(name=name, config=config)
+        super().__init__(name=name, config={**self.get_default_config(), **config})
 
         model_url = self._config["model_url"]
         self.model_url = (
@@ -124,6 +132,10 @@ class ConveRTFeaturizer(DenseFeaturizer, GraphComponent):
             "default", self.module
         )
 
+        self._embedding_cache = EmbeddingCache(
+            self._config["embeddings_cache_size"], self._config["embeddings_cache_dir"]
+        )
+
     @classmethod
     def validate_config(cls, config: Dict[Text, Any]) -> None:
         """Validates that the component is configured properly."""
@@ -236,6 +248,66 @@ class ConveRTFeaturizer(DenseFeaturizer, GraphComponent):
         return module.signatures[signature]
 
     def _compute_features(
+        self,
+        batch_examples: List[Message],
+        attribute: Text = TEXT,
+        inference_mode: bool = False,
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        sequence_features: List[Optional[np.ndarray]] = [None] * len(batch_examples)
+        sentence_features: List[Optional[np.ndarray]] = [None] * len(batch_examples)
+
+        cache_keys = []
+        if self._embedding_cache.is_enabled:
+            cache_keys = [
+                self._embedding_cache_key(example, attribute)
+                for example in batch_examples
+            ]
+            for index, cache_key in enumerate(cache_keys):
+                cached_embeddings = self._embedding_cache.get(cache_key)
+                if cached_embeddings is not None:
+                    (
+                        sequence_features[index],
+                        sentence_features[index],
+                    ) = cached_embeddings
+
+        uncached_indices = [
+            index
+            for index, features in enumerate(sequence_features)
+            if features is None
+        ]
+        if not uncached_indices:
+            return sequence_features, sentence_features
+
+        (
+            uncached_sequence_features,
+            uncached_sentence_features,
+        ) = self._compute_model_features(
+            [batch_examples[index] for index in uncached_indices], attribute
+        )
+        for features_index, index in enumerate(uncached_indices):
+            sequence_features[index] = uncached_sequence_features[features_index]
+            sentence_features[index] = uncached_sentence_features[features_index]
+            if self._embedding_cache.is_enabled:
+                self._embedding_cache.add(
+                    cache_keys[index],
+                    sequence_features[index],
+                    sentence_features[index],
+                    on_disk=not inference_mode,
+                )
+
+        return sequence_features, sentence_features
+
+    def _embedding_cache_key(self, example: Message, attribute: Text) -> Text:
+        # the sentence embeddings are computed from the text, the sequence embeddings
+        # from the tokens
+        return EmbeddingCache.key(
+            self.model_url,
+            attribute,
+            example.get(attribute),
+            self._tokens_to_text([example.get(TOKENS_NAMES[attribute])])[0],
+        )
+
+    def _compute_model_features(
         self, batch_examples: List[Message], attribute: Text = TEXT
     ) -> Tuple[np.ndarray, np.ndarray]:
         sentence_encodings = self._compute_sentence_encodings(batch_examples, attribute)
@@ -377,6 +449,10 @@ class ConveRTFeaturizer(DenseFeaturizer, GraphComponent):
                     batch_sentence_features,
                     attribute,
                 )
+
+        self._embedding_cache.persist()
+        self._embedding_cache.log_hit_rate()
+
         return training_data
 
     def process(self, messages: List[Message]) -> List[Message]:
@@ -389,7 +465,7 @@ class ConveRTFeaturizer(DenseFeaturizer, GraphComponent):
             for attribute in {TEXT, ACTION_TEXT}:
                 if message.get(attribute):
                     sequence_features, sentence_features = self._compute_features(
-                        [message], attribute=attribute
+                        [message], attribute=attribute, inference_mode=True
                     )
 
                     self._set_features(
@@ -400,8 +476,8 @@ class ConveRTFeaturizer(DenseFeaturizer, GraphComponent):
     def _set_features(
         self,
         examples: List[Message],
-        sequence_features: np.ndarray,
-        sentence_features: np.ndarray,
+        sequence_features: List[np.ndarray],
+        sentence_features: List[np.ndarray],
         attribute: Text,
     ) -> None:
         for index, example in enumerate(examples):
@@ -0,0 +1,244 @@
+import contextlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Generator, List, Optional, Text, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+import rasa.shared.utils.io
+
+logger = logging.getLogger(__name__)
+
+Embeddings = Tuple[np.ndarray, np.ndarray]
+
+
+class EmbeddingCache:
+    """Caches the sequence and sentence embeddings which a language model computed.
+
+    The most recently used embeddings are kept in memory. If a directory is given,
+    all embeddings are additionally stored on disk, so that e.g. a retraining only
+    has to compute the embeddings of new training examples. Embeddings on disk are
+    appended to a single file which is memory-mapped for reading. Several processes
+    can share the same directory, as they lock it while they write to it. A cache
+    can be used by several threads at the same time (e.g. when components are run
+    in a pool of worker threads).
+    """
+
+    DATA_FILE_NAME = "embeddings.bin"
+    INDEX_FILE_NAME = "index.json"
+    LOCK_FILE_NAME = ".lock"
+
+    def __init__(
+        self, max_entries_in_memory: int = 1000, directory: Optional[Text] = None
+    ) -> None:
+        """Creates the cache.
+
+        Args:
+            max_entries_in_memory: Maximum number of embeddings which are kept in
+                memory. `0` disables the in-memory cache.
+            directory: Directory in which the embeddings are stored on disk. `None`
+                disables the on-disk cache.
+        """
+        self._max_entries_in_memory = max_entries_in_memory
+        self._in_memory: "OrderedDict[Text, Embeddings]" = OrderedDict()
+        # guards the cached embeddings and the statistics against concurrent access
+        # by other threads
+        self._thread_lock = threading.Lock()
+
+        self._directory = Path(directory) if directory else None
+        # maps keys to the offset, the number of rows and the number of columns of
+        # the embeddings in the data file
+        self._index: Dict[Text, List[int]] = {}
+        self._data_file: Optional[BinaryIO] = None
+        self._mapped_data: Optional[np.memmap] = None
+        if self._directory:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            with self._locked():
+                self._index = self._read_index()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: Any) -> Text:
+        """Creates the key under which embeddings are cached.
+
+        Args:
+            parts: JSON serializable values which determine the embeddings, e.g. the
+                name of the model and the text which is embedded.
+
+        Returns:
+            The key.
+        """
+        return rasa.shared.utils.io.get_text_hash(json.dumps(parts))
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether any embeddings are cached."""
+        return self._max_entries_in_memory > 0 or self._directory is not None
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the lookups which found cached embeddings."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Text) -> Optional[Embeddings]:
+        """Gets cached embeddings.
+
+        Args:
+            key: The key of the embeddings (see `key`).
+
+        Returns:
+            Copies of the sequence and sentence embeddings or `None` if they are not
+            cached.
+        """
+        with self._thread_lock:
+            embeddings = self._in_memory.get(key)
+            if embeddings is not None:
+                self._in_memory.move_to_end(key)
+            elif key in self._index:
+                embeddings = self._read_from_disk(key)
+                self._add_to_memory(key, embeddings)
+
+            if embeddings is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        sequence_embeddings, sentence_embeddings = embeddings
+        return sequence_embeddings.copy(), sentence_embeddings.copy()
+
+    def add(
+        self,
+        key: Text,
+        sequence_embeddings: np.ndarray,
+        sentence_embeddings: np.ndarray,
+        on_disk: bool = True,
+    ) -> None:
+        """Caches embeddings.
+
+        Args:
+            key: The key of the embeddings (see `key`).
+            sequence_embeddings: The sequence embeddings.
+            sentence_embeddings: The sentence embeddings.
+            on_disk: Whether the embeddings should also be stored in the on-disk
+                cache (if there is one).
+        """
+        embeddings = (sequence_embeddings.copy(), sentence_embeddings.copy())
+        with self._thread_lock:
+            self._add_to_memory(key, embeddings)
+            if on_disk and self._directory and key not in self._index:
+                self._write_to_disk(key, embeddings)
+
+    def _add_to_memory(self, key: Text, embeddings: Embeddings) -> None:
+        if self._max_entries_in_memory <= 0:
+            return
+
+        self._in_memory[key] = embeddings
+        self._in_memory.move_to_end(key)
+        while len(self._in_memory) > self._max_entries_in_memory:
+            self._in_memory.popitem(last=False)
+
+    def _read_index(self) -> Dict[Text, List[int]]:
+        index_file = self._directory / self.INDEX_FILE_NAME
+        data_file = self._directory / self.DATA_FILE_NAME
+        if not index_file.exists() or not data_file.exists():
+            return {}
+
+        # ignore entries whose data was not completely written
+        number_of_values = data_file.stat().st_size // np.float32().itemsize
+        return {
+            key: location
+            for key, location in rasa.shared.utils.io.read_json_file(index_file).items()
+            if location[0] + location[1] * location[2] <= number_of_values
+        }
+
+    def _write_to_disk(self, key: Text, embeddings: Embeddings) -> None:
+        sequence_embeddings, sentence_embeddings = embeddings
+        # the sentence embeddings are stored as last row of the sequence embeddings
+        rows = np.concatenate(
+            [
+                np.reshape(sequence_embeddings, (-1, sentence_embeddings.shape[-1])),
+                np.reshape(sentence_embeddings, (1, -1)),
+            ]
+        ).astype(np.float32)
+
+        if self._data_file is None:
+            self._data_file = open(self._directory / self.DATA_FILE_NAME, "ab")
+        # other processes might append to the data file at the same time
+        with self._locked():
+            offset = self._data_file.seek(0, os.SEEK_END) // rows.itemsize
+            self._data_file.write(rows.tobytes())
+            self._data_file.flush()
+        self._index[key] = [offset, rows.shape[0], rows.shape[1]]
+
+    def _read_from_disk(self, key: Text) -> Embeddings:
+        offset, number_of_rows, number_of_columns = self._index[key]
+        end = offset + number_of_rows * number_of_columns
+
+        if self._mapped_data is None or self._mapped_data.shape[0] < end:
+            # the embeddings were added after the file was mapped
+            self._mapped_data = np.memmap(
+                self._directory / self.DATA_FILE_NAME, dtype=np.float32, mode="r"
+            )
+
+        rows = np.reshape(
+            self._mapped_data[offset:end], (number_of_rows, number_of_columns)
+        )
+        return np.array(rows[:-1]), np.array(rows[-1:])
+
+    def persist(self) -> None:
+        """Writes the embeddings which were added to the on-disk cache to disk."""
+        with self._thread_lock:
+            if self._data_file is None:
+                return
+
+            self._data_file.close()
+            self._data_file = None
+
+            with self._locked():
+                # other processes might have added embeddings in the meantime
+                self._index = {**self._read_index(), **self._index}
+                rasa.shared.utils.io.dump_obj_as_json_to_file(
+                    self._directory / self.INDEX_FILE_NAME, self._index
+                )
+
+    @contextlib.contextmanager
+    def _locked(self) -> Generator[None, None, None]:
+        """Locks the on-disk cache against concurrent access by other processes."""
+        with open(self._directory / self.LOCK_FILE_NAME, "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def log_hit_rate(self) -> None:
+        """Logs how many lookups found cached embeddings."""
+        if self.is_enabled:
+            logger.info(
+                f"Found cached embeddings for {self.hits} of "
+                f"{self.hits + self.misses} texts (hit rate {self.hit_rate:.1%})."
+            )
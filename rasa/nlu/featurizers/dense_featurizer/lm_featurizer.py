@@ -2,13 +2,14 @@ from __future__ import annotations
 import numpy as np
 import logging
 
-from typing import Any, Text, List, Dict, Tuple, Type
+from typing import Any, Text, List, Dict, Optional, Tuple, Type
 
 from rasa.engine.graph import ExecutionContext, GraphComponent
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.nlu.featurizers.dense_featurizer.dense_featurizer import DenseFeaturizer
+from rasa.nlu.featurizers.dense_featurizer.embedding_cache import EmbeddingCache
 from rasa.nlu.tokenizers.tokenizer import Token, Tokenizer
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
@@ -65,6 +66,9 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
         )
         self._load_model_metadata()
         self._load_model_instance()
+        self._embedding_cache = EmbeddingCache(
+            self._config["embeddings_cache_size"], self._config["embeddings_cache_dir"]
+        )
 
     @staticmethod
     def get_default_config() -> Dict[Text, Any]:
@@ -78,6 +82,17 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             # an optional path to a specific directory to download
             # and cache the pre-trained model weights.
             "cache_dir": None,
+            # number of texts whose embeddings are kept in memory to not compute
+            # them again if the same text is featurized again (`0` disables it)
+            "embeddings_cache_size": 0,
+            # an optional path to a directory in which the embeddings of all
+            # training examples are cached, so that retraining only has to
+            # compute the embeddings of new training examples
+            "embeddings_cache_dir": None,
+            # maximum number of (sub-)tokens, including padding and special tokens,
+            # which are fed to the language model in one batch when featurizing
+            # training data
+            "batch_token_budget": 4096,
         }
 
     @classmethod
@@ -681,26 +696,142 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
         batch_tokens, batch_token_ids = self._get_token_ids_for_batch(
             batch_examples, attribute
         )
+        return self._get_docs_for_tokenized_batch(
+            batch_examples, batch_tokens, batch_token_ids, attribute, inference_mode
+        )
+
+    def _get_docs_for_tokenized_batch(
+        self,
+        batch_examples: List[Message],
+        batch_tokens: List[List[Token]],
+        batch_token_ids: List[List[int]],
+        attribute: Text,
+        inference_mode: bool = False,
+    ) -> List[Dict[Text, Any]]:
+        """Computes language model docs for all examples in an already tokenized batch.
+
+        Args:
+            batch_examples: Batch of message objects for which language model docs
+            need to be computed.
+            batch_tokens: List of token strings for each example in the batch.
+            batch_token_ids: List of token ids for each example in the batch.
+            attribute: Property of message to be processed, one of ``TEXT`` or
+            ``RESPONSE``.
+            inference_mode: Whether the call is during inference or during training.
+
+        Returns:
+            List of language model docs for each message in batch.
+        """
+        # A doc consists of
+        # {'sequence_features': ..., 'sentence_features': ...}
+        batch_docs: List[Optional[Dict[Text, Any]]] = [None] * len(batch_examples)
+        cache_keys = []
+        if self._embedding_cache.is_enabled:
+            cache_keys = [
+                self._embedding_cache_key(tokens, token_ids, attribute, inference_mode)
+                for tokens, token_ids in zip(batch_tokens, batch_token_ids)
+            ]
+            for index, cache_key in enumerate(cache_keys):
+                cached_embeddings = self._embedding_cache.get(cache_key)
+                if cached_embeddings is not None:
+                    batch_docs[index] = {
+                        SEQUENCE_FEATURES: cached_embeddings[0],
+                        SENTENCE_FEATURES: cached_embeddings[1],
+                    }
+
+        uncached_indices = [
+            index for index, doc in enumerate(batch_docs) if doc is None
+        ]
+        if not uncached_indices:
+            return batch_docs
 
         (
             batch_sentence_features,
             batch_sequence_features,
         ) = self._get_model_features_for_batch(
-            batch_token_ids, batch_tokens, batch_examples, attribute, inference_mode
+            [batch_token_ids[index] for index in uncached_indices],
+            [batch_tokens[index] for index in uncached_indices],
+            [batch_examples[index] for index in uncached_indices],
+            attribute,
+            inference_mode,
         )
 
-        # A doc consists of
-        # {'sequence_features': ..., 'sentence_features': ...}
-        batch_docs = []
-        for index in range(len(batch_examples)):
+        for features_index, index in enumerate(uncached_indices):
             doc = {
-                SEQUENCE_FEATURES: batch_sequence_features[index],
-                SENTENCE_FEATURES: np.reshape(batch_sentence_features[index], (1, -1)),
+                SEQUENCE_FEATURES: batch_sequence_features[features_index],
+                SENTENCE_FEATURES: np.reshape(
+                    batch_sentence_features[features_index], (1, -1)
+                ),
             }
-            batch_docs.append(doc)
+            batch_docs[index] = doc
+            if self._embedding_cache.is_enabled:
+                self._embedding_cache.add(
+                    cache_keys[index],
+                    doc[SEQUENCE_FEATURES],
+                    doc[SENTENCE_FEATURES],
+                    on_disk=not inference_mode,
+                )
 
         return batch_docs
 
+    def _embedding_cache_key(
+        self,
+        tokens: List[Token],
+        token_ids: List[int],
+        attribute: Text,
+        inference_mode: bool,
+    ) -> Text:
+        # the embeddings are determined by the ids of the (sub-)tokens which are
+        # passed to the model and how the sub-tokens are aligned with the tokens.
+        # Too long sequences are only truncated in inference mode.
+        return EmbeddingCache.key(
+            self.model_name,
+            self.model_weights,
+            attribute,
+            token_ids,
+            [token.get(NUMBER_OF_SUB_TOKENS) for token in tokens],
+            inference_mode,
+        )
+
+    @staticmethod
+    def _create_length_bucketed_batches(
+        sequence_lengths: List[int], batch_token_budget: int
+    ) -> List[List[int]]:
+        """Groups examples of similar length into batches.
+
+        All sequences of a batch are padded to the length of its longest sequence.
+        Batching the examples in the order of their lengths minimizes this padding.
+        Each batch contains as many examples as fit into the token budget, so that
+        batches of short examples are larger than batches of long examples.
+
+        Args:
+            sequence_lengths: Number of (sub-)tokens of each example, including the
+                special tokens of the language model.
+            batch_token_budget: Maximum number of tokens including padding per batch.
+                An example which is longer than the budget gets its own batch.
+
+        Returns:
+            The indices of the examples in each batch.
+        """
+        sorted_indices = sorted(
+            range(len(sequence_lengths)), key=lambda index: sequence_lengths[index]
+        )
+
+        batches = []
+        batch: List[int] = []
+        for index in sorted_indices:
+            # the examples are sorted, so the current one is the longest in the batch
+            padded_batch_size = (len(batch) + 1) * sequence_lengths[index]
+            if batch and padded_batch_size > batch_token_budget:
+                batches.append(batch)
+                batch = []
+            batch.append(index)
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
     def process_training_data(self, training_data: TrainingData,) -> TrainingData:
         """Computes tokens and dense features for each message in training data.
 
@@ -708,31 +839,44 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             training_data: NLU training data to be tokenized and featurized
             config: NLU pipeline config consisting of all components.
         """
-        batch_size = 64
-
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
 
             non_empty_examples = list(
                 filter(lambda x: x.get(attribute), training_data.training_examples)
             )
 
-            batch_start_index = 0
-
-            while batch_start_index < len(non_empty_examples):
+            all_tokens, all_token_ids = self._get_token_ids_for_batch(
+                non_empty_examples, attribute
+            )
 
-                batch_end_index = min(
-                    batch_start_index + batch_size, len(non_empty_examples)
-                )
-                # Collect batch examples
-                batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+            # the language model receives the sequences with its special tokens
+            number_of_special_tokens = len(
+                self._add_lm_specific_special_tokens([[]])[0]
+            )
+            batches = self._create_length_bucketed_batches(
+                [
+                    len(token_ids) + number_of_special_tokens
+                    for token_ids in all_token_ids
+                ],
+                self._config["batch_token_budget"],
+            )
+            for batch_indices in batches:
+                batch_messages = [non_empty_examples[index] for index in batch_indices]
 
                 # Construct a doc with relevant features
                 # extracted(tokens, dense_features)
-                batch_docs = self._get_docs_for_batch(batch_messages, attribute)
+                batch_docs = self._get_docs_for_tokenized_batch(
+                    batch_messages,
+                    [all_tokens[index] for index in batch_indices],
+                    [all_token_ids[index] for index in batch_indices],
+                    attribute,
+                )
+
+                for doc, example in zip(batch_docs, batch_messages):
+                    self._set_lm_features(doc, example, attribute)
 
-                for index, ex in enumerate(batch_messages):
-                    self._set_lm_features(batch_docs[index], ex, attribute)
-                batch_start_index += batch_size
+        self._embedding_cache.persist()
+        self._embedding_cache.log_hit_rate()
 
         return training_data
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import logging
 import re
+import numpy as np
 import scipy.sparse
 from typing import Any, Dict, List, Optional, Text, Tuple, Set, Type
 from rasa.nlu.tokenizers.tokenizer import Tokenizer
@@ -553,45 +554,128 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
-        if not self.vectorizers.get(attribute):
-            return [None], [None]
-
-        sequence_features = []
-        sentence_features = []
+        """Creates the features for the tokens of multiple messages.
 
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        The tokens of all messages are transformed with a single call of the
+        vectorizer. The resulting matrix is split into the sequence features of the
+        single messages afterwards.
 
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        Args:
+            attribute: The attribute of the messages.
+            all_tokens: The processed tokens of the attribute of every message.
 
-            seq_vec = self.vectorizers[attribute].transform(tokens)
-            seq_vec.sort_indices()
+        Returns:
+            Sequence and sentence features for every message (`None` if the message
+            has no tokens for the attribute).
+        """
+        sequence_features = [None] * len(all_tokens)
+        sentence_features = [None] * len(all_tokens)
 
-            sequence_features.append(seq_vec.tocoo())
+        if not self.vectorizers.get(attribute):
+            return sequence_features, sentence_features
+
+        # attribute is not set for some messages (e.g. response not present)
+        featurized_messages = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not featurized_messages:
+            return sequence_features, sentence_features
+
+        message_tokens = [all_tokens[i] for i in featurized_messages]
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features], every token is a sample
+        sequence_matrix = self.vectorizers[attribute].transform(
+            [token for tokens in message_tokens for token in tokens]
+        )
+        sequence_matrix.sort_indices()
+        token_offsets = np.cumsum([0] + [len(tokens) for tokens in message_tokens])
 
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
-                sentence_vec.sort_indices()
+        sentence_matrix = None
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            sentence_matrix = self._create_sentence_features(
+                attribute, message_tokens, sequence_matrix, token_offsets
+            )
 
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+        for i, features in zip(
+            featurized_messages, self._split_rows(sequence_matrix, token_offsets)
+        ):
+            sequence_features[i] = features
+        if sentence_matrix is not None:
+            for i, features in zip(
+                featurized_messages,
+                self._split_rows(
+                    sentence_matrix, np.arange(len(featurized_messages) + 1)
+                ),
+            ):
+                sentence_features[i] = features
 
         return sequence_features, sentence_features
 
+    def _create_sentence_features(
+        self,
+        attribute: Text,
+        message_tokens: List[List[Text]],
+        sequence_matrix: scipy.sparse.csr_matrix,
+        token_offsets: np.ndarray,
+    ) -> scipy.sparse.csr_matrix:
+        if self._are_sentence_features_sums_of_token_features():
+            # sum up the rows of the tokens of each message
+            number_of_tokens = token_offsets[-1]
+            message_token_indicators = scipy.sparse.csr_matrix(
+                (
+                    np.ones(number_of_tokens, dtype=sequence_matrix.dtype),
+                    np.arange(number_of_tokens),
+                    token_offsets,
+                ),
+                shape=(len(message_tokens), number_of_tokens),
+            )
+            sentence_matrix = message_token_indicators @ sequence_matrix
+        else:
+            # n-grams can span multiple tokens, hence the joined tokens have to be
+            # transformed
+            sentence_matrix = self.vectorizers[attribute].transform(
+                [" ".join(tokens) for tokens in message_tokens]
+            )
+        sentence_matrix.sort_indices()
+        return sentence_matrix
+
+    def _are_sentence_features_sums_of_token_features(self) -> bool:
+        # `char_wb` n-grams are created separately for every word and word n-grams
+        # only consist of a single word in this case
+        return self.analyzer == "char_wb" or (
+            self.analyzer == "word" and self.max_ngram == 1
+        )
+
+    @staticmethod
+    def _split_rows(
+        matrix: scipy.sparse.csr_matrix, row_offsets: np.ndarray
+    ) -> List[scipy.sparse.coo_matrix]:
+        """Splits a matrix into consecutive blocks of rows.
+
+        Args:
+            matrix: The matrix with sorted indices.
+            row_offsets: The first row of every block followed by the number of rows.
+
+        Returns:
+            The blocks of rows.
+        """
+        # the entries of the COO matrix are ordered by rows
+        coo_matrix = matrix.tocoo()
+        blocks = []
+        for start, end in zip(row_offsets[:-1], row_offsets[1:]):
+            data_start, data_end = matrix.indptr[start], matrix.indptr[end]
+            blocks.append(
+                scipy.sparse.coo_matrix(
+                    (
+                        coo_matrix.data[data_start:data_end],
+                        (
+                            coo_matrix.row[data_start:data_end] - start,
+                            coo_matrix.col[data_start:data_end],
+                        ),
+                    ),
+                    shape=(end - start, matrix.shape[1]),
+                )
+            )
+        return blocks
+
     def _get_featurized_attribute(
         self, attribute: Text, all_tokens: List[List[Text]]
     ) -> Tuple[
@@ -660,20 +744,20 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             )
             return messages
 
-        for message in messages:
-            for attribute in self._attributes:
-
-                message_tokens = self._get_processed_message_tokens_by_attribute(
-                    message, attribute
-                )
+        for attribute in self._attributes:
+            all_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
 
-                # features shape (1, seq, dim)
-                sequence_features, sentence_features = self._create_features(
-                    attribute, [message_tokens]
-                )
-                self.add_features_to_message(
-                    sequence_features[0], sentence_features[0], attribute, message
-                )
+            # features shape (1, seq, dim) for every message
+            sequence_features, sentence_features = self._create_features(
+                attribute, all_tokens
+            )
+            for message, sequence, sentence in zip(
+                messages, sequence_features, sentence_features
+            ):
+                self.add_features_to_message(sequence, sentence, attribute, message)
 
         return messages
 
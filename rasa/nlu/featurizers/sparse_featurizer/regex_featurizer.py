@@ -1,7 +1,6 @@
 from __future__ import annotations
 import logging
-import re
-from typing import Any, Dict, List, Optional, Text, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Type
 import numpy as np
 import scipy.sparse
 from rasa.nlu.tokenizers.tokenizer import Tokenizer
@@ -58,7 +57,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         model_storage: ModelStorage,
         resource: Resource,
         execution_context: ExecutionContext,
-        known_patterns: Optional[List[Dict[Text, Text]]] = None,
+        known_patterns: Optional[List[Dict[Text, Any]]] = None,
     ) -> None:
         """Constructs new features for regexes and lookup table using regex expressions.
 
@@ -69,7 +68,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             resource: Resource locator for this component which can be used to persist
                 and load itself from the `model_storage`.
             execution_context: Information about the current graph run.
-            known_patterns: Regex Patterns the component should pre-load itself with.
+            known_patterns: Patterns the component should pre-load itself with.
         """
         super().__init__(execution_context.node_name, config)
 
@@ -79,6 +78,15 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = config["case_sensitive"]
         self.finetune_mode = execution_context.is_finetuning
+        self._pattern_matchers = self._create_pattern_matchers()
+
+    def _create_pattern_matchers(self) -> List[Callable[[Text], List[Tuple[int, int]]]]:
+        return [
+            pattern_utils.create_pattern_matcher(
+                pattern, self.case_sensitive, self._config["use_word_boundaries"]
+            )
+            for pattern in self.known_patterns
+        ]
 
     @classmethod
     def create(
@@ -91,7 +99,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         """Creates a new untrained component (see parent class for full docstring)."""
         return cls(config, model_storage, resource, execution_context)
 
-    def _merge_new_patterns(self, new_patterns: List[Dict[Text, Text]]) -> None:
+    def _merge_new_patterns(self, new_patterns: List[Dict[Text, Any]]) -> None:
         """Updates already known patterns with new patterns extracted from data.
 
         New patterns should always be added to the end of the existing
@@ -110,9 +118,9 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # Some patterns may have just new examples added
             # to them. These do not count as additional pattern.
             if new_pattern_name in pattern_name_index_map:
-                self.known_patterns[pattern_name_index_map[new_pattern_name]][
-                    "pattern"
-                ] = extra_pattern["pattern"]
+                self.known_patterns[
+                    pattern_name_index_map[new_pattern_name]
+                ] = extra_pattern
             else:
                 self.known_patterns.append(extra_pattern)
 
@@ -122,13 +130,13 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             training_data,
             use_lookup_tables=self._config["use_lookup_tables"],
             use_regexes=self._config["use_regexes"],
-            use_word_boundaries=self._config["use_word_boundaries"],
         )
         if self.finetune_mode:
             # Merge patterns extracted from data with known patterns
             self._merge_new_patterns(patterns_from_data)
         else:
             self.known_patterns = patterns_from_data
+        self._pattern_matchers = self._create_pattern_matchers()
 
         self._persist()
         return self._resource
@@ -195,10 +203,6 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
         sequence_length = len(tokens)
 
         num_patterns = len(self.known_patterns)
@@ -206,18 +210,17 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         sequence_features = np.zeros([sequence_length, num_patterns])
         sentence_features = np.zeros([1, num_patterns])
 
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = re.finditer(
-                pattern["pattern"], message.get(attribute), flags=flags
-            )
-            matches = list(matches)
+        for pattern_index, (pattern, find_matches) in enumerate(
+            zip(self.known_patterns, self._pattern_matchers)
+        ):
+            matches = find_matches(message.get(attribute))
 
             for token_index, t in enumerate(tokens):
                 patterns = t.get("pattern", default={})
                 patterns[pattern["name"]] = False
 
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
+                for match_start, match_end in matches:
+                    if t.start < match_end and t.end > match_start:
                         patterns[pattern["name"]] = True
                         sequence_features[token_index][pattern_index] = 1.0
                         if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
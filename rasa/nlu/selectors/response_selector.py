@@ -529,8 +529,7 @@ class ResponseSelector(DIETClassifier):
             List containing the message augmented with the most likely response,
             the associated intent_response_key and its similarity to the input.
         """
-        for message in messages:
-            out = self._predict(message)
+        for message, out in zip(messages, self._predict_batch(messages)):
             top_label, label_ranking = self._predict_label(out)
 
             # Get the exact intent_response_key and the associated
@@ -1,38 +1,56 @@
 import re
-from typing import Dict, List, Text, Union
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Set, Text, Tuple, Union
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.exceptions import InvalidConfigException
 
 
-def _convert_lookup_tables_to_regex(
-    training_data: TrainingData,
-    use_only_entities: bool = False,
-    use_word_boundaries: bool = True,
-) -> List[Dict[Text, Text]]:
-    r"""Convert the lookup tables from the training data to regex patterns.
+# key of patterns which are matched using a `LookupTableMatcher`
+LOOKUP_ELEMENTS_KEY = "elements"
+
+_WORD_BOUNDARY = re.compile(r"\b")
+
+# matchers which are currently used by any component, indexed by their patterns
+_pattern_matchers: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _convert_lookup_tables_to_patterns(
+    training_data: TrainingData, use_only_entities: bool = False,
+) -> List[Dict[Text, Any]]:
+    """Convert the lookup tables from the training data to lookup patterns.
 
     Args:
         training_data: The training data.
         use_only_entities: If True only regex features with a name equal to a entity
           are considered.
-        use_word_boundaries: If True add `\b` around the regex expression
-          for each lookup table expressions.
 
     Returns:
-        A list of regex patterns.
+        A list of patterns containing the elements of the lookup tables.
     """
     patterns = []
     for table in training_data.lookup_tables:
         if use_only_entities and table["name"] not in training_data.entities:
             continue
-        regex_pattern = _generate_lookup_regex(table, use_word_boundaries)
-        lookup_regex = {"name": table["name"], "pattern": regex_pattern}
-        patterns.append(lookup_regex)
+        patterns.append(
+            {"name": table["name"], LOOKUP_ELEMENTS_KEY: _lookup_table_elements(table)}
+        )
     return patterns
 
 
+def _lookup_table_elements(
+    lookup_table: Dict[Text, Union[Text, List[Text]]]
+) -> List[Text]:
+    lookup_elements = lookup_table["elements"]
+
+    # if it's a list, it should be the elements directly
+    if isinstance(lookup_elements, list):
+        return lookup_elements
+    # otherwise it's a file path.
+    return read_lookup_table_file(lookup_elements)
+
+
 def _generate_lookup_regex(
     lookup_table: Dict[Text, Union[Text, List[Text]]], use_word_boundaries: bool = True
 ) -> Text:
@@ -48,14 +66,7 @@ def _generate_lookup_regex(
     Returns:
         The regex pattern.
     """
-    lookup_elements = lookup_table["elements"]
-
-    # if it's a list, it should be the elements directly
-    if isinstance(lookup_elements, list):
-        elements_to_regex = lookup_elements
-    # otherwise it's a file path.
-    else:
-        elements_to_regex = read_lookup_table_file(lookup_elements)
+    elements_to_regex = _lookup_table_elements(lookup_table)
 
     # sanitize the regex, escape special characters
     elements_sanitized = [re.escape(e) for e in elements_to_regex]
@@ -121,12 +132,13 @@ def extract_patterns(
     use_lookup_tables: bool = True,
     use_regexes: bool = True,
     use_only_entities: bool = False,
-    use_word_boundaries: bool = True,
-) -> List[Dict[Text, Text]]:
-    r"""Extract a list of patterns from the training data.
+) -> List[Dict[Text, Any]]:
+    """Extract a list of patterns from the training data.
 
     The patterns are constructed using the regex features and lookup tables defined
-    in the training data.
+    in the training data. Patterns of regex features contain the regex (`pattern`)
+    and patterns of lookup tables contain the elements of the lookup table
+    (`elements`). Use `create_pattern_matcher` to find the matches of a pattern.
 
     Args:
         training_data: The training data.
@@ -134,11 +146,9 @@ def extract_patterns(
           equal to a entity are considered.
         use_regexes: Boolean indicating whether to use regex features or not.
         use_lookup_tables: Boolean indicating whether to use lookup tables or not.
-        use_word_boundaries: Boolean indicating whether to use `\b` around the lookup
-            table regex expressions
 
     Returns:
-        The list of regex patterns.
+        The list of patterns.
     """
     if not training_data.lookup_tables and not training_data.regex_features:
         return []
@@ -147,12 +157,6 @@ def extract_patterns(
 
     if use_regexes:
         patterns.extend(_collect_regex_features(training_data, use_only_entities))
-    if use_lookup_tables:
-        patterns.extend(
-            _convert_lookup_tables_to_regex(
-                training_data, use_only_entities, use_word_boundaries
-            )
-        )
 
     # validate regexes, raise Error when invalid
     for pattern in patterns:
@@ -165,4 +169,179 @@ def extract_patterns(
                 f"training data configuration at {pattern}."
             )
 
+    if use_lookup_tables:
+        patterns.extend(
+            _convert_lookup_tables_to_patterns(training_data, use_only_entities)
+        )
+
     return patterns
+
+
+def create_pattern_matcher(
+    pattern: Dict[Text, Any], case_sensitive: bool, use_word_boundaries: bool = True
+) -> Callable[[Text], List[Tuple[int, int]]]:
+    r"""Creates a function which finds the matches of a pattern in a text.
+
+    Matchers are shared between all components which use the same pattern, e.g. a
+    `RegexFeaturizer` and a `RegexEntityExtractor` of the same model. Hence every
+    regex is only compiled once and kept compiled as long as any component uses it.
+
+    Args:
+        pattern: A pattern as returned by `extract_patterns`.
+        case_sensitive: Whether the pattern should be matched case sensitive.
+        use_word_boundaries: Whether elements of lookup tables only match if there
+            are word boundaries (`\b`) on either side of them.
+
+    Returns:
+        A function which returns the start and end of every match in a text.
+    """
+    if LOOKUP_ELEMENTS_KEY in pattern:
+        key = (
+            LOOKUP_ELEMENTS_KEY,
+            tuple(pattern[LOOKUP_ELEMENTS_KEY]),
+            case_sensitive,
+            use_word_boundaries,
+        )
+    else:
+        key = ("pattern", pattern["pattern"], case_sensitive)
+
+    matcher = _pattern_matchers.get(key)
+    if matcher is None:
+        if LOOKUP_ELEMENTS_KEY in pattern:
+            matcher = LookupTableMatcher(
+                pattern[LOOKUP_ELEMENTS_KEY], case_sensitive, use_word_boundaries
+            )
+        else:
+            matcher = RegexMatcher(pattern["pattern"], case_sensitive)
+        _pattern_matchers[key] = matcher
+
+    return matcher.find
+
+
+class RegexMatcher:
+    """Finds the matches of a compiled regex in texts."""
+
+    def __init__(self, pattern: Text, case_sensitive: bool = True) -> None:
+        """Compiles the regex.
+
+        Args:
+            pattern: The regex.
+            case_sensitive: Whether the regex should be matched case sensitive.
+        """
+        self._regex = re.compile(pattern, flags=0 if case_sensitive else re.IGNORECASE)
+
+    def find(self, text: Text) -> List[Tuple[int, int]]:
+        """Finds the matches of the regex in a text.
+
+        Args:
+            text: The text.
+
+        Returns:
+            The start and end of every match.
+        """
+        return [match.span() for match in self._regex.finditer(text)]
+
+
+class LookupTableMatcher:
+    """Finds the elements of a lookup table in texts.
+
+    The matches are the same as the ones of a regex which is the alternation of all
+    elements (see `_generate_lookup_regex`): matches don't overlap, the leftmost
+    match wins, and if multiple elements match at the same position the element
+    which comes first in the lookup table wins. Instead of trying every element at
+    every position of the text, only the substrings which have the length of an
+    element are looked up. Hence finding the matches doesn't depend on the number
+    of elements and no huge regex has to be compiled.
+    """
+
+    def __init__(
+        self,
+        elements: List[Text],
+        case_sensitive: bool = True,
+        use_word_boundaries: bool = True,
+    ) -> None:
+        """Creates the matcher.
+
+        Args:
+            elements: The elements of the lookup table.
+            case_sensitive: Whether the elements should be matched case sensitive.
+            use_word_boundaries: Whether elements only match if there are word
+                boundaries on either side of them.
+        """
+        self._case_sensitive = case_sensitive
+        self._use_word_boundaries = use_word_boundaries
+
+        self._element_indices: Dict[Text, int] = {}
+        for index, element in enumerate(elements):
+            if element:
+                self._element_indices.setdefault(self._normalize(element), index)
+        self._element_lengths = sorted(
+            {len(element) for element in self._element_indices}
+        )
+
+    def _normalize(self, text: Text) -> Text:
+        if self._case_sensitive:
+            return text
+
+        lowercased = text.lower()
+        if len(lowercased) == len(text):
+            return lowercased
+        # some characters (e.g. "İ") have lowercase forms with multiple characters,
+        # only their first character is kept to not shift the positions of matches
+        return "".join(character.lower()[0] for character in text)
+
+    def find(self, text: Text) -> List[Tuple[int, int]]:
+        """Finds the elements of the lookup table in a text.
+
+        Args:
+            text: The text.
+
+        Returns:
+            The start and end of every match.
+        """
+        if not self._element_indices:
+            return []
+
+        normalized = self._normalize(text)
+        if self._use_word_boundaries:
+            # matches have to start and end at word boundaries
+            word_boundaries = [
+                boundary.start() for boundary in _WORD_BOUNDARY.finditer(text)
+            ]
+            starts = word_boundaries
+            ends = set(word_boundaries)
+        else:
+            starts = range(len(text))
+            ends = None
+
+        matches = []
+        end_of_last_match = 0
+        for start in starts:
+            if start < end_of_last_match:
+                continue
+
+            end = self._end_of_match(normalized, start, ends)
+            if end is not None:
+                matches.append((start, end))
+                end_of_last_match = end
+
+        return matches
+
+    def _end_of_match(
+        self, text: Text, start: int, ends: Optional[Set[int]]
+    ) -> Optional[int]:
+        best_index = None
+        best_end = None
+        for length in self._element_lengths:
+            end = start + length
+            if end > len(text):
+                break
+            if ends is not None and end not in ends:
+                continue
+
+            index = self._element_indices.get(text[start:end])
+            if index is not None and (best_index is None or index < best_index):
+                best_index = index
+                best_end = end
+
+        return best_end
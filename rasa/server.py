@@ -54,11 +54,13 @@ from rasa.shared.constants import (
 )
 from rasa.shared.core.domain import InvalidDomain, Domain
 from rasa.core.agent import Agent
+from rasa.engine.exceptions import GraphRunQueueFull
 from rasa.core.channels.channel import (
     CollectingOutputChannel,
     OutputChannel,
     UserMessage,
 )
+from rasa.shared.core import event_codec
 import rasa.shared.core.events
 from rasa.shared.core.events import Event
 from rasa.core.test import test
@@ -166,10 +168,12 @@ def ensure_conversation_exists() -> Callable[["SanicView"], "SanicView"]:
 
     def decorator(f: "SanicView") -> "SanicView":
         @wraps(f)
-        def decorated(request: Request, *args: Any, **kwargs: Any) -> "SanicResponse":
+        async def decorated(
+            request: Request, *args: Any, **kwargs: Any
+        ) -> "SanicResponse":
             conversation_id = kwargs["conversation_id"]
-            if request.app.agent.tracker_store.exists(conversation_id):
-                return f(request, *args, **kwargs)
+            if await request.app.agent.tracker_store.exists_async(conversation_id):
+                return await f(request, *args, **kwargs)
             else:
                 raise ErrorResponse(
                     HTTPStatus.NOT_FOUND, "Not found", "Conversation ID not found."
@@ -286,7 +290,7 @@ def event_verbosity_parameter(
         )
 
 
-def get_test_stories(
+async def get_test_stories(
     processor: "MessageProcessor",
     conversation_id: Text,
     until_time: Optional[float],
@@ -306,9 +310,11 @@ def get_test_stories(
         The stories for `conversation_id` in test format.
     """
     if fetch_all_sessions:
-        trackers = processor.get_trackers_for_all_conversation_sessions(conversation_id)
+        trackers = await processor.get_trackers_for_all_conversation_sessions(
+            conversation_id
+        )
     else:
-        trackers = [processor.get_tracker(conversation_id)]
+        trackers = [await processor.get_tracker(conversation_id)]
 
     if until_time is not None:
         trackers = [tracker.travel_back_in_time(until_time) for tracker in trackers]
@@ -353,7 +359,7 @@ async def update_conversation_with_events(
         The tracker for `conversation_id` with the updated events.
     """
     if rasa.shared.core.events.do_events_begin_with_session_start(events):
-        tracker = processor.get_tracker(conversation_id)
+        tracker = await processor.get_tracker(conversation_id)
     else:
         tracker = await processor.fetch_tracker_with_initial_session(conversation_id)
 
@@ -689,6 +695,7 @@ def create_app(
                 "model_file": app.agent.processor.model_filename,
                 "model_id": app.agent.model_id,
                 "num_active_training_jobs": app.active_training_processes.value,
+                "batching_metrics": app.agent.graph_executor.batching_metrics.as_dict(),
             }
         )
 
@@ -709,7 +716,7 @@ def create_app(
                 tracker = tracker.travel_back_in_time(until_time)
 
             state = tracker.current_state(verbosity)
-            return response.json(state)
+            return response.json(state, dumps=event_codec.dumps)
         except Exception as e:
             logger.debug(traceback.format_exc())
             raise ErrorResponse(
@@ -745,9 +752,11 @@ def create_app(
                         events, tracker, output_channel
                     )
 
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
-            return response.json(tracker.current_state(verbosity))
+            return response.json(
+                tracker.current_state(verbosity), dumps=event_codec.dumps
+            )
         except Exception as e:
             logger.debug(traceback.format_exc())
             raise ErrorResponse(
@@ -795,9 +804,11 @@ def create_app(
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
-            return response.json(tracker.current_state(verbosity))
+            return response.json(
+                tracker.current_state(verbosity), dumps=event_codec.dumps
+            )
         except Exception as e:
             logger.debug(traceback.format_exc())
             raise ErrorResponse(
@@ -818,7 +829,7 @@ def create_app(
         )
 
         try:
-            stories = get_test_stories(
+            stories = await get_test_stories(
                 app.agent.processor,
                 conversation_id,
                 until_time,
@@ -892,7 +903,7 @@ def create_app(
         if isinstance(output_channel, CollectingOutputChannel):
             response_body["messages"] = output_channel.messages
 
-        return response.json(response_body)
+        return response.json(response_body, dumps=event_codec.dumps)
 
     @app.post("/conversations/<conversation_id:path>/trigger_intent")
     @requires_auth(app, auth_token)
@@ -950,7 +961,7 @@ def create_app(
         if isinstance(output_channel, CollectingOutputChannel):
             response_body["messages"] = output_channel.messages
 
-        return response.json(response_body)
+        return response.json(response_body, dumps=event_codec.dumps)
 
     @app.post("/conversations/<conversation_id:path>/predict")
     @requires_auth(app, auth_token)
@@ -1011,9 +1022,11 @@ def create_app(
                 tracker = await app.agent.processor.run_action_extract_slots(
                     user_message.output_channel, tracker
                 )
-                app.agent.processor.save_tracker(tracker)
+                await app.agent.processor.save_tracker(tracker)
 
-            return response.json(tracker.current_state(verbosity))
+            return response.json(
+                tracker.current_state(verbosity), dumps=event_codec.dumps
+            )
         except Exception as e:
             logger.debug(traceback.format_exc())
             raise ErrorResponse(
@@ -1259,9 +1272,13 @@ def create_app(
             )
 
         try:
-            result = app.agent.predict_next_with_tracker(tracker, verbosity)
+            result = await app.agent.predict_next_with_tracker(tracker, verbosity)
 
             return response.json(result)
+        except GraphRunQueueFull as e:
+            raise ErrorResponse(
+                HTTPStatus.SERVICE_UNAVAILABLE, "ServiceUnavailable", str(e)
+            )
         except Exception as e:
             logger.debug(traceback.format_exc())
             raise ErrorResponse(
@@ -1286,6 +1303,8 @@ def create_app(
             data = emulator.normalise_request_json(request.json)
             try:
                 parsed_data = await app.agent.parse_message(data.get("text"))
+            except GraphRunQueueFull:
+                raise
             except Exception as e:
                 logger.debug(traceback.format_exc())
                 raise ErrorResponse(
@@ -1297,6 +1316,10 @@ def create_app(
 
             return response.json(response_data)
 
+        except GraphRunQueueFull as e:
+            raise ErrorResponse(
+                HTTPStatus.SERVICE_UNAVAILABLE, "ServiceUnavailable", str(e)
+            )
         except Exception as e:
             logger.debug(traceback.format_exc())
             raise ErrorResponse(
@@ -1333,7 +1356,9 @@ def create_app(
             endpoints=endpoints,
         )
         new_agent.lock_store = app.agent.lock_store
+        previous_agent = app.agent
         app.agent = new_agent
+        await previous_agent.close(successor=new_agent)
 
         logger.debug(f"Successfully loaded model '{model_path}'.")
         return response.json(None, status=HTTPStatus.NO_CONTENT)
@@ -1343,7 +1368,9 @@ def create_app(
     async def unload_model(request: Request) -> HTTPResponse:
         model_file = app.agent.model_name
 
-        app.agent = Agent(lock_store=app.agent.lock_store)
+        previous_agent = app.agent
+        app.agent = Agent(lock_store=previous_agent.lock_store)
+        await previous_agent.close(successor=app.agent)
 
         logger.debug(f"Successfully unloaded model '{model_file}'.")
         return response.json(None, status=HTTPStatus.NO_CONTENT)
@@ -274,9 +274,7 @@ class Domain:
         combined = self.as_dict()
 
         if override:
-            config = domain_dict["config"]
-            for key, val in config.items():
-                combined["config"][key] = val
+            combined["config"] = {**combined["config"], **domain_dict["config"]}
 
         if override or self.session_config == SessionConfig.default():
             combined[SESSION_CONFIG_KEY] = domain_dict[SESSION_CONFIG_KEY]
@@ -286,9 +284,11 @@ class Domain:
                 combined[KEY_INTENTS], domain_dict[KEY_INTENTS], override
             )
         # remove existing forms from new actions
-        for form in combined[KEY_FORMS]:
-            if form in domain_dict[KEY_ACTIONS]:
-                domain_dict[KEY_ACTIONS].remove(form)
+        domain_dict[KEY_ACTIONS] = [
+            action
+            for action in domain_dict[KEY_ACTIONS]
+            if action not in combined[KEY_FORMS]
+        ]
 
         for key in [KEY_ENTITIES, KEY_ACTIONS, KEY_E2E_ACTIONS]:
             combined[key] = self.merge_lists(combined[key], domain_dict[key])
@@ -763,6 +763,25 @@ class Domain:
         self.store_entities_as_slots = store_entities_as_slots
         self._check_domain_sanity()
 
+    def __copy__(self) -> "Domain":
+        """Enables making a shallow copy of the `Domain` using `copy.copy`.
+
+        Values which are derived lazily from the attributes (e.g. the fingerprint)
+        are not copied as the attributes of the copy might be changed.
+
+        Returns:
+            A shallow copy of the current domain.
+        """
+        domain = self.__class__.__new__(self.__class__)
+        domain.__dict__.update(
+            {
+                key: value
+                for key, value in self.__dict__.items()
+                if not key.startswith("_lazy_")
+            }
+        )
+        return domain
+
     def __deepcopy__(self, memo: Optional[Dict[int, Any]]) -> "Domain":
         """Enables making a deep copy of the `Domain` using `copy.deepcopy`.
 
@@ -841,6 +860,10 @@ class Domain:
         Returns:
             fingerprint of the domain
         """
+        return self._fingerprint
+
+    @rasa.shared.utils.common.lazy_property
+    def _fingerprint(self) -> Text:
         self_as_dict = self.as_dict()
         self_as_dict[
             KEY_INTENTS
@@ -1298,25 +1321,28 @@ class Domain:
         states = []
         last_ml_action_sub_state = None
         turn_was_hidden = False
-        for tr, hide_rule_turn in tracker.generate_all_prior_trackers():
+        for prior_state in tracker.generate_all_prior_states(
+            self, omit_unset_slots=omit_unset_slots
+        ):
             if ignore_rule_only_turns:
                 # remember previous ml action based on the last non hidden turn
                 # we need this to override previous action in the ml state
                 if not turn_was_hidden:
-                    last_ml_action_sub_state = self._get_prev_action_sub_state(tr)
+                    last_ml_action_sub_state = prior_state.latest_action
 
                 # followup action or happy path loop prediction
                 # don't change the fact whether dialogue turn should be hidden
                 if (
-                    not tr.followup_action
-                    and not tr.latest_action_name == tr.active_loop_name
+                    not prior_state.followup_action
+                    and not prior_state.latest_action_name
+                    == prior_state.active_loop_name
                 ):
-                    turn_was_hidden = hide_rule_turn
+                    turn_was_hidden = prior_state.hide_rule_turn
 
                 if turn_was_hidden:
                     continue
 
-            state = self.get_active_state(tr, omit_unset_slots=omit_unset_slots)
+            state = prior_state.state
 
             if ignore_rule_only_turns:
                 # clean state from only rule features
@@ -1327,11 +1353,13 @@ class Domain:
                     self._substitute_rule_only_user_input(state, states[-1])
                 # substitute previous rule action with last_ml_action_sub_state
                 if last_ml_action_sub_state:
-                    state[
-                        rasa.shared.core.constants.PREVIOUS_ACTION
-                    ] = last_ml_action_sub_state
+                    state[rasa.shared.core.constants.PREVIOUS_ACTION] = dict(
+                        last_ml_action_sub_state
+                    )
+
+                state = self._clean_state(state)
 
-            states.append(self._clean_state(state))
+            states.append(state)
 
         return states
 
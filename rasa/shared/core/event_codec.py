@@ -0,0 +1,85 @@
+"""Serializes events and tracker states as JSON.
+
+The fastest installed JSON library is used: `orjson` if it's installed and `ujson`
+otherwise. Objects which these libraries can't serialize (e.g. integers which don't
+fit into 64 bits) are serialized using the `json` module of the standard library.
+"""
+import json
+import logging
+from typing import Any, Callable, Text, Tuple, Union
+
+from rasa.shared.core.events import Event
+from rasa.shared.utils.io import DEFAULT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+
+def _json_library() -> Tuple[
+    Text, Callable[[Any], Text], Callable[[Union[Text, bytes]], Any]
+]:
+    try:
+        import orjson
+
+        def orjson_dumps(obj: Any) -> Text:
+            return orjson.dumps(obj).decode(DEFAULT_ENCODING)
+
+        return "orjson", orjson_dumps, orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+
+        def ujson_dumps(obj: Any) -> Text:
+            return ujson.dumps(obj, escape_forward_slashes=False)
+
+        return "ujson", ujson_dumps, ujson.loads
+    except ImportError:
+        pass
+
+    return "json", json.dumps, json.loads
+
+
+JSON_LIBRARY, _dumps, _loads = _json_library()
+
+
+def dumps(obj: Any) -> Text:
+    """Serializes an object as JSON.
+
+    Args:
+        obj: The object, e.g. a serialized event or tracker state.
+
+    Returns:
+        The object as JSON string.
+    """
+    try:
+        return _dumps(obj)
+    except (TypeError, ValueError, OverflowError):
+        logger.debug(
+            f"Failed to serialize object using '{JSON_LIBRARY}'. Using 'json' instead."
+        )
+        return json.dumps(obj)
+
+
+def loads(serialised: Union[Text, bytes]) -> Any:
+    """Deserializes a JSON string.
+
+    Args:
+        serialised: The JSON string.
+
+    Returns:
+        The deserialized object.
+    """
+    return _loads(serialised)
+
+
+def serialise_event(event: Event) -> Text:
+    """Serializes an event as JSON.
+
+    Args:
+        event: The event.
+
+    Returns:
+        The event as JSON string.
+    """
+    return dumps(event.as_dict())
@@ -49,6 +49,9 @@ ExtractorConfig = namedtuple(
 class TrackerWithCachedStates(DialogueStateTracker):
     """A tracker wrapper that caches the state creation of the tracker."""
 
+    # states are already cached in frozen form in `_states_for_hashing`
+    cache_prior_states = False
+
     def __init__(
         self,
         sender_id: Text,
@@ -1,5 +1,7 @@
 import copy
+import itertools
 import logging
+import operator
 import os
 import time
 from collections import deque
@@ -15,9 +17,11 @@ from typing import (
     List,
     Deque,
     Iterable,
+    Set,
     Union,
     FrozenSet,
     Tuple,
+    NamedTuple,
     TYPE_CHECKING,
 )
 
@@ -108,6 +112,165 @@ class EventVerbosity(Enum):
     ALL = 4
 
 
+class PriorTrackerState(NamedTuple):
+    """State of a tracker right before one of its actions was executed."""
+
+    state: State
+    hide_rule_turn: bool
+    followup_action: Optional[Text]
+    latest_action: Dict[Text, Text]
+    latest_action_name: Optional[Text]
+    active_loop_name: Optional[Text]
+
+
+class PriorStatesCache:
+    """Incrementally computed states of all prior trackers of a tracker.
+
+    Instead of replaying the whole conversation for every prediction, the cache
+    keeps a tracker which was updated with all events seen so far and only replays
+    the events which were added since the last update.
+    """
+
+    def __init__(
+        self,
+        tracker: "DialogueStateTracker",
+        domain: Domain,
+        omit_unset_slots: bool = False,
+    ) -> None:
+        """Creates an empty cache.
+
+        Args:
+            tracker: The tracker whose prior states should be cached.
+            domain: The domain which is used to create the states.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+        """
+        self.domain = domain
+        self.omit_unset_slots = omit_unset_slots
+        # always use a plain tracker to replay the events so that subclasses with
+        # custom `update` logic don't do any additional work
+        self._prior_tracker = DialogueStateTracker.init_copy(tracker)
+        self._replayed_events: List[Event] = []
+        self._prior_states: List[PriorTrackerState] = []
+        self._number_of_seen_events = 0
+        self._last_seen_event: Optional[Event] = None
+        self._loop_names: Set[Text] = set()
+
+    def is_valid_for(self, domain: Domain, omit_unset_slots: bool) -> bool:
+        """Checks whether the cached states were created with the same settings."""
+        return self.domain is domain and self.omit_unset_slots == omit_unset_slots
+
+    def update(self, tracker: "DialogueStateTracker") -> bool:
+        """Replays the events which were applied since the last update.
+
+        Args:
+            tracker: The tracker whose prior states are cached.
+
+        Returns:
+            `False` if the cached events are not a prefix of the tracker's applied
+            events anymore (e.g. because events were reverted) and the cache has to
+            be rebuilt.
+        """
+        new_events = self._events_added_since_last_update(tracker)
+
+        if new_events is not None and self._are_applied_without_rewinding(new_events):
+            # new events are simply appended to the applied events
+            applied_events = self._replayed_events + new_events
+        else:
+            applied_events = tracker.applied_events()
+            self._loop_names = {
+                event.name
+                for event in tracker.events
+                if isinstance(event, ActiveLoop) and event.name
+            }
+
+        number_of_replayed_events = len(self._replayed_events)
+        if len(applied_events) < number_of_replayed_events or not all(
+            map(operator.is_, self._replayed_events, applied_events)
+        ):
+            return False
+
+        for event in applied_events[number_of_replayed_events:]:
+            if isinstance(event, ActionExecuted):
+                self._prior_states.append(
+                    self._current_prior_state(event.hide_rule_turn)
+                )
+            self._prior_tracker.update(event)
+
+        self._replayed_events = applied_events
+        self._number_of_seen_events = len(tracker.events)
+        self._last_seen_event = tracker.events[-1] if tracker.events else None
+        return True
+
+    def _events_added_since_last_update(
+        self, tracker: "DialogueStateTracker"
+    ) -> Optional[List[Event]]:
+        """Returns the events which were appended to the tracker since the last update.
+
+        Returns `None` if the events were not only appended, e.g. because older events
+        were dropped due to the `max_event_history` of the tracker.
+        """
+        events = tracker.events
+        number_of_seen_events = self._number_of_seen_events
+        if (
+            not number_of_seen_events
+            or len(events) < number_of_seen_events
+            or events[number_of_seen_events - 1] is not self._last_seen_event
+            or (events.maxlen is not None and len(events) >= events.maxlen)
+        ):
+            return None
+
+        return [events[idx] for idx in range(number_of_seen_events, len(events))]
+
+    def _are_applied_without_rewinding(self, new_events: List[Event]) -> bool:
+        """Checks whether `new_events` keep all previously applied events applied.
+
+        See `DialogueStateTracker.applied_events` for the events which rewind the
+        applied events.
+        """
+        for event in new_events:
+            if isinstance(
+                event,
+                (Restarted, SessionStarted, ActionReverted, UserUtteranceReverted),
+            ):
+                return False
+            if isinstance(event, ActiveLoop) and event.name:
+                return False
+            if isinstance(event, ActionExecuted) and event.action_name in (
+                self._loop_names
+            ):
+                return False
+
+        return True
+
+    def _current_prior_state(self, hide_rule_turn: bool) -> PriorTrackerState:
+        tracker = self._prior_tracker
+        return PriorTrackerState(
+            state=self.domain.get_active_state(
+                tracker, omit_unset_slots=self.omit_unset_slots
+            ),
+            hide_rule_turn=hide_rule_turn,
+            followup_action=tracker.followup_action,
+            latest_action=tracker.latest_action,
+            latest_action_name=tracker.latest_action_name,
+            active_loop_name=tracker.active_loop_name,
+        )
+
+    def prior_states(self) -> List[PriorTrackerState]:
+        """Returns the state before each action and the current state of the tracker.
+
+        The states are copied so that callers can modify them without corrupting
+        the cache.
+        """
+        return [
+            PriorTrackerState(_copy_state(prior_state.state), *prior_state[1:])
+            for prior_state in self._prior_states
+        ] + [self._current_prior_state(hide_rule_turn=False)]
+
+
+def _copy_state(state: State) -> State:
+    return {state_type: dict(sub_state) for state_type, sub_state in state.items()}
+
+
 class AnySlotDict(dict):
     """A slot dictionary that pretends every slot exists, by creating slots on demand.
 
@@ -128,6 +291,10 @@ class DialogueStateTracker:
     The field max_event_history will only give you these last events,
     it can be set in the tracker_store"""
 
+    # whether the states of prior trackers are kept between calls of
+    # `generate_all_prior_states`
+    cache_prior_states = True
+
     @classmethod
     def from_dict(
         cls,
@@ -223,6 +390,11 @@ class DialogueStateTracker:
 
         # Optional model_id to add to all events.
         self.model_id: Optional[Text] = None
+        # incrementally updated states of the prior trackers
+        self._prior_states_cache: Optional[PriorStatesCache] = None
+        # watermark of the events which are stored in a tracker store
+        self._has_persisted_events_watermark = False
+        self._last_persisted_event: Optional[Event] = None
 
     ###
     # Public tracker interface
@@ -467,6 +639,72 @@ class DialogueStateTracker:
 
         yield tracker, False
 
+    def generate_all_prior_states(
+        self, domain: Domain, omit_unset_slots: bool = False
+    ) -> List[PriorTrackerState]:
+        """Returns the states of all prior trackers of this tracker.
+
+        This is equivalent to creating the active state for every tracker of
+        `generate_all_prior_trackers`. The states are cached and only the states for
+        new events are computed when this is called again, e.g. by multiple policies
+        during a single prediction or in the next turn of the conversation.
+
+        Args:
+            domain: The domain which is used to create the states.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+
+        Returns:
+            The state before each action and the current state of the tracker.
+        """
+        cache = self._prior_states_cache
+        if (
+            cache is None
+            or not cache.is_valid_for(domain, omit_unset_slots)
+            or not cache.update(self)
+        ):
+            cache = PriorStatesCache(self, domain, omit_unset_slots)
+            cache.update(self)
+
+        if self.cache_prior_states:
+            self._prior_states_cache = cache
+
+        return cache.prior_states()
+
+    def mark_events_as_persisted(self) -> None:
+        """Marks the current events as stored in the tracker store.
+
+        Tracker stores call this when they retrieved or saved the tracker, so that
+        they don't have to query the stored events when the tracker is saved the next
+        time (see `events_since_persisted_events`).
+        """
+        self._has_persisted_events_watermark = True
+        self._last_persisted_event = self.events[-1] if self.events else None
+
+    def events_since_persisted_events(self) -> Optional[List[Event]]:
+        """Returns the events which were added since the events were last persisted.
+
+        Returns:
+            The new events or `None` if it's unknown which events are persisted, e.g.
+            because the tracker wasn't retrieved from a tracker store or because the
+            last persisted event was dropped due to the `max_event_history`.
+        """
+        if not self._has_persisted_events_watermark:
+            return None
+
+        if self._last_persisted_event is None:
+            return list(self.events)
+
+        # the watermark is usually close to the end of the events
+        for index in reversed(range(len(self.events))):
+            if self.events[index] is self._last_persisted_event:
+                return list(itertools.islice(self.events, index + 1, len(self.events)))
+
+        return None
+
+    def clear_prior_states_cache(self) -> None:
+        """Removes the cached states of the prior trackers."""
+        self._prior_states_cache = None
+
     def applied_events(self) -> List[Event]:
         """Returns all actions that should be applied - w/o reverted events.
 
@@ -647,6 +885,11 @@ class DialogueStateTracker:
         if self.model_id and METADATA_MODEL_ID not in event.metadata:
             event.metadata = {**event.metadata, METADATA_MODEL_ID: self.model_id}
 
+        if isinstance(
+            event, (ActionReverted, UserUtteranceReverted, Restarted, SessionStarted)
+        ):
+            self.clear_prior_states_cache()
+
         self.events.append(event)
         event.apply_to(self)
 
@@ -1,3 +1,4 @@
+import copy
 from functools import reduce
 from typing import Text, Optional, List, Dict, Set, Any, Tuple
 import logging
@@ -296,7 +297,14 @@ class ResponsesSyncImporter(TrainingDataImporter):
     @rasa.shared.utils.common.cached_method
     def get_domain(self) -> Domain:
         """Merge existing domain with properties of retrieval intents in NLU data."""
-        existing_domain = self._importer.get_domain()
+        # the intent properties of the existing domain are updated in place below,
+        # hence a copy is used to not change the domain of the wrapped importer after
+        # its fingerprint was computed. Only the intent properties are copied as a
+        # deep copy would create the domain (and warnings about its slots) again.
+        existing_domain = copy.copy(self._importer.get_domain())
+        existing_domain.intent_properties = copy.deepcopy(
+            existing_domain.intent_properties
+        )
         existing_nlu_data = self._importer.get_nlu_data()
 
         # Merge responses from NLU data with responses in the domain.
@@ -1,3 +1,4 @@
+import asyncio
 import ssl
 
 import aiohttp
@@ -15,6 +16,15 @@ from rasa.constants import DEFAULT_REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# maximum number of simultaneous connections to an endpoint
+DEFAULT_CONNECTION_LIMIT = 100
+# maximum number of simultaneous connections to the same host (0 means no limit)
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+# time in seconds for which idle connections are kept open to be reused
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+# time in seconds for which resolved host names are cached
+DEFAULT_DNS_CACHE_TTL = 10
+
 
 def read_endpoint_config(
     filename: Text, endpoint_type: Text
@@ -83,9 +93,34 @@ class EndpointConfig:
         token: Optional[Text] = None,
         token_name: Text = "token",
         cafile: Optional[Text] = None,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
         **kwargs: Any,
     ) -> None:
-        """Creates an `EndpointConfig` instance."""
+        """Creates an `EndpointConfig` instance.
+
+        Args:
+            url: URL of the endpoint.
+            params: Query parameters which are added to every request.
+            headers: Headers which are added to every request.
+            basic_auth: `username` and `password` for basic authentication.
+            token: Authentication token which is added as query parameter.
+            token_name: Name of the query parameter of the authentication token.
+            cafile: Path to a file with certificates to verify the endpoint.
+            request_timeout: Default timeout in seconds of a request. It can be
+                overridden per request by passing `timeout` to `request`.
+            connection_limit: Maximum number of simultaneous connections.
+            connection_limit_per_host: Maximum number of simultaneous connections to
+                the same host. `0` means that there is no limit.
+            keepalive_timeout: Time in seconds for which idle connections are kept
+                open to be reused by subsequent requests.
+            dns_cache_ttl: Time in seconds for which resolved host names are cached.
+                `None` caches them forever.
+            kwargs: Additional configuration, e.g. for tracker stores.
+        """
         self.url = url
         self.params = params or {}
         self.headers = headers or {}
@@ -94,10 +129,23 @@ class EndpointConfig:
         self.token_name = token_name
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.cafile = cafile
+        self.request_timeout = float(request_timeout)
+        self.connection_limit = int(connection_limit)
+        self.connection_limit_per_host = int(connection_limit_per_host)
+        self.keepalive_timeout = float(keepalive_timeout)
+        self.dns_cache_ttl = dns_cache_ttl
         self.kwargs = kwargs
 
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._pooled_session: Optional[aiohttp.ClientSession] = None
+        self._pooled_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def session(self) -> aiohttp.ClientSession:
-        """Creates and returns a configured aiohttp client session."""
+        """Creates and returns a configured aiohttp client session.
+
+        The caller is responsible for closing the session. Use `pooled_session`
+        to reuse the connections of previous requests instead.
+        """
         # create authentication parameters
         if self.basic_auth:
             auth = aiohttp.BasicAuth(
@@ -106,12 +154,76 @@ class EndpointConfig:
         else:
             auth = None
 
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+
         return aiohttp.ClientSession(
             headers=self.headers,
             auth=auth,
-            timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
         )
 
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Returns the session which is shared by all requests to this endpoint.
+
+        The session keeps connections to the endpoint open, so that subsequent
+        requests don't have to establish a new connection. It's created lazily in
+        the running event loop and replaced if it was closed or belongs to another
+        event loop. Use `close` to close it instead of closing it directly.
+
+        Returns:
+            The shared session.
+        """
+        loop = asyncio.get_event_loop()
+        if (
+            self._pooled_session is None
+            or self._pooled_session.closed
+            or self._pooled_session_loop is not loop
+        ):
+            self._pooled_session = self.session()
+            self._pooled_session_loop = loop
+
+        return self._pooled_session
+
+    async def close(self) -> None:
+        """Closes the shared session and its connections to the endpoint."""
+        session = self._pooled_session
+        self._pooled_session = None
+
+        if session is None or session.closed:
+            return
+
+        if self._pooled_session_loop is not asyncio.get_event_loop():
+            # the connections can only be closed in the event loop of the session
+            logger.debug(
+                f"Couldn't close the session of the endpoint '{self.url}' as it was "
+                f"created in another event loop."
+            )
+            return
+
+        await session.close()
+
+    def _get_ssl_context(self) -> Optional[ssl.SSLContext]:
+        if not self.cafile:
+            return None
+
+        if self._ssl_context is None:
+            try:
+                self._ssl_context = ssl.create_default_context(cafile=self.cafile)
+            except FileNotFoundError as e:
+                raise FileNotFoundException(
+                    f"Failed to find certificate file, "
+                    f"'{os.path.abspath(self.cafile)}' does not exist."
+                ) from e
+
+        return self._ssl_context
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -136,7 +248,8 @@ class EndpointConfig:
     ) -> Optional[Any]:
         """Send a HTTP request to the endpoint. Return json response, if available.
 
-        All additional arguments will get passed through
+        The request reuses the connections of previous requests to the endpoint
+        (see `pooled_session`). All additional arguments will get passed through
         to aiohttp's `session.request`."""
 
         # create the appropriate headers
@@ -150,39 +263,31 @@ class EndpointConfig:
 
         url = concat_url(self.url, subpath)
 
-        sslcontext = None
-        if self.cafile:
+        sslcontext = self._get_ssl_context()
+
+        async with self.pooled_session().request(
+            method,
+            url,
+            headers=headers,
+            params=self.combine_parameters(kwargs),
+            ssl=sslcontext,
+            **kwargs,
+        ) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status, response.reason, await response.content.read()
+                )
             try:
-                sslcontext = ssl.create_default_context(cafile=self.cafile)
-            except FileNotFoundError as e:
-                raise FileNotFoundException(
-                    f"Failed to find certificate file, "
-                    f"'{os.path.abspath(self.cafile)}' does not exist."
-                ) from e
-
-        async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                ssl=sslcontext,
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status, response.reason, await response.content.read()
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data: Dict[Text, Any]) -> "EndpointConfig":
         return EndpointConfig(**data)
 
     def copy(self) -> "EndpointConfig":
+        """Copies the configuration. The copy doesn't share the pooled session."""
         return EndpointConfig(
             self.url,
             self.params,
@@ -190,6 +295,12 @@ class EndpointConfig:
             self.basic_auth,
             self.token,
             self.token_name,
+            self.cafile,
+            self.request_timeout,
+            self.connection_limit,
+            self.connection_limit_per_host,
+            self.keepalive_timeout,
+            self.dns_cache_ttl,
             **self.kwargs,
         )
 
@@ -231,6 +231,11 @@ class RasaModel(TmpKerasModel):
     def _dynamic_signature(
         batch_in: Union[Tuple[tf.Tensor], Tuple[np.ndarray]]
     ) -> List[List[tf.TensorSpec]]:
+        """Creates an input signature which only fixes the last dimension of inputs.
+
+        Batch size and sequence lengths are left undefined, so that the prediction
+        function is traced once and not for every new shape of its inputs.
+        """
         element_spec = []
         for tensor in batch_in:
             if len(tensor.shape) > 1:
@@ -277,7 +282,7 @@ class RasaModel(TmpKerasModel):
 
         # Once we take advantage of TF's distributed training, this is where
         # scheduled functions will be forced to execute and return actual values.
-        outputs = tf_utils.sync_to_numpy_or_python_type(self.predict_step(batch_in))
+        outputs = tf_utils.sync_to_numpy_or_python_type(self._tf_predict_step(batch_in))
         if DIAGNOSTIC_DATA in outputs:
             outputs[DIAGNOSTIC_DATA] = self._empty_lists_to_none_in_dict(
                 outputs[DIAGNOSTIC_DATA]
@@ -423,22 +428,49 @@ class RasaModel(TmpKerasModel):
         )
         # create empty model
         model = cls(*args, **kwargs)
-        learning_rate = kwargs.get("config", {}).get(LEARNING_RATE, 0.001)
-        # need to train on 1 example to build weights of the correct size
-        model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate))
-        data_generator = RasaBatchDataGenerator(model_data_example, batch_size=1)
-        model.fit(data_generator, verbose=False)
-        # load trained weights
-        model.load_weights(model_file_name)
+        if finetune_mode:
+            learning_rate = kwargs.get("config", {}).get(LEARNING_RATE, 0.001)
+            # need to train on 1 example to build weights of the correct size and
+            # the state of the optimizer which is needed to continue training
+            model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate))
+            data_generator = RasaBatchDataGenerator(model_data_example, batch_size=1)
+            model.fit(data_generator, verbose=False)
+            # load trained weights
+            model.load_weights(model_file_name)
+        else:
+            model._build_variables(model_data_example)
+            # load trained weights, the optimizer state is not needed for prediction
+            model.load_weights(model_file_name).expect_partial()
 
         # predict on one data example to speed up prediction during inference
-        # the first prediction always takes a bit longer to trace tf function
+        # the first prediction always takes a bit longer to trace tf function,
+        # afterwards inputs of any batch size and sequence length reuse this trace
         if not finetune_mode and predict_data_example:
             model.run_inference(predict_data_example)
 
         logger.debug("Finished loading the model.")
         return model
 
+    def _build_variables(self, model_data_example: RasaModelData) -> None:
+        """Creates the variables of the model without running a training step.
+
+        Calculating the loss for a single example calls every layer which is also
+        called during training. This creates all variables with their correct shapes
+        while avoiding to trace a training function and to create an optimizer.
+
+        Args:
+            model_data_example: Example data point to construct the model
+                architecture.
+        """
+        data_generator = RasaBatchDataGenerator(model_data_example, batch_size=1)
+        # data_generator returns a tuple of input and output, only the input is
+        # consumed by our models
+        batch_in = data_generator[0][0]
+
+        self._training = True
+        self.batch_loss(batch_in)
+        self._training = None
+
     @staticmethod
     def batch_to_model_data_format(
         batch: Union[Tuple[tf.Tensor], Tuple[np.ndarray]],
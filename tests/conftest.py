@@ -9,6 +9,7 @@ import pytest
 import sys
 import uuid
 
+from _pytest.fixtures import SubRequest
 from _pytest.monkeypatch import MonkeyPatch
 from _pytest.python import Function
 from spacy import Language
@@ -46,6 +47,7 @@ from rasa.core.tracker_store import InMemoryTrackerStore, TrackerStore
 from rasa.model_training import train, train_nlu
 from rasa.shared.exceptions import RasaException
 import rasa.utils.common
+from rasa.utils.endpoints import EndpointConfig
 
 
 # we reuse a bit of pytest's own testing machinery, this should eventually come
@@ -79,7 +81,10 @@ PATH_PYTEST_MARKER_MAPPINGS = {
         Path("tests", "core", "test_training.py").absolute(),
         Path("tests", "core", "test_examples.py").absolute(),
     ],
-    "category_performance": [Path("tests", "test_memory_leak.py").absolute()],
+    "category_performance": [
+        Path("tests", "test_memory_leak.py").absolute(),
+        Path("tests", "test_performance.py").absolute(),
+    ],
 }
 
 
@@ -729,6 +734,35 @@ def use_temp_dir_for_cache(
     monkeypatch.setattr(LocalTrainingCache, "_get_cache_location", lambda: cache_dir)
 
 
+@pytest.fixture(autouse=True)
+def close_pooled_http_sessions(
+    request: SubRequest, monkeypatch: MonkeyPatch
+) -> Iterator[None]:
+    # The pooled HTTP sessions of endpoints are usually closed when the server shuts
+    # down. This fixture closes the sessions which were opened during a test before
+    # the event loop of the test is closed, so that they don't log warnings about
+    # unclosed sessions during later tests.
+    if "loop" not in request.fixturenames:
+        yield
+        return
+
+    loop = request.getfixturevalue("loop")
+    endpoints = []
+    pooled_session = EndpointConfig.pooled_session
+
+    def tracked_pooled_session(endpoint: EndpointConfig) -> Any:
+        endpoints.append(endpoint)
+        return pooled_session(endpoint)
+
+    monkeypatch.setattr(EndpointConfig, "pooled_session", tracked_pooled_session)
+
+    yield
+
+    if not loop.is_closed():
+        for endpoint in endpoints:
+            loop.run_until_complete(endpoint.close())
+
+
 @contextlib.contextmanager
 def enable_cache(cache_dir: Path):
     old_get_cache_location = LocalTrainingCache._get_cache_location
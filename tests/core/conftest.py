@@ -5,7 +5,7 @@ from sanic.request import Request
 import uuid
 from datetime import datetime
 
-from typing import Generator, Callable, Dict, Text
+from typing import Any, Generator, Callable, Dict, Text
 
 from scipy import sparse
 
@@ -19,7 +19,7 @@ from rasa.shared.core.events import ReminderScheduled, UserUttered, ActionExecut
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator, NaturalLanguageGenerator
 from rasa.core.processor import MessageProcessor
 from rasa.shared.core.slots import Slot
-from rasa.core.tracker_store import MongoTrackerStore
+from rasa.core.tracker_store import MongoTrackerStore, RedisTrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.nlu.constants import INTENT, ACTION_NAME, FEATURE_TYPE_SENTENCE
@@ -47,6 +47,20 @@ class MockedMongoTrackerStore(MongoTrackerStore):
         super(MongoTrackerStore, self).__init__(_domain, None)
 
 
+class MockedRedisTrackerStore(RedisTrackerStore):
+    """In-memory mocked version of `RedisTrackerStore`."""
+
+    def __init__(self, _domain: Domain, **kwargs: Any) -> None:
+        import fakeredis
+
+        super().__init__(_domain, **kwargs)
+
+        self.red = fakeredis.FakeStrictRedis()
+
+        # added in redis==3.3.0, but not yet in fakeredis
+        self.red.connection_pool.connection_class.health_check_interval = 0
+
+
 # https://github.com/pytest-dev/pytest-asyncio/issues/68
 # this event_loop is used by pytest-asyncio, and redefining it
 # is currently the only way of changing the scope of this fixture
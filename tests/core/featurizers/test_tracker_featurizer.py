@@ -2333,3 +2333,41 @@ def test_multilabels_with_intent_max_history_tracker_featurizer(
         actual_labels, expected_labels
     ):
         assert sorted(actual_label_indices) == sorted(expected_label_indices)
+
+
+def test_featurize_trackers_encodes_every_distinct_state_once(
+    moodbot_tracker: DialogueStateTracker, moodbot_domain: Domain,
+):
+    state_featurizer = SingleStateFeaturizer()
+    tracker_featurizer = MaxHistoryTrackerFeaturizer(state_featurizer)
+
+    encoded_states = []
+    encode_state = state_featurizer.encode_state
+
+    def count_encoded_states(*args, **kwargs):
+        encoded_states.append(args[0])
+        return encode_state(*args, **kwargs)
+
+    state_featurizer.encode_state = count_encoded_states
+
+    actual_features, _, _ = tracker_featurizer.featurize_trackers(
+        [moodbot_tracker], moodbot_domain, precomputations=None,
+    )
+
+    trackers_as_states, _ = tracker_featurizer.training_states_and_labels(
+        [moodbot_tracker], moodbot_domain
+    )
+    distinct_states = {
+        DialogueStateTracker.freeze_current_state(state)
+        for states in trackers_as_states
+        for state in states
+    }
+    assert len(encoded_states) == len(distinct_states)
+    assert len(encoded_states) < sum(len(states) for states in trackers_as_states)
+
+    # the windows of the dialogue overlap, so the last window contains the encoded
+    # states of all other windows
+    longest_features = actual_features[-1]
+    for features in actual_features:
+        for state_features, expected_state_features in zip(features, longest_features):
+            assert state_features is expected_state_features
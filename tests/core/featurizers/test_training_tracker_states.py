@@ -0,0 +1,195 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from rasa.core import training
+from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
+from rasa.core.featurizers.tracker_featurizers import (
+    FullDialogueTrackerFeaturizer,
+    IntentMaxHistoryTrackerFeaturizer,
+    MaxHistoryTrackerFeaturizer,
+    TrackerFeaturizer,
+)
+from rasa.core.featurizers.training_tracker_states import (
+    TrainingTrackerStates,
+    TrainingTrackerStatesProvider,
+)
+from rasa.engine.graph import ExecutionContext
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.generator import TrackerWithCachedStates
+
+
+@pytest.fixture(scope="module")
+def formbot_domain() -> Domain:
+    return Domain.load("examples/formbot/domain.yml")
+
+
+@pytest.fixture(scope="module")
+def formbot_trackers(formbot_domain: Domain) -> List[TrackerWithCachedStates]:
+    return training.load_data(
+        "examples/formbot/data", formbot_domain, augmentation_factor=5
+    )
+
+
+@pytest.mark.parametrize(
+    "tracker_featurizer",
+    [
+        MaxHistoryTrackerFeaturizer(SingleStateFeaturizer(), max_history=None),
+        MaxHistoryTrackerFeaturizer(SingleStateFeaturizer(), max_history=2),
+        MaxHistoryTrackerFeaturizer(
+            SingleStateFeaturizer(), max_history=3, remove_duplicates=False
+        ),
+        IntentMaxHistoryTrackerFeaturizer(SingleStateFeaturizer(), max_history=3),
+        FullDialogueTrackerFeaturizer(SingleStateFeaturizer()),
+    ],
+)
+@pytest.mark.parametrize("ignore_action_unlikely_intent", [True, False])
+@pytest.mark.parametrize("omit_unset_slots", [True, False])
+def test_featurizers_create_same_states_with_shared_states(
+    tracker_featurizer: TrackerFeaturizer,
+    ignore_action_unlikely_intent: bool,
+    omit_unset_slots: bool,
+    formbot_trackers: List[TrackerWithCachedStates],
+    formbot_domain: Domain,
+):
+    training_tracker_states = TrainingTrackerStates.from_trackers(
+        formbot_trackers, formbot_domain
+    )
+
+    expected = tracker_featurizer.training_states_labels_and_entities(
+        formbot_trackers,
+        formbot_domain,
+        omit_unset_slots=omit_unset_slots,
+        ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+    )
+    actual = tracker_featurizer.training_states_labels_and_entities(
+        formbot_trackers,
+        formbot_domain,
+        omit_unset_slots=omit_unset_slots,
+        ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+        training_tracker_states=training_tracker_states,
+    )
+
+    assert actual == expected
+
+
+def test_states_are_copies(
+    formbot_trackers: List[TrackerWithCachedStates], formbot_domain: Domain
+):
+    training_tracker_states = TrainingTrackerStates.from_trackers(
+        formbot_trackers, formbot_domain
+    )
+    tracker = formbot_trackers[0]
+
+    states = training_tracker_states.states(tracker)
+    assert states == tracker.past_states(formbot_domain)
+
+    states[-1].clear()
+    assert training_tracker_states.states(tracker) == tracker.past_states(
+        formbot_domain
+    )
+
+
+def test_states_of_unknown_tracker(
+    formbot_trackers: List[TrackerWithCachedStates], formbot_domain: Domain
+):
+    training_tracker_states = TrainingTrackerStates.from_trackers(
+        formbot_trackers[1:], formbot_domain
+    )
+
+    assert training_tracker_states.frozen_states(formbot_trackers[0]) is None
+    assert training_tracker_states.states(formbot_trackers[0]) is None
+
+
+def test_applied_events_are_determined_once(
+    formbot_trackers: List[TrackerWithCachedStates], formbot_domain: Domain
+):
+    training_tracker_states = TrainingTrackerStates.from_trackers(
+        formbot_trackers[1:], formbot_domain
+    )
+
+    tracker = formbot_trackers[1]
+    events = training_tracker_states.applied_events(tracker)
+    assert events == tracker.applied_events()
+    assert training_tracker_states.applied_events(tracker) is events
+
+    unknown_tracker = formbot_trackers[0]
+    assert (
+        training_tracker_states.applied_events(unknown_tracker)
+        == unknown_tracker.applied_events()
+    )
+
+
+def test_bind_to_different_trackers(
+    formbot_trackers: List[TrackerWithCachedStates], formbot_domain: Domain
+):
+    training_tracker_states = TrainingTrackerStates.from_trackers(
+        formbot_trackers, formbot_domain
+    )
+
+    copied_trackers = [tracker.copy() for tracker in formbot_trackers]
+    training_tracker_states.bind(copied_trackers)
+    assert training_tracker_states.frozen_states(copied_trackers[0]) == list(
+        formbot_trackers[0].past_states_for_hashing(formbot_domain)
+    )
+    assert training_tracker_states.frozen_states(formbot_trackers[0]) is None
+
+    # the states don't belong to these trackers and hence aren't used
+    training_tracker_states.bind(list(reversed(copied_trackers)))
+    assert training_tracker_states.frozen_states(copied_trackers[0]) is None
+
+
+def test_cache_roundtrip(
+    formbot_trackers: List[TrackerWithCachedStates],
+    formbot_domain: Domain,
+    tmp_path: Path,
+    default_model_storage: ModelStorage,
+):
+    training_tracker_states = TrainingTrackerStates.from_trackers(
+        formbot_trackers, formbot_domain
+    )
+
+    training_tracker_states.to_cache(tmp_path, default_model_storage)
+    loaded = TrainingTrackerStates.from_cache(
+        "states", tmp_path, default_model_storage, ""
+    )
+
+    assert len(loaded) == len(training_tracker_states)
+    assert loaded.fingerprint() == training_tracker_states.fingerprint()
+
+    loaded.bind(formbot_trackers)
+    for tracker in formbot_trackers:
+        assert loaded.frozen_states(tracker) == training_tracker_states.frozen_states(
+            tracker
+        )
+
+
+def test_fingerprint_differs_for_different_states(
+    formbot_trackers: List[TrackerWithCachedStates], formbot_domain: Domain
+):
+    states1 = TrainingTrackerStates.from_trackers(formbot_trackers, formbot_domain)
+    states2 = TrainingTrackerStates.from_trackers(formbot_trackers[1:], formbot_domain)
+
+    assert states1.fingerprint() != states2.fingerprint()
+
+
+def test_provider(
+    formbot_trackers: List[TrackerWithCachedStates],
+    formbot_domain: Domain,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+):
+    provider = TrainingTrackerStatesProvider.create(
+        {}, default_model_storage, Resource("xy"), default_execution_context
+    )
+
+    training_tracker_states = provider.provide(formbot_trackers, formbot_domain)
+
+    assert len(training_tracker_states) == len(formbot_trackers)
+    for tracker in formbot_trackers:
+        assert training_tracker_states.states(tracker) == tracker.past_states(
+            formbot_domain
+        )
@@ -46,7 +46,9 @@ from rasa.core.nlg import TemplatedNaturalLanguageGenerator
 from rasa.core.policies.rule_policy import (
     RulePolicy,
     InvalidRule,
+    RuleIndex,
     RULES,
+    RULES_FOR_LOOP_UNHAPPY_PATH,
 )
 from rasa.graph_components.providers.rule_only_provider import RuleOnlyDataProvider
 from rasa.shared.core.trackers import DialogueStateTracker
@@ -721,6 +723,85 @@ def test_all_policy_attributes_are_persisted(
     assert loaded.lookup == lookup
 
 
+def test_rule_index_is_persisted(
+    trained_rule_policy: RulePolicy,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    resource: Resource,
+):
+    loaded = RulePolicy.load(
+        RulePolicy.get_default_config(),
+        default_model_storage,
+        resource,
+        default_execution_context,
+    )
+
+    for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+        assert lookup_name in loaded._rule_indices
+        assert (
+            loaded._rule_index(lookup_name).as_dict()
+            == trained_rule_policy._rule_index(lookup_name).as_dict()
+        )
+
+
+@pytest.mark.parametrize(
+    "data_path", ["examples/rules/data/rules.yml", "examples/formbot/data/rules.yml"]
+)
+def test_rule_index_finds_same_rules_as_checking_every_rule(
+    policy: RulePolicy, data_path: Text
+):
+    domain = Domain.load(str(Path(data_path).parents[1] / "domain.yml"))
+    trackers = training.load_data(data_path, domain)
+    policy.train(trackers, domain)
+
+    for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+        lookup = policy.lookup[lookup_name]
+        index = RuleIndex.from_rule_keys(lookup.keys())
+        assert len(index) == len(lookup)
+
+        for tracker in trackers:
+            states = tracker.past_states(domain)
+            for number_of_states in range(1, len(states) + 1):
+                conversation_states = states[:number_of_states]
+                expected = {
+                    rule_key
+                    for rule_key in lookup
+                    if all(
+                        policy._is_rule_applicable(rule_key, turn_index, state)
+                        for turn_index, state in enumerate(
+                            reversed(conversation_states)
+                        )
+                    )
+                }
+
+                assert set(index.applicable_rules(conversation_states)) == expected
+
+
+def test_rule_index_remove_rules(policy: RulePolicy):
+    data_path = "examples/formbot/data/rules.yml"
+    domain = Domain.load(str(Path(data_path).parents[1] / "domain.yml"))
+    trackers = training.load_data(data_path, domain)
+    policy.train(trackers, domain)
+
+    rule_keys = list(policy.lookup[RULES].keys())
+    index = policy._rule_index(RULES)
+    for rule_key in rule_keys[::2]:
+        policy._remove_rule(RULES, rule_key)
+
+    # the cached index was updated instead of being rebuilt
+    assert policy._rule_index(RULES) is index
+    assert len(index) == len(policy.lookup[RULES])
+    assert (
+        index.as_dict()
+        == RuleIndex.from_rule_keys(policy.lookup[RULES].keys()).as_dict()
+    )
+
+    for rule_key in rule_keys[1::2]:
+        index.remove(rule_key)
+    assert len(index) == 0
+    assert index.as_dict() == RuleIndex().as_dict()
+
+
 def test_rule_policy_finetune(
     trained_rule_policy: RulePolicy,
     trained_rule_policy_domain: Domain,
@@ -5,6 +5,7 @@ from typing import List, Text, Any, Dict, Optional
 
 import pytest
 from _pytest.logging import LogCaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 from jsonschema import ValidationError
 
@@ -587,6 +588,213 @@ async def test_remote_action_endpoint_responds_400(
     assert "Custom action 'my_action' rejected to run" in str(execinfo.value)
 
 
+@pytest.fixture
+def action_server_payload_cache(
+    monkeypatch: MonkeyPatch,
+) -> action.ActionServerPayloadCache:
+    payload_cache = action.ActionServerPayloadCache()
+    monkeypatch.setattr(action, "action_server_payload_cache", payload_cache)
+    return payload_cache
+
+
+def _delta_payload_response(domain: Domain, number_of_events: int) -> Dict[Text, Any]:
+    return {
+        "events": [],
+        "responses": [],
+        action.DOMAIN_DIGEST_KEY: domain.fingerprint(),
+        action.TRACKER_EVENTS_OFFSET_KEY: number_of_events,
+    }
+
+
+async def test_remote_action_with_delta_payloads(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+    action_server_payload_cache: action.ActionServerPayloadCache,
+):
+    url = "https://example.com/webhooks/actions"
+    endpoint = EndpointConfig(url, delta_payloads=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "my-sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload=_delta_payload_response(domain, 2))
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        first_request = json_of_latest_request(latest_request(mocked, "post", url))
+        assert first_request["domain"] == domain.as_dict()
+        assert first_request[action.DOMAIN_DIGEST_KEY] == domain.fingerprint()
+        assert first_request[action.TRACKER_EVENTS_OFFSET_KEY] == 0
+        assert first_request["tracker"]["events"] == [
+            event.as_dict() for event in tracker.events
+        ]
+
+        new_events = [ActionExecuted("my_action"), BotUttered("hello")]
+        for event in new_events:
+            tracker.update(event)
+
+        mocked.post(url, payload=_delta_payload_response(domain, 4))
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        second_request = json_of_latest_request(latest_request(mocked, "post", url))
+        assert "domain" not in second_request
+        assert second_request[action.DOMAIN_DIGEST_KEY] == domain.fingerprint()
+        assert second_request[action.TRACKER_EVENTS_OFFSET_KEY] == 2
+        assert second_request["tracker"]["events"] == [
+            event.as_dict() for event in new_events
+        ]
+        assert second_request["tracker"]["latest_message"]["text"] == "hi"
+
+
+async def test_remote_action_with_delta_payloads_without_acknowledgements(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+    action_server_payload_cache: action.ActionServerPayloadCache,
+):
+    url = "https://example.com/webhooks/actions"
+    endpoint = EndpointConfig(url, delta_payloads=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events("my-sender", [UserUttered("hi")])
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []}, repeat=True)
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        requests = latest_request(mocked, "post", url)
+        assert len(requests) == 2
+        for request in requests:
+            assert request.kwargs["json"]["domain"] == domain.as_dict()
+            assert request.kwargs["json"][action.TRACKER_EVENTS_OFFSET_KEY] == 0
+            assert len(request.kwargs["json"]["tracker"]["events"]) == 1
+
+
+async def test_remote_action_with_delta_payloads_sends_full_payload_on_cache_miss(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+    action_server_payload_cache: action.ActionServerPayloadCache,
+):
+    url = "https://example.com/webhooks/actions"
+    endpoint = EndpointConfig(url, delta_payloads=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events("my-sender", [UserUttered("hi")])
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload=_delta_payload_response(domain, 1))
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        tracker.update(ActionExecuted("my_action"))
+
+        # e.g. the action server was restarted in the meantime
+        # noinspection PyTypeChecker
+        mocked.post(url, exception=ClientResponseError(409, "Conflict", ""))
+        mocked.post(url, payload=_delta_payload_response(domain, 2))
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        requests = latest_request(mocked, "post", url)
+        assert len(requests) == 3
+
+        delta_request = requests[1].kwargs["json"]
+        assert "domain" not in delta_request
+        assert delta_request[action.TRACKER_EVENTS_OFFSET_KEY] == 1
+
+        full_request = requests[2].kwargs["json"]
+        assert full_request["domain"] == domain.as_dict()
+        assert full_request[action.TRACKER_EVENTS_OFFSET_KEY] == 0
+        assert full_request["tracker"]["events"] == [
+            event.as_dict() for event in tracker.events
+        ]
+
+    assert action_server_payload_cache.has_domain(url, domain.fingerprint())
+
+
+def test_action_server_payload_cache_without_acknowledged_event():
+    url = "https://example.com/webhooks/actions"
+    payload_cache = action.ActionServerPayloadCache(max_conversations=1)
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    payload_cache.acknowledge_events(url, tracker, 1)
+
+    tracker.update(ActionExecuted("my_action"))
+    assert payload_cache.unacknowledged_events(url, tracker) == (
+        1,
+        [ActionExecuted("my_action")],
+    )
+
+    # the acknowledged event isn't part of the tracker anymore
+    other_tracker = DialogueStateTracker.from_events(
+        "some-sender", [UserUttered("hello")]
+    )
+    assert payload_cache.unacknowledged_events(url, other_tracker) == (
+        0,
+        list(other_tracker.events),
+    )
+
+    # the least recently used conversation is forgotten
+    payload_cache.acknowledge_events(
+        url, DialogueStateTracker.from_events("other-sender", []), 0
+    )
+    assert payload_cache.unacknowledged_events(url, tracker) == (
+        0,
+        list(tracker.events),
+    )
+
+
+def test_action_server_payload_cache_compares_acknowledged_event_content():
+    url = "https://example.com/webhooks/actions"
+    payload_cache = action.ActionServerPayloadCache()
+    tracker = DialogueStateTracker.from_events(
+        "some-sender", [UserUttered("hi", timestamp=1)]
+    )
+    payload_cache.acknowledge_events(url, tracker, 1)
+
+    # the event has the same timestamp and type as the acknowledged one
+    other_tracker = DialogueStateTracker.from_events(
+        "some-sender", [UserUttered("hello", timestamp=1)]
+    )
+    assert payload_cache.unacknowledged_events(url, other_tracker) == (
+        0,
+        list(other_tracker.events),
+    )
+
+
+def test_action_server_payload_cache_with_limited_event_history():
+    url = "https://example.com/webhooks/actions"
+    payload_cache = action.ActionServerPayloadCache()
+    events = [UserUttered("hi"), ActionExecuted("my_action"), BotUttered("hello")]
+    tracker = DialogueStateTracker.from_events("some-sender", events[:2])
+    payload_cache.acknowledge_events(url, tracker, 2)
+
+    # the tracker doesn't contain the first event anymore
+    truncated_tracker = DialogueStateTracker.from_events("some-sender", events[1:])
+    assert payload_cache.unacknowledged_events(url, truncated_tracker) == (
+        2,
+        events[2:],
+    )
+
+
+def test_action_server_payload_cache_forget_keeps_domain():
+    url = "https://example.com/webhooks/actions"
+    payload_cache = action.ActionServerPayloadCache()
+    tracker = DialogueStateTracker.from_events("some-sender", [UserUttered("hi")])
+    payload_cache.acknowledge_domain(url, "digest")
+    payload_cache.acknowledge_events(url, tracker, 1)
+
+    payload_cache.forget(url, tracker.sender_id)
+
+    assert payload_cache.has_domain(url, "digest")
+    assert payload_cache.unacknowledged_events(url, tracker) == (
+        0,
+        list(tracker.events),
+    )
+
+    payload_cache.forget_domain(url)
+    assert not payload_cache.has_domain(url, "digest")
+
+
 async def test_action_utter_retrieved_response(
     default_channel, default_nlg, default_tracker, domain: Domain
 ):
@@ -15,8 +15,10 @@ from sanic.request import Request
 from sanic.response import StreamingHTTPResponse
 
 import rasa.core
+import rasa.core.http_interpreter
 from rasa.core.exceptions import AgentNotReady
 from rasa.core.utils import AvailableEndpoints
+from rasa.engine.runner.executor import GraphRunExecutor
 from rasa.exceptions import ModelNotFound
 from rasa.nlu.persistor import Persistor
 from rasa.shared.core.events import (
@@ -358,6 +360,54 @@ async def test_parse_with_http_interpreter(trained_default_agent_model: Text):
         assert result == response_body
 
 
+async def test_agent_closes_http_sessions():
+    action_endpoint = EndpointConfig("https://actions.com")
+    nlg_endpoint = EndpointConfig("https://nlg.com")
+    nlu_endpoint = EndpointConfig("https://interpreter.com")
+    agent = Agent(
+        generator=nlg_endpoint,
+        action_endpoint=action_endpoint,
+        http_interpreter=rasa.core.http_interpreter.RasaNLUHttpInterpreter(
+            nlu_endpoint
+        ),
+    )
+
+    assert agent.http_endpoints() == [action_endpoint, nlg_endpoint, nlu_endpoint]
+
+    sessions = [
+        endpoint.pooled_session()
+        for endpoint in [action_endpoint, nlg_endpoint, nlu_endpoint]
+    ]
+
+    # the action endpoint is still used, e.g. by an agent with a new model
+    await agent.close_http_sessions(still_used_endpoints=[action_endpoint])
+
+    assert [session.closed for session in sessions] == [False, True, True]
+
+    await agent.close_http_sessions()
+    assert sessions[0].closed
+
+
+async def test_agent_shuts_down_graph_executor():
+    agent = Agent(graph_executor=GraphRunExecutor())
+    successor = Agent(graph_executor=agent.graph_executor)
+
+    # the executor is still used by the agent which replaces the agent
+    await agent.close(successor=successor)
+    assert not agent.graph_executor._pool._shutdown
+
+    await agent.close()
+    assert agent.graph_executor._pool._shutdown
+
+
+async def test_agent_does_not_shut_down_shared_graph_executor():
+    agent = Agent()
+
+    await agent.close()
+    assert agent.graph_executor.is_shared
+    assert not agent.graph_executor._pool._shutdown
+
+
 @pytest.mark.parametrize(
     "method_name",
     [
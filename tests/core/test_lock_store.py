@@ -1,11 +1,13 @@
 import asyncio
 import logging
+import threading
 import sys
 from pathlib import Path
 
 import numpy as np
 import pytest
 import time
+from typing import Any, List, Optional, Text, Tuple, TYPE_CHECKING
 
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
@@ -27,21 +29,29 @@ from rasa.core.lock_store import (
 from rasa.shared.exceptions import ConnectionException
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    import fakeredis
+
 
 class FakeRedisLockStore(RedisLockStore):
     """Fake `RedisLockStore` using `fakeredis` library."""
 
     # skipcq: PYL-W0231
     # noinspection PyMissingConstructor
-    def __init__(self):
+    def __init__(self, server: Optional["fakeredis.FakeServer"] = None):
         import fakeredis
 
-        self.red = fakeredis.FakeStrictRedis()
+        self.red = fakeredis.FakeStrictRedis(server=server)
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
+        self._release_listener = None
+        self._release_listener_loop = None
+        self._register_scripts()
+
+        LockStore.__init__(self)
 
 
 def test_issue_ticket():
@@ -79,7 +89,9 @@ def test_remove_expired_tickets():
     assert len(lock.tickets) == 1
 
 
-@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+@pytest.mark.parametrize(
+    "lock_store", [InMemoryLockStore(), FakeRedisLockStore()],
+)
 def test_create_lock_store(lock_store: LockStore):
     conversation_id = "my id 0"
 
@@ -102,7 +114,9 @@ def test_raise_connection_exception_redis_lock_store(monkeypatch: MonkeyPatch):
         )
 
 
-@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+@pytest.mark.parametrize(
+    "lock_store", [InMemoryLockStore(), FakeRedisLockStore()],
+)
 def test_serve_ticket(lock_store: LockStore):
     conversation_id = "my id 1"
 
@@ -138,7 +152,9 @@ def test_serve_ticket(lock_store: LockStore):
 
 
 # noinspection PyProtectedMember
-@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+@pytest.mark.parametrize(
+    "lock_store", [InMemoryLockStore(), FakeRedisLockStore()],
+)
 def test_lock_expiration(lock_store: LockStore):
     conversation_id = "my id 2"
     lock = lock_store.create_lock(conversation_id)
@@ -296,7 +312,9 @@ async def test_lock_lifetime_environment_variable(monkeypatch: MonkeyPatch):
     assert rasa.core.lock_store._get_lock_lifetime() == new_lock_lifetime
 
 
-@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+@pytest.mark.parametrize(
+    "lock_store", [InMemoryLockStore(), FakeRedisLockStore()],
+)
 async def test_acquire_lock_debug_message(
     lock_store: LockStore, caplog: LogCaptureFixture
 ):
@@ -336,9 +354,7 @@ async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
 
     lock_store = FakeRedisLockStore()
     monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
-        Mock(side_effect=redis.exceptions.TimeoutError),
+        lock_store.red, "evalsha", Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
     with pytest.raises(LockError):
@@ -356,9 +372,7 @@ async def test_redis_lock_store_with_invalid_prefix(monkeypatch: MonkeyPatch):
     assert lock_store.key_prefix == DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
 
     monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
-        Mock(side_effect=redis.exceptions.TimeoutError),
+        lock_store.red, "evalsha", Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
     with pytest.raises(LockError):
@@ -376,11 +390,206 @@ async def test_redis_lock_store_with_valid_prefix(monkeypatch: MonkeyPatch):
     assert lock_store.key_prefix == prefix + ":" + DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
 
     monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
-        Mock(side_effect=redis.exceptions.TimeoutError),
+        lock_store.red, "evalsha", Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
             pass
+
+
+@pytest.mark.parametrize(
+    "lock_store", [InMemoryLockStore(), FakeRedisLockStore()],
+)
+async def test_waiting_message_acquires_lock_when_lock_is_released(
+    lock_store: LockStore,
+):
+    conversation_id = "test_waiting_message_acquires_lock_when_lock_is_released"
+    acquisition_times = []
+
+    async def locking_task() -> None:
+        # much longer than it takes to process the other message
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+            acquisition_times.append(time.perf_counter())
+            await asyncio.sleep(0.1)
+
+    await asyncio.gather(locking_task(), locking_task())
+
+    assert acquisition_times[1] - acquisition_times[0] < 1
+
+
+async def test_polling_lock_store_without_release_notifications():
+    class PollingLockStore(InMemoryLockStore):
+        async def _wait_for_lock_release(
+            self, conversation_id: Text, wait_time_in_seconds: float
+        ) -> None:
+            await LockStore._wait_for_lock_release(
+                self, conversation_id, wait_time_in_seconds
+            )
+
+    lock_store = PollingLockStore()
+    processed = []
+
+    async def locking_task(number: int) -> None:
+        async with lock_store.lock("some sender", wait_time_in_seconds=0.01):
+            await asyncio.sleep(0.0)
+            processed.append(number)
+
+    await asyncio.gather(*(locking_task(number) for number in range(3)))
+
+    assert processed == [0, 1, 2]
+
+
+async def test_redis_lock_store_falls_back_to_polling(monkeypatch: MonkeyPatch):
+    import redis.exceptions
+
+    lock_store = FakeRedisLockStore()
+    monkeypatch.setattr(
+        lock_store.red, "pubsub", Mock(side_effect=redis.exceptions.ConnectionError)
+    )
+
+    start = time.perf_counter()
+    await lock_store._wait_for_lock_release("some sender", 0.1)
+
+    assert time.perf_counter() - start >= 0.1
+
+
+class RoundTripCounter:
+    """Counts the commands which a `FakeRedisLockStore` sends to Redis."""
+
+    def __init__(self, lock_store: FakeRedisLockStore) -> None:
+        self.commands: List[Tuple[Any, ...]] = []
+        execute_command = lock_store.red.execute_command
+
+        def counting_execute_command(*args: Any, **kwargs: Any) -> Any:
+            self.commands.append(args)
+            return execute_command(*args, **kwargs)
+
+        lock_store.red.execute_command = counting_execute_command
+
+
+def test_redis_lock_operations_take_one_round_trip():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_operations_take_one_round_trip"
+    # load the scripts into Redis
+    lock_store.cleanup(conversation_id, lock_store.issue_ticket(conversation_id))
+    lock_store.get_lock(conversation_id)
+
+    counter = RoundTripCounter(lock_store)
+
+    ticket = lock_store.issue_ticket(conversation_id)
+    lock = lock_store.get_lock(conversation_id)
+    assert not lock.is_locked(ticket)
+    lock_store.cleanup(conversation_id, ticket)
+
+    assert [command[:2] for command in counter.commands] == [
+        ("EVALSHA", lock_store._issue_ticket_script.sha),
+        ("EVALSHA", lock_store._get_lock_script.sha),
+        ("EVALSHA", lock_store._finish_serving_script.sha),
+    ]
+    assert lock_store.get_lock(conversation_id) is None
+
+
+def test_redis_lock_store_keeps_ticket_numbers_of_expired_tickets():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_store_keeps_ticket_numbers_of_expired_tickets"
+
+    assert lock_store.issue_ticket(conversation_id, 0.00001) == 0
+    time.sleep(0.00002)
+    # numbers of expired tickets are not reissued so that their holders can't
+    # acquire the lock of another ticket
+    assert lock_store.issue_ticket(conversation_id, 10) == 1
+
+    lock = lock_store.get_lock(conversation_id)
+    assert [ticket.number for ticket in lock.tickets] == [1]
+    assert lock.now_serving == 1
+
+
+def test_redis_lock_store_expires_abandoned_locks():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_store_expires_abandoned_locks"
+
+    lock_store.issue_ticket(conversation_id, 10)
+    lock_store.issue_ticket(conversation_id, 100)
+    lock_store.issue_ticket(conversation_id, 50)
+
+    for key in lock_store._lock_keys(conversation_id):
+        assert 100 <= lock_store.red.ttl(key) <= 101
+
+
+def test_redis_lock_store_saves_lock():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_store_saves_lock"
+
+    lock = lock_store.create_lock(conversation_id)
+    lock.issue_ticket(10)
+    lock.issue_ticket(10)
+    lock_store.save_lock(lock)
+
+    stored_lock = lock_store.get_lock(conversation_id)
+    assert [ticket.number for ticket in stored_lock.tickets] == [0, 1]
+    assert lock_store.issue_ticket(conversation_id) == 2
+
+
+def test_redis_lock_stores_in_concurrent_threads_serve_tickets_in_order():
+    import fakeredis
+
+    # every thread runs the event loop of a Rasa instance with its own
+    # connection to the shared Redis (`fakeredis` can't share its data with other
+    # processes, hence threads take the place of separate Rasa processes)
+    server = fakeredis.FakeServer()
+    n_instances = 4
+    n_messages_per_instance = 10
+    conversation_id = "test_redis_lock_stores_in_concurrent_threads"
+
+    # load the scripts into Redis
+    lock_store = FakeRedisLockStore(server)
+    lock_store.cleanup(conversation_id, lock_store.issue_ticket(conversation_id))
+    lock_store.get_lock(conversation_id)
+
+    guard = threading.Lock()
+    served_tickets = []
+    processing = []
+    counters = []
+
+    async def handle_message(lock_store: FakeRedisLockStore) -> None:
+        async with lock_store.lock(conversation_id, wait_time_in_seconds=1) as lock:
+            with guard:
+                processing.append(lock.now_serving)
+                assert len(processing) == 1
+            await asyncio.sleep(0.001)
+            with guard:
+                served_tickets.append(processing.pop())
+
+    def run_instance() -> None:
+        lock_store = FakeRedisLockStore(server)
+        counters.append(RoundTripCounter(lock_store))
+
+        async def handle_messages() -> None:
+            await asyncio.gather(
+                *(handle_message(lock_store) for _ in range(n_messages_per_instance))
+            )
+
+        asyncio.new_event_loop().run_until_complete(handle_messages())
+
+    instances = [threading.Thread(target=run_instance) for _ in range(n_instances)]
+    for instance in instances:
+        instance.start()
+    for instance in instances:
+        instance.join(timeout=60)
+
+    n_messages = n_instances * n_messages_per_instance
+    assert served_tickets == list(range(n_messages))
+
+    script_calls = [
+        command[1]
+        for counter in counters
+        for command in counter.commands
+        if command[0] == "EVALSHA"
+    ]
+    # issuing a ticket and releasing the lock take one round trip per message
+    assert script_calls.count(lock_store._issue_ticket_script.sha) == n_messages
+    assert script_calls.count(lock_store._finish_serving_script.sha) == n_messages
+    # every message has to check the lock at least once to acquire it
+    assert script_calls.count(lock_store._get_lock_script.sha) >= n_messages
+    assert fakeredis.FakeStrictRedis(server=server).keys() == []
@@ -576,7 +576,7 @@ async def test_update_tracker_session(
     await default_processor._update_tracker_session(tracker, default_channel)
 
     # the save is not called in _update_tracker_session()
-    default_processor.save_tracker(tracker)
+    await default_processor.save_tracker(tracker)
 
     # inspect tracker and make sure all events are present
     tracker = default_processor.tracker_store.retrieve(sender_id)
@@ -693,7 +693,7 @@ async def test_update_tracker_session_with_slots(
     await default_processor._update_tracker_session(tracker, default_channel)
 
     # the save is not called in _update_tracker_session()
-    default_processor.save_tracker(tracker)
+    await default_processor.save_tracker(tracker)
 
     # inspect tracker and make sure all events are present
     tracker = default_processor.tracker_store.retrieve(sender_id)
@@ -1105,7 +1105,7 @@ async def test_policy_events_are_applied_to_tracker(
 
     assert action_received_events
 
-    tracker = default_processor.get_tracker(conversation_id)
+    tracker = await default_processor.get_tracker(conversation_id)
     # The action was logged on the tracker as well
     expected_events.append(with_model_id(ActionExecuted(ACTION_LISTEN_NAME), model_id))
 
@@ -1159,7 +1159,7 @@ async def test_policy_events_not_applied_if_rejected(
         UserMessage(user_message, sender_id=conversation_id)
     )
 
-    tracker = default_processor.get_tracker(conversation_id)
+    tracker = await default_processor.get_tracker(conversation_id)
     expected_events = with_model_ids(
         [
             ActionExecuted(ACTION_SESSION_START_NAME),
@@ -1321,7 +1321,7 @@ async def test_predict_next_action_with_hidden_rules(
         ],
         slots=domain.slots,
     )
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert action._name == rule_action
     assert prediction.hide_rule_turn
 
@@ -1329,7 +1329,7 @@ async def test_predict_next_action_with_hidden_rules(
         tracker, action, [SlotSet(rule_slot, rule_slot)], prediction
     )
 
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert isinstance(action, ActionListen)
     assert prediction.hide_rule_turn
 
@@ -1338,7 +1338,7 @@ async def test_predict_next_action_with_hidden_rules(
     tracker.events.append(UserUttered(intent={"name": story_intent}))
 
     # rules are hidden correctly if memo policy predicts next actions correctly
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert action._name == story_action
     assert not prediction.hide_rule_turn
 
@@ -1346,12 +1346,12 @@ async def test_predict_next_action_with_hidden_rules(
         tracker, action, [SlotSet(story_slot, story_slot)], prediction
     )
 
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert isinstance(action, ActionListen)
     assert not prediction.hide_rule_turn
 
 
-def test_predict_next_action_raises_limit_reached_exception(
+async def test_predict_next_action_raises_limit_reached_exception(
     default_processor: MessageProcessor,
 ):
     tracker = DialogueStateTracker.from_events(
@@ -1366,7 +1366,7 @@ def test_predict_next_action_raises_limit_reached_exception(
 
     default_processor.max_number_of_predictions = 1
     with pytest.raises(ActionLimitReached):
-        default_processor.predict_next_with_tracker_if_should(tracker)
+        await default_processor.predict_next_with_tracker_if_should(tracker)
 
 
 async def test_processor_logs_text_tokens_in_tracker(
@@ -1397,7 +1397,7 @@ async def test_processor_valid_slot_setting(form_bot_agent: Agent):
         },
     )
     await processor.handle_message(message)
-    tracker = processor.get_tracker("test")
+    tracker = await processor.get_tracker("test")
     assert SlotSet("outdoor_seating", True) in tracker.events
 
 
@@ -1449,33 +1449,33 @@ async def test_parse_message_full_model(trained_moodbot_path: Text):
     assert result["intent"]["name"]
 
 
-def test_predict_next_with_tracker_nlu_only(trained_nlu_model: Text):
+async def test_predict_next_with_tracker_nlu_only(trained_nlu_model: Text):
     processor = Agent.load(model_path=trained_nlu_model).processor
     tracker = DialogueStateTracker("some_id", [])
     tracker.followup_action = None
-    result = processor.predict_next_with_tracker(tracker)
+    result = await processor.predict_next_with_tracker(tracker)
     assert result is None
 
 
-def test_predict_next_with_tracker_core_only(trained_core_model: Text):
+async def test_predict_next_with_tracker_core_only(trained_core_model: Text):
     processor = Agent.load(model_path=trained_core_model).processor
     tracker = DialogueStateTracker("some_id", [])
     tracker.followup_action = None
-    result = processor.predict_next_with_tracker(tracker)
+    result = await processor.predict_next_with_tracker(tracker)
     assert result["policy"] == "MemoizationPolicy"
 
 
-def test_predict_next_with_tracker_full_model(trained_rasa_model: Text):
+async def test_predict_next_with_tracker_full_model(trained_rasa_model: Text):
     processor = Agent.load(model_path=trained_rasa_model).processor
     tracker = DialogueStateTracker("some_id", [])
     tracker.followup_action = None
-    result = processor.predict_next_with_tracker(tracker)
+    result = await processor.predict_next_with_tracker(tracker)
     assert result["policy"] == "MemoizationPolicy"
 
 
-def test_get_tracker_adds_model_id(default_processor: MessageProcessor):
+async def test_get_tracker_adds_model_id(default_processor: MessageProcessor):
     model_id = default_processor.model_metadata.model_id
-    tracker = default_processor.get_tracker("bloop")
+    tracker = await default_processor.get_tracker("bloop")
     assert tracker.model_id == model_id
 
 
@@ -1485,7 +1485,7 @@ async def test_processor_e2e_slot_set(e2e_bot_agent: Agent, caplog: LogCaptureFi
     with caplog.at_level(logging.DEBUG):
         await processor.handle_message(message)
 
-    tracker = processor.get_tracker("test")
+    tracker = await processor.get_tracker("test")
     assert SlotSet("mood", "sad") in tracker.events
     assert any(
         "An end-to-end prediction was made which has triggered the 2nd execution of "
@@ -10,6 +10,7 @@ from pathlib import Path
 from rasa.core import run
 from rasa.core.brokers.sql import SQLEventBroker
 from rasa.core.utils import AvailableEndpoints
+from tests.conftest import AsyncMock
 
 CREDENTIALS_FILE = "data/test_moodbot/credentials.yml"
 
@@ -82,8 +83,10 @@ async def test_close_resources(loop: AbstractEventLoop):
     broker = SQLEventBroker()
     app = Mock()
     app.agent.tracker_store.event_broker = broker
+    app.agent.close = AsyncMock()
 
     with pytest.warns(None) as warnings:
         await run.close_resources(app, loop)
 
     assert len(warnings) == 0
+    app.agent.close.assert_called_once()
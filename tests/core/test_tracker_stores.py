@@ -1,4 +1,7 @@
+import asyncio
+import json
 import logging
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -41,6 +44,8 @@ from rasa.core.tracker_store import (
     InMemoryTrackerStore,
     RedisTrackerStore,
     DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX,
+    REDIS_EVENTS_KEY_SUFFIX,
+    REDIS_SESSION_EVENTS_KEY_SUFFIX,
     SQLTrackerStore,
     DynamoTrackerStore,
     FailSafeTrackerStore,
@@ -48,7 +53,8 @@ from rasa.core.tracker_store import (
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.training_data.message import Message
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
-from tests.core.conftest import MockedMongoTrackerStore
+from tests.conftest import AsyncMock
+from tests.core.conftest import MockedMongoTrackerStore, MockedRedisTrackerStore
 
 test_domain = Domain.load("data/test_domains/default.yml")
 
@@ -99,6 +105,22 @@ def test_dynamo_tracker_floats():
     assert retrieved_timestamp == timestamp
 
 
+async def test_dynamo_tracker_store_uses_table_per_thread():
+    with mock_dynamodb2():
+        tracker_store = DynamoTrackerStore(test_domain)
+        tracker = DialogueStateTracker.from_events("test", [UserUttered("hi")])
+
+        await tracker_store.save_async(tracker)
+        retrieved = await tracker_store.retrieve_async("test")
+        assert retrieved.events == tracker.events
+
+        tables = await asyncio.gather(
+            *[tracker_store._run_blocking(lambda: tracker_store.db) for _ in range(2)]
+        )
+        assert all(table is not tracker_store.db for table in tables)
+        assert all(table.name == tracker_store.table_name for table in tables)
+
+
 def test_restart_after_retrieval_from_tracker_store(domain: Domain):
     store = InMemoryTrackerStore(domain)
     tr = store.get_or_create_tracker("myuser")
@@ -556,6 +578,90 @@ def test_mongo_additional_events_with_session_start(domain: Domain):
     assert isinstance(additional_events[0], UserUttered)
 
 
+def test_mongo_tracker_store_stores_sessions_in_separate_buckets(domain: Domain):
+    tracker_store = MockedMongoTrackerStore(domain)
+    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, "test")
+
+    buckets = list(
+        tracker_store.conversation_events.find({"sender_id": "test"}).sort("bucket")
+    )
+    assert [[event["event"] for event in bucket["events"]] for bucket in buckets] == [
+        [ActionExecuted.type_name],
+        [SessionStarted.type_name, UserUttered.type_name, ActionExecuted.type_name],
+        [SessionStarted.type_name],
+    ]
+    assert "events" not in tracker_store.conversations.find_one({"sender_id": "test"})
+
+    # only the bucket of the latest session is part of the retrieved tracker
+    assert [type(event) for event in tracker.events] == [SessionStarted]
+    assert len(tracker_store.retrieve_full_tracker("test").events) == 5
+    assert tracker_store.number_of_existing_events("test") == 1
+
+
+def test_mongo_tracker_store_limits_events_per_bucket(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(rasa.core.tracker_store, "MONGO_MAX_EVENTS_PER_BUCKET", 2)
+    tracker_store = MockedMongoTrackerStore(domain)
+    events = [UserUttered(f"{i}") for i in range(5)]
+
+    tracker = DialogueStateTracker.from_events("test", events[:3])
+    tracker_store.save(tracker)
+    for event in events[3:]:
+        tracker.update(event)
+    tracker_store.save(tracker)
+
+    buckets = list(
+        tracker_store.conversation_events.find({"sender_id": "test"}).sort("bucket")
+    )
+    assert [len(bucket["events"]) for bucket in buckets] == [2, 2, 1]
+    assert list(tracker_store.retrieve("test").events) == events
+
+
+@pytest.mark.parametrize("stored_sender_id", ["123", 123])
+def test_mongo_tracker_store_moves_events_of_previous_versions_to_buckets(
+    domain: Domain, stored_sender_id: Union[Text, int]
+):
+    tracker_store = MockedMongoTrackerStore(domain)
+    events = [
+        UserUttered("hi"),
+        ActionExecuted(ACTION_SESSION_START_NAME),
+        SessionStarted(),
+        UserUttered("hello"),
+    ]
+    tracker_store.conversations.insert_one(
+        {
+            "sender_id": stored_sender_id,
+            "events": [event.as_dict() for event in events],
+        }
+    )
+
+    tracker = tracker_store.retrieve("123")
+
+    assert list(tracker.events) == events[2:]
+    assert list(tracker_store.retrieve_full_tracker("123").events) == events
+    stored = tracker_store.conversations.find_one({"sender_id": "123"})
+    assert "events" not in stored
+    assert tracker_store.conversation_events.count_documents({"sender_id": "123"}) == 2
+
+    tracker.update(BotUttered("how are you?"))
+    tracker_store.save(tracker)
+    assert list(tracker_store.retrieve_full_tracker("123").events) == [
+        *events,
+        BotUttered("how are you?"),
+    ]
+
+
+def test_mongo_tracker_store_keys(domain: Domain):
+    tracker_store = MockedMongoTrackerStore(domain)
+    for sender_id in ["1", "2"]:
+        tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+        )
+
+    assert sorted(tracker_store.keys()) == ["1", "2"]
+
+
 # we cannot parametrise over this and the previous test due to the different ways of
 # calling _additional_events()
 def test_sql_additional_events(domain: Domain):
@@ -588,9 +694,93 @@ def test_sql_additional_events_with_session_start(domain: Domain):
         assert isinstance(additional_events[0], UserUttered)
 
 
+def test_sql_tracker_store_inserts_new_events_with_one_statement(
+    domain: Domain, tmp_path: Path
+):
+    tracker_store = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    tracker = DialogueStateTracker.from_events(
+        "test", [UserUttered("hi"), BotUttered("hello"), UserUttered("bye")]
+    )
+
+    executed_inserts = []
+
+    def record_insert(
+        connection, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if statement.startswith("INSERT"):
+            executed_inserts.append(len(parameters) if executemany else 1)
+
+    sqlalchemy.event.listen(
+        tracker_store.engine, "before_cursor_execute", record_insert
+    )
+    tracker_store.save(tracker)
+
+    assert executed_inserts == [3]
+    assert list(tracker_store.retrieve("test").events) == list(tracker.events)
+
+
+def test_sql_tracker_store_creates_missing_index(domain: Domain, tmp_path: Path):
+    db_path = str(tmp_path / "rasa.db")
+    # table of a previous version which only had an index on `sender_id`
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as connection:
+        connection.execute(
+            sqlalchemy.text(
+                "CREATE TABLE events (id INTEGER PRIMARY KEY, "
+                "sender_id VARCHAR(255) NOT NULL, type_name VARCHAR(255) NOT NULL, "
+                "timestamp FLOAT, intent_name VARCHAR(255), action_name VARCHAR(255), "
+                "data TEXT)"
+            )
+        )
+        connection.execute(
+            sqlalchemy.text("CREATE INDEX ix_events_sender_id ON events (sender_id)")
+        )
+
+    tracker_store = SQLTrackerStore(domain, db=db_path)
+
+    indexes = sqlalchemy.inspect(tracker_store.engine).get_indexes("events")
+    assert {
+        "name": "ix_events_sender_id_timestamp",
+        "column_names": ["sender_id", "timestamp"],
+    } in [
+        {"name": index["name"], "column_names": index["column_names"]}
+        for index in indexes
+    ]
+
+
+def test_sql_tracker_store_retrieves_session_started_by_other_process(
+    domain: Domain, tmp_path: Path
+):
+    db_path = str(tmp_path / "rasa.db")
+    tracker_store = SQLTrackerStore(domain, db=db_path)
+    other_tracker_store = SQLTrackerStore(domain, db=db_path)
+
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            "test", [SessionStarted(timestamp=1), UserUttered("hi", timestamp=2)]
+        )
+    )
+    # the start of the latest session is cached when retrieving the tracker
+    assert len(tracker_store.retrieve("test").events) == 2
+
+    tracker = other_tracker_store.retrieve("test")
+    tracker.update(SessionStarted(timestamp=3))
+    tracker.update(UserUttered("hello", timestamp=4))
+    other_tracker_store.save(tracker)
+
+    retrieved = tracker_store.retrieve("test")
+    assert [event.timestamp for event in retrieved.events] == [3, 4]
+    assert tracker_store._session_starts["test"] == 3
+    assert len(tracker_store.retrieve_full_tracker("test").events) == 4
+
+
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
-    [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (MockedRedisTrackerStore, {}),
+    ],
 )
 def test_tracker_store_retrieve_with_session_started_events(
     tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict, domain: Domain,
@@ -619,7 +809,11 @@ def test_tracker_store_retrieve_with_session_started_events(
 
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
-    [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (MockedRedisTrackerStore, {}),
+    ],
 )
 def test_tracker_store_retrieve_without_session_started_events(
     tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict, domain,
@@ -654,6 +848,7 @@ def test_tracker_store_retrieve_without_session_started_events(
         (MockedMongoTrackerStore, {}),
         (SQLTrackerStore, {"host": "sqlite:///"}),
         (InMemoryTrackerStore, {}),
+        (MockedRedisTrackerStore, {}),
     ],
 )
 def test_tracker_store_retrieve_with_events_from_previous_sessions(
@@ -679,6 +874,321 @@ def test_tracker_store_retrieve_with_events_from_previous_sessions(
     assert len(actual.events) == len(tracker.events)
 
 
+def test_redis_tracker_store_appends_only_new_events(domain: Domain):
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = "test_redis_tracker_store_appends_only_new_events"
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    tracker_store.save(tracker)
+
+    # the stored events are not written again when the tracker is saved again
+    events_key = tracker_store._key(sender_id, REDIS_EVENTS_KEY_SUFFIX)
+    tracker_store.red.lset(events_key, 0, json.dumps(UserUttered("hey").as_dict()))
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hello"))
+    tracker_store.save(tracker)
+
+    assert [
+        json.loads(event)["text"]
+        for event in tracker_store.red.lrange(events_key, 0, -1)
+    ] == ["hey", "hello"]
+    assert tracker_store.number_of_existing_events(sender_id) == 2
+
+
+def test_redis_tracker_store_with_limited_event_history(domain: Domain):
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = "test_redis_tracker_store_with_limited_event_history"
+
+    for index in range(5):
+        tracker = tracker_store.get_or_create_tracker(sender_id, max_event_history=2)
+        tracker.update(UserUttered(f"message {index}"))
+        tracker_store.save(tracker)
+
+    assert [event.text for event in tracker_store.retrieve(sender_id).events] == [
+        "message 3",
+        "message 4",
+    ]
+    # all events are kept although the tracker only contains the latest ones
+    stored_events = tracker_store.red.lrange(
+        tracker_store._key(sender_id, REDIS_EVENTS_KEY_SUFFIX), 0, -1
+    )
+    assert [json.loads(event).get("text") for event in stored_events] == [None] + [
+        f"message {index}" for index in range(5)
+    ]
+
+
+def test_redis_tracker_store_only_stores_events(domain: Domain):
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = "test_redis_tracker_store_only_stores_events"
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [SlotSet("name", "Peter")], domain.slots
+    )
+    tracker_store.save(tracker)
+
+    assert set(tracker_store.red.keys()) == {
+        tracker_store._key(sender_id, REDIS_EVENTS_KEY_SUFFIX).encode(),
+        tracker_store._key(sender_id, REDIS_SESSION_EVENTS_KEY_SUFFIX).encode(),
+    }
+
+
+def test_redis_tracker_store_migrates_serialised_dialogue(domain: Domain):
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = "test_redis_tracker_store_migrates_serialised_dialogue"
+    events = [
+        UserUttered("hi"),
+        ActionExecuted(ACTION_SESSION_START_NAME),
+        SessionStarted(),
+        UserUttered("hello"),
+    ]
+    legacy_key = tracker_store._get_key_prefix() + sender_id
+    tracker_store.red.set(
+        legacy_key,
+        TrackerStore.serialise_tracker(
+            DialogueStateTracker.from_events(sender_id, events)
+        ),
+        ex=100,
+    )
+
+    assert list(tracker_store.keys()) == [sender_id]
+    assert tracker_store.exists(sender_id)
+
+    tracker = tracker_store.retrieve(sender_id)
+
+    assert list(tracker.events) == events[2:]
+    assert list(tracker_store.retrieve_full_tracker(sender_id).events) == events
+    assert not tracker_store.red.exists(legacy_key)
+    assert 0 < tracker_store.red.ttl(
+        tracker_store._key(sender_id, REDIS_EVENTS_KEY_SUFFIX)
+    )
+    assert list(tracker_store.keys()) == [sender_id]
+
+
+def test_redis_tracker_store_save_migrates_serialised_dialogue(domain: Domain):
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = "test_redis_tracker_store_save_migrates_serialised_dialogue"
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    tracker_store.red.set(
+        tracker_store._get_key_prefix() + sender_id,
+        TrackerStore.serialise_tracker(tracker),
+    )
+
+    tracker.update(BotUttered("hello"))
+    tracker_store.save(tracker)
+
+    assert list(tracker_store.retrieve(sender_id).events) == list(tracker.events)
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+        (MockedRedisTrackerStore, {}),
+    ],
+)
+def test_save_retrieved_tracker_without_reading_stored_events(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    domain: Domain,
+    monkeypatch: MonkeyPatch,
+):
+    tracker_store = tracker_store_type(domain, **tracker_store_kwargs)
+    sender_id = uuid.uuid4().hex
+    tracker_store.save(DialogueStateTracker.from_events(sender_id, [UserUttered("hi")]))
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hello"))
+
+    # the stored events are not read again to find the new events
+    event_broker = Mock()
+    tracker_store.event_broker = event_broker
+    monkeypatch.setattr(
+        tracker_store,
+        "number_of_existing_events",
+        Mock(side_effect=AssertionError("Stored events must not be read.")),
+    )
+    if isinstance(tracker_store, SQLTrackerStore):
+        monkeypatch.setattr(
+            tracker_store,
+            "_read_events",
+            Mock(side_effect=AssertionError("Stored events must not be read.")),
+        )
+    tracker_store.save(tracker)
+
+    event_broker.publish.assert_called_once()
+    assert event_broker.publish.call_args[0][0]["event"] == BotUttered.type_name
+
+    monkeypatch.undo()
+    assert list(tracker_store.retrieve(sender_id).events) == list(tracker.events)
+
+
+def test_stream_events_of_tracker_which_was_not_retrieved(domain: Domain):
+    event_broker = Mock()
+    tracker_store = InMemoryTrackerStore(domain)
+    sender_id = uuid.uuid4().hex
+    tracker_store.save(DialogueStateTracker.from_events(sender_id, [UserUttered("hi")]))
+    tracker_store.event_broker = event_broker
+
+    # e.g. a tracker whose events are replaced via the HTTP API
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            sender_id, [UserUttered("hi"), BotUttered("hello")]
+        )
+    )
+
+    event_broker.publish.assert_called_once()
+    assert event_broker.publish.call_args[0][0]["event"] == BotUttered.type_name
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+        (MockedRedisTrackerStore, {}),
+    ],
+)
+async def test_async_tracker_store_methods(
+    tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict, domain: Domain
+):
+    tracker_store = tracker_store_type(domain, **tracker_store_kwargs)
+    sender_id = uuid.uuid4().hex
+
+    assert not await tracker_store.exists_async(sender_id)
+
+    tracker = await tracker_store.get_or_create_tracker_async(sender_id)
+    tracker.update(UserUttered("hi"))
+    tracker.update(SessionStarted())
+    tracker.update(UserUttered("hello"))
+    await tracker_store.save_async(tracker)
+
+    assert await tracker_store.exists_async(sender_id)
+    assert sender_id in list(await tracker_store.keys_async())
+
+    retrieved = await tracker_store.retrieve_async(sender_id)
+    assert list(retrieved.events) == list(tracker_store.retrieve(sender_id).events)
+
+    full_tracker = await tracker_store.retrieve_full_tracker_async(sender_id)
+    assert list(full_tracker.events) == list(tracker.events)
+    assert await tracker_store.number_of_existing_events_async(
+        sender_id
+    ) == tracker_store.number_of_existing_events(sender_id)
+
+
+async def test_async_methods_of_custom_tracker_store_run_in_thread(domain: Domain):
+    calling_threads = []
+
+    class CustomTrackerStore(TrackerStore):
+        def __init__(self, domain: Domain) -> None:
+            super().__init__(domain)
+            self.trackers = {}
+
+        def save(self, tracker: DialogueStateTracker) -> None:
+            calling_threads.append(threading.current_thread())
+            self.trackers[tracker.sender_id] = tracker
+
+        def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+            calling_threads.append(threading.current_thread())
+            return self.trackers.get(sender_id)
+
+    tracker_store = CustomTrackerStore(domain)
+    tracker = DialogueStateTracker.from_events("test", [UserUttered("hi")])
+
+    await tracker_store.save_async(tracker)
+
+    assert await tracker_store.retrieve_async("test") is tracker
+    assert len(calling_threads) == 2
+    assert threading.current_thread() not in calling_threads
+
+
+async def test_in_memory_tracker_store_async_methods_do_not_use_threads(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    tracker_store = InMemoryTrackerStore(domain)
+    monkeypatch.setattr(
+        asyncio.get_event_loop(),
+        "run_in_executor",
+        Mock(side_effect=AssertionError("No thread must be used.")),
+    )
+
+    await tracker_store.save_async(DialogueStateTracker.from_events("test", []))
+
+    assert await tracker_store.retrieve_async("test") is not None
+
+
+async def test_sql_tracker_store_with_database_file_uses_threads(
+    domain: Domain, tmp_path: Path
+):
+    tracker_store = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    calling_threads = []
+    save = tracker_store.save
+
+    def save_in_thread(tracker: DialogueStateTracker) -> None:
+        calling_threads.append(threading.current_thread())
+        save(tracker)
+
+    tracker_store.save = save_in_thread
+    tracker = DialogueStateTracker.from_events("test", [UserUttered("hi")])
+
+    await tracker_store.save_async(tracker)
+    # the events have to be counted as the tracker wasn't retrieved
+    await tracker_store.save_async(
+        DialogueStateTracker.from_events("test", [UserUttered("hi"), SessionStarted()])
+    )
+
+    retrieved = await tracker_store.retrieve_async("test")
+    assert [type(event) for event in retrieved.events] == [SessionStarted]
+    full_tracker = await tracker_store.retrieve_full_tracker_async("test")
+    assert [type(event) for event in full_tracker.events] == [
+        UserUttered,
+        SessionStarted,
+    ]
+    assert len(calling_threads) == 2
+    assert threading.current_thread() not in calling_threads
+
+
+async def test_sql_tracker_store_with_in_memory_database_does_not_use_threads(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    # every thread has its own in-memory database
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///")
+    monkeypatch.setattr(
+        asyncio.get_event_loop(),
+        "run_in_executor",
+        Mock(side_effect=AssertionError("No thread must be used.")),
+    )
+
+    await tracker_store.save_async(
+        DialogueStateTracker.from_events("test", [UserUttered("hi")])
+    )
+
+    assert await tracker_store.retrieve_async("test") is not None
+
+
+async def test_fail_safe_tracker_store_async_methods_with_errors():
+    mocked_tracker_store = Mock()
+    mocked_tracker_store.save_async = AsyncMock(side_effect=Exception())
+    mocked_tracker_store.retrieve_async = AsyncMock(side_effect=Exception())
+    mocked_tracker_store.keys_async = AsyncMock(side_effect=Exception())
+
+    fallback_tracker_store = Mock()
+    fallback_tracker_store.save_async = AsyncMock()
+    on_error_callback = Mock()
+
+    tracker_store = FailSafeTrackerStore(
+        mocked_tracker_store, on_error_callback, fallback_tracker_store
+    )
+
+    await tracker_store.save_async(None)
+    fallback_tracker_store.save_async.assert_called_once()
+
+    assert await tracker_store.retrieve_async("sender_id") is None
+    assert await tracker_store.keys_async() == []
+    assert on_error_callback.call_count == 3
+
+
 def test_session_scope_error(
     monkeypatch: MonkeyPatch, capsys: CaptureFixture, domain: Domain
 ):
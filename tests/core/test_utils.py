@@ -175,6 +175,19 @@ def test_read_endpoints_from_path(tmp_path: Path):
     )
 
 
+def test_read_graph_runner_endpoint(tmp_path: Path):
+    endpoints_path = write_endpoint_config_to_yaml(
+        tmp_path, {"graph_runner": {"pool_size": 2, "max_queue_size": 10}}
+    )
+
+    available_endpoints = utils.read_endpoints_from_path(endpoints_path)
+
+    assert available_endpoints.graph_runner.kwargs == {
+        "pool_size": 2,
+        "max_queue_size": 10,
+    }
+
+
 def test_read_endpoints_from_wrong_path():
     # noinspection PyProtectedMember
     available_endpoints = utils.read_endpoints_from_path("/some/wrong/path")
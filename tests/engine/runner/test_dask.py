@@ -56,6 +56,29 @@ def test_multi_node_graph_run(eager: bool, default_model_storage: ModelStorage):
     assert results["subtract_2"] == 5
 
 
+async def test_run_async(default_model_storage: ModelStorage):
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+                is_target=True,
+            ),
+        }
+    )
+
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+    results = await runner.run_async(inputs={"first_input": 3, "second_input": 4})
+    assert results["add"] == 7
+
+
 @pytest.mark.parametrize("eager", [True, False])
 def test_target_override(eager: bool, default_model_storage: ModelStorage):
     graph_schema = GraphSchema(
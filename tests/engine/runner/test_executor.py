@@ -0,0 +1,245 @@
+from __future__ import annotations
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Text
+
+import pytest
+
+from rasa.engine.exceptions import GraphRunError, GraphRunQueueFull
+from rasa.engine.graph import ExecutionContext, GraphNodeHook, GraphSchema
+from rasa.engine.runner.executor import GraphRunExecutor
+from rasa.engine.runner.interface import GraphRunner
+from rasa.engine.storage.storage import ModelStorage
+from rasa.utils.endpoints import EndpointConfig
+
+
+class BlockingGraphRunner(GraphRunner):
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    @classmethod
+    def create(
+        cls,
+        graph_schema: GraphSchema,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        hooks: Optional[List[GraphNodeHook]] = None,
+    ) -> BlockingGraphRunner:
+        return cls()
+
+    def run(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        assert self.release.wait(timeout=10)
+        return {"inputs": inputs, "thread": threading.current_thread()}
+
+
+class DoublingGraphRunner(GraphRunner):
+    def __init__(self) -> None:
+        self.batches = []
+
+    @classmethod
+    def create(
+        cls,
+        graph_schema: GraphSchema,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        hooks: Optional[List[GraphNodeHook]] = None,
+    ) -> DoublingGraphRunner:
+        return cls()
+
+    def run(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        self.batches.append(inputs["numbers"])
+        if any(number < 0 for number in inputs["numbers"]):
+            raise ValueError("Negative number.")
+
+        return {"double": [2 * number for number in inputs["numbers"]]}
+
+
+async def test_graph_run_does_not_block_event_loop():
+    executor = GraphRunExecutor()
+    runner = BlockingGraphRunner()
+
+    graph_run = asyncio.ensure_future(executor.run(runner, inputs={"input": 1}))
+    await asyncio.sleep(0.01)
+
+    # the event loop proceeds while the graph is running
+    assert not graph_run.done()
+    assert executor.number_of_pending_runs == 1
+
+    runner.release.set()
+    result = await graph_run
+
+    assert result["inputs"] == {"input": 1}
+    assert result["thread"] != threading.current_thread()
+    assert executor.number_of_pending_runs == 0
+
+
+async def test_graph_run_is_rejected_if_queue_is_full():
+    executor = GraphRunExecutor(pool_size=1, max_queue_size=1)
+    runner = BlockingGraphRunner()
+
+    # one run is executed and one waits for a free worker
+    graph_runs = [asyncio.ensure_future(executor.run(runner)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(GraphRunQueueFull):
+        await executor.run(runner)
+
+    runner.release.set()
+    await asyncio.gather(*graph_runs)
+
+    assert executor.number_of_pending_runs == 0
+    # runs are accepted again once the queue has capacity
+    await executor.run(runner)
+
+
+async def test_concurrent_items_are_batched():
+    executor = GraphRunExecutor(max_batch_size=3, max_batch_wait_ms=100)
+    runner = DoublingGraphRunner()
+
+    results = await asyncio.gather(
+        *[
+            executor.run_batched(runner, "numbers", number, "double")
+            for number in range(5)
+        ]
+    )
+
+    assert results == [0, 2, 4, 6, 8]
+    # the first batch is run once it's full, the second one after the wait time
+    assert runner.batches == [[0, 1, 2], [3, 4]]
+
+    metrics = executor.batching_metrics.as_dict()
+    assert metrics["number_of_batches"] == 2
+    assert metrics["number_of_items"] == 5
+    assert metrics["average_batch_size"] == 2.5
+    assert metrics["max_batch_size"] == 3
+    assert metrics["max_queue_wait_ms"] >= 50
+
+
+async def test_items_are_run_alone_if_batching_is_disabled():
+    executor = GraphRunExecutor()
+    runner = DoublingGraphRunner()
+
+    results = await asyncio.gather(
+        *[
+            executor.run_batched(runner, "numbers", number, "double")
+            for number in range(3)
+        ]
+    )
+
+    assert results == [0, 2, 4]
+    assert runner.batches == [[0], [1], [2]]
+
+
+async def test_items_of_different_graphs_are_not_batched_together():
+    executor = GraphRunExecutor(max_batch_size=10, max_batch_wait_ms=10)
+    runners = [DoublingGraphRunner(), DoublingGraphRunner()]
+
+    results = await asyncio.gather(
+        *[
+            executor.run_batched(runners[number % 2], "numbers", number, "double")
+            for number in range(4)
+        ]
+    )
+
+    assert results == [0, 2, 4, 6]
+    assert runners[0].batches == [[0, 2]]
+    assert runners[1].batches == [[1, 3]]
+
+
+async def test_error_in_batch_is_raised_for_every_item():
+    executor = GraphRunExecutor(max_batch_size=2, max_batch_wait_ms=1000)
+    runner = DoublingGraphRunner()
+
+    results = await asyncio.gather(
+        executor.run_batched(runner, "numbers", 1, "double"),
+        executor.run_batched(runner, "numbers", -1, "double"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+class DroppingGraphRunner(DoublingGraphRunner):
+    def run(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        results = super().run(inputs, targets)
+        return {"double": results["double"][:-1]}
+
+
+async def test_batch_with_missing_outputs_fails_every_item():
+    executor = GraphRunExecutor(max_batch_size=2, max_batch_wait_ms=1000)
+    runner = DroppingGraphRunner()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            executor.run_batched(runner, "numbers", 1, "double"),
+            executor.run_batched(runner, "numbers", 2, "double"),
+            return_exceptions=True,
+        ),
+        timeout=10,
+    )
+
+    assert all(isinstance(result, GraphRunError) for result in results)
+
+
+@pytest.mark.parametrize(
+    "endpoint_config, expected_pool_size, expected_max_queue_size",
+    [
+        (None, 1, None),
+        (EndpointConfig(pool_size=4), 4, None),
+        (EndpointConfig(pool_size=2, max_queue_size=10), 2, 10),
+    ],
+)
+def test_create_executor_from_endpoint_config(
+    endpoint_config: Optional[EndpointConfig],
+    expected_pool_size: int,
+    expected_max_queue_size: Optional[int],
+):
+    executor = GraphRunExecutor.create(endpoint_config)
+
+    assert executor._pool_size == expected_pool_size
+    assert executor._max_queue_size == expected_max_queue_size
+    assert GraphRunExecutor.create(executor) is executor
+
+
+def test_executor_without_config_is_shared():
+    executor = GraphRunExecutor.create(None)
+
+    assert executor.is_shared
+    assert GraphRunExecutor.create(None) is executor
+    assert not GraphRunExecutor.create(EndpointConfig()).is_shared
+
+
+def test_create_batching_executor_from_endpoint_config():
+    executor = GraphRunExecutor.create(
+        EndpointConfig(max_batch_size=8, max_batch_wait_ms=20)
+    )
+
+    assert executor._max_batch_size == 8
+    assert executor._max_batch_wait_time == 0.02
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"pool_size": 0},
+        {"pool_size": -1},
+        {"max_queue_size": -1},
+        {"max_batch_size": 0},
+        {"max_batch_wait_ms": -1},
+    ],
+)
+def test_create_executor_with_invalid_config(config: Dict[Text, Any]):
+    with pytest.raises(ValueError):
+        GraphRunExecutor(**config)
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Text
 from tarsafe import TarSafe
 
 import freezegun
@@ -10,7 +11,15 @@ from _pytest.tmpdir import TempPathFactory
 
 import rasa.shared.utils.io
 from rasa.engine.graph import SchemaNode, GraphSchema, GraphModelConfiguration
-from rasa.engine.storage.local_model_storage import LocalModelStorage
+from rasa.engine.storage.local_model_storage import (
+    LocalModelStorage,
+    MODEL_ARCHIVE_METADATA_FILE,
+)
+from rasa.engine.storage.model_archive import ArchiveFormat, MODEL_ARCHIVE_FORMAT_ENV
+from rasa.engine.storage.model_archive_cache import (
+    MODEL_CACHE_LOCATION_ENV,
+    MODEL_CACHE_SIZE_ENV,
+)
 from rasa.engine.storage.storage import ModelStorage, ModelMetadata
 from rasa.engine.storage.resource import Resource
 from rasa.exceptions import UnsupportedModelVersionError
@@ -261,3 +270,97 @@ def test_create_model_package_with_non_existing_dir(
     )
 
     assert path.exists()
+
+
+def _package_model(tmp_path: Path) -> Path:
+    storage_path = tmp_path / "train model storage"
+    storage_path.mkdir()
+    storage = LocalModelStorage.create(storage_path)
+    with storage.write_to(Resource("resource1")) as directory:
+        (directory / "file.txt").write_text("test")
+
+    archive_path = tmp_path / "model.tar.gz"
+    storage.create_model_package(
+        archive_path,
+        GraphModelConfiguration(
+            GraphSchema({}), GraphSchema({}), TrainingType.BOTH, None, None, "nlu"
+        ),
+        Domain.empty(),
+    )
+    return archive_path
+
+
+def test_metadata_from_archive_does_not_extract_archive(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    archive_path = _package_model(tmp_path)
+
+    def extract(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("The archive must not be extracted.")
+
+    monkeypatch.setattr(LocalModelStorage, "_extract_archive_to_directory", extract)
+
+    metadata = LocalModelStorage.metadata_from_archive(archive_path)
+
+    assert metadata.nlu_target == "nlu"
+    # the metadata is the first member, so that it's read without decompressing
+    # the rest of the archive
+    with TarSafe.open(archive_path, "r:gz") as tar:
+        assert tar.next().name == MODEL_ARCHIVE_METADATA_FILE
+
+
+def test_from_model_archive_uses_cached_archive(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv(MODEL_CACHE_LOCATION_ENV, str(tmp_path / "cache"))
+    monkeypatch.setenv(MODEL_CACHE_SIZE_ENV, "10")
+    archive_path = _package_model(tmp_path)
+
+    first_storage_path = tmp_path / "first"
+    first_storage_path.mkdir()
+    _, metadata = LocalModelStorage.from_model_archive(first_storage_path, archive_path)
+
+    def extract(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("The archive must not be extracted again.")
+
+    monkeypatch.setattr(LocalModelStorage, "_extract_archive_to_directory", extract)
+
+    second_storage_path = tmp_path / "second"
+    second_storage_path.mkdir()
+    storage, cached_metadata = LocalModelStorage.from_model_archive(
+        second_storage_path, archive_path
+    )
+
+    assert cached_metadata.model_id == metadata.model_id
+    with storage.read_from(Resource("resource1")) as directory:
+        assert (directory / "file.txt").read_text() == "test"
+
+    # changes to the model storage don't affect the cache
+    with storage.write_to(Resource("resource1")) as directory:
+        (directory / "file.txt").write_text("changed")
+
+    third_storage_path = tmp_path / "third"
+    third_storage_path.mkdir()
+    storage, _ = LocalModelStorage.from_model_archive(third_storage_path, archive_path)
+    with storage.read_from(Resource("resource1")) as directory:
+        assert (directory / "file.txt").read_text() == "test"
+
+
+@pytest.mark.parametrize("archive_format", ["gz", "tar", "zst"])
+def test_package_and_load_model_with_archive_format(
+    tmp_path: Path, monkeypatch: MonkeyPatch, archive_format: Text
+):
+    monkeypatch.setenv(MODEL_ARCHIVE_FORMAT_ENV, archive_format)
+
+    archive_path = _package_model(tmp_path)
+
+    assert ArchiveFormat.of_archive(archive_path) == ArchiveFormat(archive_format)
+    assert LocalModelStorage.metadata_from_archive(archive_path).nlu_target == "nlu"
+
+    storage_path = tmp_path / "loaded"
+    storage_path.mkdir()
+    storage, metadata = LocalModelStorage.from_model_archive(storage_path, archive_path)
+
+    assert metadata.nlu_target == "nlu"
+    with storage.read_from(Resource("resource1")) as directory:
+        assert (directory / "file.txt").read_text() == "test"
@@ -0,0 +1,110 @@
+import io
+import sys
+import tarfile
+from pathlib import Path
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.engine.storage.model_archive
+from rasa.engine.storage.model_archive import ArchiveFormat, MODEL_ARCHIVE_FORMAT_ENV
+from rasa.exceptions import MissingDependencyException
+from rasa.shared.exceptions import RasaException
+
+
+@pytest.fixture(params=list(ArchiveFormat))
+def archive_format(request) -> ArchiveFormat:
+    return request.param
+
+
+def _directory_to_archive(tmp_path: Path) -> Path:
+    directory = tmp_path / "content"
+    (directory / "sub directory").mkdir(parents=True)
+    (directory / "file.txt").write_text("file")
+    (directory / "sub directory" / "weights").write_bytes(b"\x00" * 1000)
+    return directory
+
+
+def test_archive_round_trip(tmp_path: Path, archive_format: ArchiveFormat):
+    archive_path = tmp_path / "model.tar.gz"
+    with rasa.engine.storage.model_archive.open_for_writing(
+        archive_path, archive_format
+    ) as tar:
+        tar.add(_directory_to_archive(tmp_path), arcname="components")
+
+    assert ArchiveFormat.of_archive(archive_path) == archive_format
+
+    extracted = tmp_path / "extracted"
+    rasa.engine.storage.model_archive.extract(archive_path, extracted)
+
+    assert (extracted / "components" / "file.txt").read_text() == "file"
+    assert (extracted / "components" / "sub directory" / "weights").read_bytes() == (
+        b"\x00" * 1000
+    )
+
+
+def test_members_are_read_in_order(tmp_path: Path, archive_format: ArchiveFormat):
+    archive_path = tmp_path / "model.tar.gz"
+    directory = _directory_to_archive(tmp_path)
+    with rasa.engine.storage.model_archive.open_for_writing(
+        archive_path, archive_format
+    ) as tar:
+        tar.add(directory / "file.txt", arcname="file.txt")
+        tar.add(directory / "sub directory", arcname="sub directory")
+
+    with rasa.engine.storage.model_archive.open_for_reading(archive_path) as tar:
+        first = tar.next()
+        assert first.name == "file.txt"
+        assert tar.extractfile(first).read() == b"file"
+
+
+def _write_unsafe_archive(archive_path: Path, archive_format: ArchiveFormat) -> None:
+    with rasa.engine.storage.model_archive.open_for_writing(
+        archive_path, archive_format
+    ) as tar:
+        content = b"malicious"
+        member = tarfile.TarInfo("../outside.txt")
+        member.size = len(content)
+        # `TarSafe` only checks members when they are extracted
+        tarfile.TarFile.addfile(tar, member, io.BytesIO(content))
+
+
+def test_extract_unsafe_archive(tmp_path: Path, archive_format: ArchiveFormat):
+    archive_path = tmp_path / "model.tar.gz"
+    _write_unsafe_archive(archive_path, archive_format)
+
+    with pytest.raises(Exception):
+        rasa.engine.storage.model_archive.extract(archive_path, tmp_path / "target")
+
+    assert not (tmp_path / "outside.txt").exists()
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(None, ArchiveFormat.GZIP), ("zst", ArchiveFormat.ZSTD)]
+)
+def test_archive_format_from_environment(
+    monkeypatch: MonkeyPatch, value: str, expected: ArchiveFormat
+):
+    if value is None:
+        monkeypatch.delenv(MODEL_ARCHIVE_FORMAT_ENV, raising=False)
+    else:
+        monkeypatch.setenv(MODEL_ARCHIVE_FORMAT_ENV, value)
+
+    assert ArchiveFormat.from_environment() == expected
+
+
+def test_unknown_archive_format_from_environment(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(MODEL_ARCHIVE_FORMAT_ENV, "rar")
+
+    with pytest.raises(RasaException):
+        ArchiveFormat.from_environment()
+
+
+def test_zstd_archive_without_zstandard(tmp_path: Path, monkeypatch: MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(MissingDependencyException):
+        with rasa.engine.storage.model_archive.open_for_writing(
+            tmp_path / "model.tar.gz", ArchiveFormat.ZSTD
+        ):
+            pass
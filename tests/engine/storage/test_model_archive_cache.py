@@ -0,0 +1,174 @@
+import os
+from pathlib import Path
+from typing import List, Text, Union
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.engine.storage.model_archive_cache import (
+    _ARCHIVE_KEYS_DIRECTORY,
+    ModelArchiveCache,
+    MODEL_CACHE_LOCATION_ENV,
+    MODEL_CACHE_SIZE_ENV,
+)
+
+
+class ArchiveExtractor:
+    def __init__(self, file_size_in_bytes: int = 10) -> None:
+        self.extracted_archives: List[Path] = []
+        self.file_size_in_bytes = file_size_in_bytes
+
+    def __call__(self, model_archive_path: Union[Text, Path], directory: Path) -> None:
+        self.extracted_archives.append(Path(model_archive_path))
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "weights").write_bytes(b"0" * self.file_size_in_bytes)
+
+
+def _archive(directory: Path, content: Text) -> Path:
+    path = directory / f"{content}.tar.gz"
+    path.write_text(content)
+    return path
+
+
+def _cached_entries(cache_location: Path) -> List[Path]:
+    return [path for path in cache_location.glob("*") if not path.name.startswith(".")]
+
+
+def test_archive_is_only_extracted_once(tmp_path: Path):
+    cache = ModelArchiveCache(tmp_path / "cache", max_cache_size=1)
+    extract = ArchiveExtractor()
+    archive = _archive(tmp_path, "model")
+
+    first = cache.get_or_extract(archive, extract)
+    second = cache.get_or_extract(archive, extract)
+
+    assert first == second
+    assert (first / "weights").is_file()
+    assert extract.extracted_archives == [archive]
+
+
+def test_archives_with_same_content_share_cache_entry(tmp_path: Path):
+    cache = ModelArchiveCache(tmp_path / "cache", max_cache_size=1)
+    extract = ArchiveExtractor()
+    archive = _archive(tmp_path, "model")
+    copied_archive = tmp_path / "copy.tar.gz"
+    copied_archive.write_bytes(archive.read_bytes())
+
+    assert cache.get_or_extract(archive, extract) == cache.get_or_extract(
+        copied_archive, extract
+    )
+    assert extract.extracted_archives == [archive]
+
+
+def test_cached_archive_is_not_read_again(tmp_path: Path, monkeypatch: MonkeyPatch):
+    cache = ModelArchiveCache(tmp_path / "cache", max_cache_size=1)
+    extract = ArchiveExtractor()
+    archive = _archive(tmp_path, "model")
+
+    first = cache.get_or_extract(archive, extract)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The archive content was hashed again.")
+
+    monkeypatch.setattr(cache, "_content_hash", fail)
+    assert cache.get_or_extract(archive, extract) == first
+
+
+def test_changed_archive_is_extracted_again(tmp_path: Path):
+    cache = ModelArchiveCache(tmp_path / "cache", max_cache_size=1)
+    extract = ArchiveExtractor()
+    archive = _archive(tmp_path, "model")
+
+    first = cache.get_or_extract(archive, extract)
+    archive.write_text("new model")
+    stat = archive.stat()
+    os.utime(archive, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.get_or_extract(archive, extract) != first
+    assert extract.extracted_archives == [archive, archive]
+
+
+def test_disabled_cache(tmp_path: Path):
+    cache = ModelArchiveCache(tmp_path / "cache", max_cache_size=0)
+    extract = ArchiveExtractor()
+
+    assert not cache.is_enabled()
+    assert cache.get_or_extract(_archive(tmp_path, "model"), extract) is None
+    assert not extract.extracted_archives
+    assert not (tmp_path / "cache").exists()
+
+
+def test_archive_which_exceeds_cache_size_is_not_cached(tmp_path: Path):
+    cache_location = tmp_path / "cache"
+    cache = ModelArchiveCache(cache_location, max_cache_size=1)
+    extract = ArchiveExtractor(file_size_in_bytes=2 * 1_048_576)
+
+    assert cache.get_or_extract(_archive(tmp_path, "model"), extract) is None
+    assert list(cache_location.glob("*")) == []
+
+
+def test_least_recently_used_archives_are_dropped(tmp_path: Path):
+    cache_location = tmp_path / "cache"
+    # room for two extracted archives
+    cache = ModelArchiveCache(cache_location, max_cache_size=2.5)
+    extract = ArchiveExtractor(file_size_in_bytes=1_048_576)
+    archives = [_archive(tmp_path, content) for content in ["a", "b", "c"]]
+
+    entry_b = cache.get_or_extract(archives[1], extract)
+    entry_a = cache.get_or_extract(archives[0], extract)
+    # `b` was used before `a`
+    os.utime(entry_b, (1, 1))
+
+    entry_c = cache.get_or_extract(archives[2], extract)
+
+    assert sorted(_cached_entries(cache_location)) == sorted([entry_a, entry_c])
+    assert not entry_b.exists()
+
+
+def test_archive_which_was_cached_concurrently(tmp_path: Path):
+    cache_location = tmp_path / "cache"
+    cache = ModelArchiveCache(cache_location, max_cache_size=1)
+    archive = _archive(tmp_path, "model")
+
+    def extract_while_other_process_extracts(
+        model_archive_path: Union[Text, Path], directory: Path
+    ) -> None:
+        # another process with the same cache directory finishes first
+        other_process_cache = ModelArchiveCache(cache_location, max_cache_size=1)
+        other_process_cache.get_or_extract(model_archive_path, ArchiveExtractor())
+
+        ArchiveExtractor()(model_archive_path, directory)
+
+    entry = cache.get_or_extract(archive, extract_while_other_process_extracts)
+
+    assert (entry / "weights").is_file()
+    # no leftovers of the extraction which lost the race
+    assert sorted(cache_location.glob("*")) == [
+        cache_location / _ARCHIVE_KEYS_DIRECTORY,
+        entry,
+    ]
+
+
+def test_failed_extraction_leaves_no_cache_entry(tmp_path: Path):
+    cache_location = tmp_path / "cache"
+    cache = ModelArchiveCache(cache_location, max_cache_size=1)
+
+    def extract(model_archive_path: Union[Text, Path], directory: Path) -> None:
+        directory.mkdir()
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        cache.get_or_extract(_archive(tmp_path, "model"), extract)
+
+    assert list(cache_location.glob("*")) == []
+
+
+def test_create_cache_from_environment(tmp_path: Path, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(MODEL_CACHE_LOCATION_ENV, str(tmp_path))
+    monkeypatch.setenv(MODEL_CACHE_SIZE_ENV, "100")
+
+    cache = ModelArchiveCache.from_environment()
+
+    assert cache.is_enabled()
+    assert cache._cache_location == tmp_path
+    assert cache._max_cache_size == 100
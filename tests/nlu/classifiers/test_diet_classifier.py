@@ -3,6 +3,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from typing import Callable, List, Optional, Text, Dict, Any, Tuple
 
 import rasa.utils.common
@@ -37,6 +38,7 @@ from rasa.utils.tensorflow.constants import (
     INTENT_CLASSIFICATION,
     MODEL_CONFIDENCE,
     HIDDEN_LAYERS_SIZES,
+    BATCH_SIZES,
 )
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
 from rasa.nlu.classifiers.diet_classifier import DIETClassifier
@@ -52,6 +54,7 @@ from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.constants import DIAGNOSTIC_DATA
 from rasa.shared.nlu.training_data.loading import load_data
 from rasa.utils.tensorflow.model_data_utils import FeatureArray
+from rasa.utils.tensorflow.models import RasaModel
 
 
 @pytest.fixture()
@@ -346,6 +349,25 @@ async def test_train_persist_load_with_only_intent_classification(
     create_diet({MASKED_LM: True, EPOCHS: 1}, load=True, finetune=True)
 
 
+@pytest.mark.timeout(120, func_only=True)
+async def test_load_for_prediction_does_not_run_training_step(
+    create_train_load_and_process_diet: Callable[..., Message],
+    create_diet: Callable[..., DIETClassifier],
+    monkeypatch: MonkeyPatch,
+):
+    config = {EPOCHS: 1}
+    create_train_load_and_process_diet(config)
+
+    def fit(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Loading a model for prediction must not train it.")
+
+    monkeypatch.setattr(RasaModel, "fit", fit)
+
+    loaded_diet = create_diet(config, load=True)
+
+    assert loaded_diet.model.optimizer is None
+
+
 @pytest.mark.parametrize(
     "classifier_params, data_path, output_length, output_should_sum_to_1",
     [
@@ -649,6 +671,50 @@ async def test_process_gives_diagnostic_data(
         assert DIAGNOSTIC_DATA not in processed_message.data
 
 
+@pytest.mark.parametrize("bilou_flag, batch_size", [(True, 64), (False, 64), (True, 2)])
+@pytest.mark.timeout(300, func_only=True)
+async def test_process_batch_gives_same_predictions_as_single_messages(
+    create_diet: Callable[..., DIETClassifier],
+    train_and_preprocess: Callable[..., Tuple[TrainingData, List[GraphComponent]]],
+    process_message: Callable[..., Message],
+    bilou_flag: bool,
+    batch_size: int,
+):
+    training_data, loaded_pipeline = train_and_preprocess(
+        [{"component": WhitespaceTokenizer}, {"component": CountVectorsFeaturizer}],
+        "data/test/demo-rasa-composite-entities.yml",
+    )
+    diet = create_diet(
+        {EPOCHS: 1, RANDOM_SEED: 1, BILOU_FLAG: bilou_flag, BATCH_SIZES: batch_size}
+    )
+    diet.train(training_data=training_data)
+
+    messages = [
+        process_message(loaded_pipeline, Message(data={TEXT: text}))
+        for text in [
+            "I am looking for an italian restaurant",
+            "hi",
+            "show me a mexican place in the centre of town",
+        ]
+    ]
+
+    single_messages = [diet.process([copy.deepcopy(m)])[0] for m in messages]
+    batched_messages = diet.process(copy.deepcopy(messages))
+
+    for single, batched in zip(single_messages, batched_messages):
+        assert batched.get(INTENT)["name"] == single.get(INTENT)["name"]
+        assert batched.get(INTENT)["confidence"] == pytest.approx(
+            single.get(INTENT)["confidence"], abs=1e-5
+        )
+        assert [
+            (entity["start"], entity["end"], entity["entity"])
+            for entity in batched.get(ENTITIES)
+        ] == [
+            (entity["start"], entity["end"], entity["entity"])
+            for entity in single.get(ENTITIES)
+        ]
+
+
 @pytest.mark.parametrize(
     "initial_sparse_feature_sizes, final_sparse_feature_sizes, label_attribute",
     [
@@ -806,3 +806,50 @@ def test_use_shared_vocab_exception(
         )
     else:
         new_cvf.train(data)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"analyzer": "word", "max_ngram": 2},
+        {"analyzer": "char_wb", "min_ngram": 1, "max_ngram": 3},
+        {"analyzer": "char", "min_ngram": 1, "max_ngram": 3},
+        {"OOV_token": "__oov__"},
+    ],
+)
+def test_count_vector_featurizer_process_batch_like_single_messages(
+    config: Dict[Text, Any],
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    ftr = create_featurizer(config)
+
+    sentences = ["hello there", "what's up?", "hello hello 123", "__oov__ bye"]
+    train_messages = [
+        Message(data={TEXT: sentence, INTENT: "intent"}) for sentence in sentences
+    ]
+    whitespace_tokenizer.process(train_messages)
+    ftr.train(TrainingData(train_messages))
+
+    test_sentences = ["hello there", "unknown words", "", "hi 42 hello", "bye"]
+    messages = [Message(data={TEXT: sentence}) for sentence in test_sentences]
+    whitespace_tokenizer.process(messages)
+    ftr.process(messages)
+
+    for sentence, message in zip(test_sentences, messages):
+        tokens = ftr._get_processed_message_tokens_by_attribute(message, TEXT)
+        seq_vecs, sen_vecs = message.get_sparse_features(TEXT, [])
+
+        if not tokens:
+            assert seq_vecs is None and sen_vecs is None
+            continue
+
+        vectorizer = ftr.vectorizers[TEXT]
+        expected_seq_vecs = vectorizer.transform(tokens).toarray()
+        expected_sen_vecs = vectorizer.transform([" ".join(tokens)]).toarray()
+
+        assert isinstance(seq_vecs.features, scipy.sparse.coo_matrix)
+        assert isinstance(sen_vecs.features, scipy.sparse.coo_matrix)
+        assert np.array_equal(seq_vecs.features.toarray(), expected_seq_vecs)
+        assert np.array_equal(sen_vecs.features.toarray(), expected_sen_vecs)
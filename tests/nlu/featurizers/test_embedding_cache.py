@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from rasa.nlu.featurizers.dense_featurizer.embedding_cache import EmbeddingCache
+
+
+def _embeddings(value: float, number_of_tokens: int = 3) -> np.ndarray:
+    return (
+        np.full((number_of_tokens, 4), value, dtype=np.float32),
+        np.full((1, 4), -value, dtype=np.float32),
+    )
+
+
+def test_embedding_cache_key():
+    assert EmbeddingCache.key("bert", "text", "hello") == EmbeddingCache.key(
+        "bert", "text", "hello"
+    )
+    assert EmbeddingCache.key("bert", "text", "hello") != EmbeddingCache.key(
+        "gpt", "text", "hello"
+    )
+    assert EmbeddingCache.key("bert", "text", "hello") != EmbeddingCache.key(
+        "bert", "action_text", "hello"
+    )
+
+
+def test_embedding_cache_in_memory():
+    cache = EmbeddingCache(max_entries_in_memory=2)
+
+    assert cache.get("yes") is None
+    cache.add("yes", *_embeddings(1))
+    cache.add("no", *_embeddings(2))
+
+    sequence_embeddings, sentence_embeddings = cache.get("yes")
+    assert np.array_equal(sequence_embeddings, _embeddings(1)[0])
+    assert np.array_equal(sentence_embeddings, _embeddings(1)[1])
+
+    # least recently used embeddings are removed
+    cache.add("maybe", *_embeddings(3))
+    assert cache.get("no") is None
+    assert cache.get("yes") is not None
+    assert cache.get("maybe") is not None
+
+    assert (cache.hits, cache.misses) == (3, 2)
+    assert cache.hit_rate == 0.6
+
+
+def test_embedding_cache_returns_copies():
+    cache = EmbeddingCache()
+    cache.add("yes", *_embeddings(1))
+
+    sequence_embeddings, _ = cache.get("yes")
+    sequence_embeddings[0, 0] = 42
+
+    assert np.array_equal(cache.get("yes")[0], _embeddings(1)[0])
+
+
+def test_embedding_cache_disabled():
+    cache = EmbeddingCache(max_entries_in_memory=0)
+    cache.add("yes", *_embeddings(1))
+
+    assert not cache.is_enabled
+    assert cache.get("yes") is None
+
+
+def test_embedding_cache_on_disk(tmp_path: Path):
+    cache = EmbeddingCache(max_entries_in_memory=0, directory=str(tmp_path))
+    cache.add("yes", *_embeddings(1))
+    cache.add("no", *_embeddings(2, number_of_tokens=0))
+    cache.add("inference", *_embeddings(3), on_disk=False)
+
+    # embeddings can be read before they are persisted
+    assert np.array_equal(cache.get("yes")[0], _embeddings(1)[0])
+    cache.persist()
+
+    cache = EmbeddingCache(max_entries_in_memory=0, directory=str(tmp_path))
+    cache.add("maybe", *_embeddings(4))
+    cache.persist()
+
+    cache = EmbeddingCache(directory=str(tmp_path))
+    for key, value, number_of_tokens in [("yes", 1, 3), ("no", 2, 0), ("maybe", 4, 3)]:
+        sequence_embeddings, sentence_embeddings = cache.get(key)
+        expected_sequence, expected_sentence = _embeddings(value, number_of_tokens)
+        assert np.array_equal(sequence_embeddings, expected_sequence)
+        assert np.array_equal(sentence_embeddings, expected_sentence)
+
+    assert cache.get("inference") is None
+
+
+def test_embedding_cache_ignores_incompletely_written_embeddings(tmp_path: Path):
+    cache = EmbeddingCache(directory=str(tmp_path))
+    cache.add("yes", *_embeddings(1))
+    cache.add("no", *_embeddings(2))
+    cache.persist()
+
+    data_file = tmp_path / EmbeddingCache.DATA_FILE_NAME
+    data_file.write_bytes(data_file.read_bytes()[:-4])
+
+    cache = EmbeddingCache(directory=str(tmp_path))
+    assert cache.get("yes") is not None
+    assert cache.get("no") is None
+
+
+def test_embedding_cache_shared_by_several_writers(tmp_path: Path):
+    cache = EmbeddingCache(max_entries_in_memory=0, directory=str(tmp_path))
+    other_cache = EmbeddingCache(max_entries_in_memory=0, directory=str(tmp_path))
+
+    cache.add("yes", *_embeddings(1))
+    other_cache.add("no", *_embeddings(2, number_of_tokens=5))
+    cache.add("maybe", *_embeddings(3))
+    other_cache.persist()
+    cache.persist()
+
+    cache = EmbeddingCache(max_entries_in_memory=0, directory=str(tmp_path))
+    for key, value, number_of_tokens in [("yes", 1, 3), ("no", 2, 5), ("maybe", 3, 3)]:
+        sequence_embeddings, sentence_embeddings = cache.get(key)
+        expected_sequence, expected_sentence = _embeddings(value, number_of_tokens)
+        assert np.array_equal(sequence_embeddings, expected_sequence)
+        assert np.array_equal(sentence_embeddings, expected_sentence)
+
+
+def test_embedding_cache_used_by_several_threads(tmp_path: Path):
+    cache = EmbeddingCache(max_entries_in_memory=5, directory=str(tmp_path))
+    number_of_lookups = 200
+
+    def look_up(number: int) -> None:
+        key = str(number % 20)
+        if cache.get(key) is None:
+            cache.add(key, *_embeddings(number % 20))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(look_up, range(number_of_lookups)))
+
+    assert cache.hits + cache.misses == number_of_lookups
+    assert len(cache._in_memory) == 5
+    for number in range(20):
+        sequence_embeddings, _ = cache.get(str(number))
+        assert np.array_equal(sequence_embeddings, _embeddings(number)[0])
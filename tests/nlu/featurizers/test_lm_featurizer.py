@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from typing import Text, List, Dict, Tuple, Any, Callable
 
 import numpy as np
@@ -805,3 +806,171 @@ def test_lm_featurizer_correctly_handle_whitespace_token(
     result, _ = lm_featurizer._tokenize_example(message, TEXT)
 
     assert [(token.text, token.start) for token in result] == expected_feature_tokens
+
+
+def test_lm_featurizer_only_embeds_uncached_texts(
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    monkeypatch: MonkeyPatch,
+    whitespace_tokenizer: WhitespaceTokenizer,
+    tmp_path: Path,
+):
+    monkeypatch.setattr(
+        LanguageModelFeaturizer, "_load_model_instance", lambda _: None,
+    )
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_lm_tokenize",
+        lambda _, text: ([len(text), ord(text[0])], [text[:1], text[1:]]),
+    )
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_lm_specific_token_cleanup",
+        lambda _, token_ids, token_strings: (token_ids, token_strings),
+    )
+
+    embedded_texts = []
+
+    def get_model_features_for_batch(
+        self: LanguageModelFeaturizer,
+        batch_token_ids: List[List[int]],
+        batch_tokens: List[List[Token]],
+        batch_examples: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        embedded_texts.extend(example.get(attribute) for example in batch_examples)
+        sentence_embeddings = np.array(
+            [[float(sum(token_ids))] * 3 for token_ids in batch_token_ids]
+        )
+        sequence_embeddings = np.array(
+            [
+                np.array([[float(len(token.text))] * 3 for token in tokens])
+                for tokens in batch_tokens
+            ]
+        )
+        return sentence_embeddings, sequence_embeddings
+
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_get_model_features_for_batch",
+        get_model_features_for_batch,
+    )
+
+    config = {"model_name": "bert", "embeddings_cache_dir": str(tmp_path)}
+    texts = ["hello there", "yes", "no", "talk to agent"]
+
+    def process_training_data(texts: List[Text]) -> List[Message]:
+        training_data = TrainingData(
+            [Message.build(text=text, intent="intent") for text in texts]
+        )
+        whitespace_tokenizer.process_training_data(training_data)
+        create_language_model_featurizer(config).process_training_data(training_data)
+        return training_data.training_examples
+
+    messages = process_training_data(texts)
+    assert sorted(embedded_texts) == sorted(texts)
+
+    embedded_texts.clear()
+    new_texts = ["yes please", "no thanks"]
+    messages_with_new_texts = process_training_data(texts + new_texts)
+    assert sorted(embedded_texts) == sorted(new_texts)
+
+    for message, cached_message in zip(messages, messages_with_new_texts):
+        sequence_features, sentence_features = message.get_dense_features(TEXT, [])
+        (
+            cached_sequence_features,
+            cached_sentence_features,
+        ) = cached_message.get_dense_features(TEXT, [])
+
+        assert np.array_equal(
+            sequence_features.features, cached_sequence_features.features
+        )
+        assert np.array_equal(
+            sentence_features.features, cached_sentence_features.features
+        )
+
+
+@pytest.mark.parametrize(
+    "sequence_lengths, batch_token_budget, expected_batches",
+    [
+        ([], 10, []),
+        ([3, 1, 2, 1], 4, [[1, 3], [2], [0]]),
+        ([3, 1, 2, 1], 6, [[1, 3, 2], [0]]),
+        ([2, 2, 2, 2, 2], 100, [[0, 1, 2, 3, 4]]),
+        ([5, 20, 5], 10, [[0, 2], [1]]),
+    ],
+)
+def test_create_length_bucketed_batches(
+    sequence_lengths: List[int],
+    batch_token_budget: int,
+    expected_batches: List[List[int]],
+):
+    assert (
+        LanguageModelFeaturizer._create_length_bucketed_batches(
+            sequence_lengths, batch_token_budget
+        )
+        == expected_batches
+    )
+
+
+def test_lm_featurizer_batches_training_examples_by_length(
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    monkeypatch: MonkeyPatch,
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    monkeypatch.setattr(
+        LanguageModelFeaturizer, "_load_model_instance", lambda _: None,
+    )
+    monkeypatch.setattr(
+        LanguageModelFeaturizer, "_lm_tokenize", lambda _, text: ([1], [text]),
+    )
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_lm_specific_token_cleanup",
+        lambda _, token_ids, token_strings: (token_ids, token_strings),
+    )
+
+    batches = []
+
+    def get_model_features_for_batch(
+        self: LanguageModelFeaturizer,
+        batch_token_ids: List[List[int]],
+        batch_tokens: List[List[Token]],
+        batch_examples: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        batches.append([len(token_ids) for token_ids in batch_token_ids])
+        sentence_embeddings = np.array(
+            [[float(len(token_ids))] for token_ids in batch_token_ids]
+        )
+        sequence_embeddings = np.array(
+            [np.zeros((len(tokens), 1)) for tokens in batch_tokens]
+        )
+        return sentence_embeddings, sequence_embeddings
+
+    monkeypatch.setattr(
+        LanguageModelFeaturizer,
+        "_get_model_features_for_batch",
+        get_model_features_for_batch,
+    )
+
+    texts = ["a b c d e f", "a", "a b c", "a b", "a b c d e f g h", "b"]
+    training_data = TrainingData(
+        [Message.build(text=text, intent="intent") for text in texts]
+    )
+    whitespace_tokenizer.process_training_data(training_data)
+    featurizer = create_language_model_featurizer(
+        {"model_name": "bert", "batch_token_budget": 6}
+    )
+    featurizer.process_training_data(training_data)
+
+    # the budget includes the two special tokens which BERT adds to every sequence
+    assert batches == [[1, 1], [2], [3], [6], [8]]
+    for message in training_data.training_examples:
+        _, sentence_features = message.get_dense_features(TEXT, [])
+        assert sentence_features.features[0][0] == len(message.get(TEXT).split())
@@ -1,4 +1,5 @@
-from typing import Dict, List, Text
+import re
+from typing import Dict, List, Text, Tuple
 
 import pytest
 
@@ -13,7 +14,7 @@ from rasa.shared.nlu.training_data.message import Message
         (
             {"name": "person", "elements": ["Max", "John"]},
             {},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [{"name": "person", "elements": ["Max", "John"]}],
         ),
         ({}, {}, []),
         (
@@ -26,7 +27,7 @@ from rasa.shared.nlu.training_data.message import Message
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             [
                 {"name": "zipcode", "pattern": "[0-9]{5}"},
-                {"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"},
+                {"name": "person", "elements": ["Max", "John"]},
             ],
         ),
         (
@@ -36,8 +37,13 @@ from rasa.shared.nlu.training_data.message import Message
                 {"name": "zipcode", "pattern": "[0-9]{5}"},
                 {
                     "name": "plates",
-                    "pattern": "(\\btacos\\b|\\bbeef\\b|\\bmapo\\ "
-                    "tofu\\b|\\bburrito\\b|\\blettuce\\ wrap\\b)",
+                    "elements": [
+                        "tacos",
+                        "beef",
+                        "mapo tofu",
+                        "burrito",
+                        "lettuce wrap",
+                    ],
                 },
             ],
         ),
@@ -102,7 +108,7 @@ def test_extract_patterns_use_only_entities_regexes(
         (
             "person",
             {"name": "person", "elements": ["Max", "John"]},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [{"name": "person", "elements": ["Max", "John"]}],
         ),
         ("entity", {"name": "person", "elements": ["Max", "John"]}, []),
     ],
@@ -150,7 +156,7 @@ def test_extract_patterns_use_only_entities_lookup_tables(
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             True,
             False,
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [{"name": "person", "elements": ["Max", "John"]}],
         ),
         (
             {"name": "person", "elements": ["Max", "John"]},
@@ -218,3 +224,104 @@ def test_regex_validation(
     assert "Model training failed." in str(e.value)
     assert "not a valid regex." in str(e.value)
     assert "Please update your nlu training data configuration" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "elements, text",
+    [
+        (["Max", "John"], "Max and John are friends of MaxJohn"),
+        (["new", "new york", "york"], "I moved from new york to new jersey"),
+        (["new york", "new"], "I moved from new york to new jersey"),
+        (["a b", "b c"], "a b c"),
+        (["ab", "abab"], "abababab ab"),
+        (["mapo tofu", "tofu"], "mapo tofu,tofu and Mapo Tofu"),
+        (["club?mate", "c++"], "I'd like a club?mate and some c++"),
+        (["_name", "name"], "my_name name"),
+        (["İstanbul", "straße"], "İSTANBUL, istanbul, Straße and STRASSE"),
+        (["München"], "münchen and MÜNCHEN and Münchener"),
+        (["", "x"], "x y x"),
+    ],
+)
+@pytest.mark.parametrize("case_sensitive", [True, False])
+@pytest.mark.parametrize("use_word_boundaries", [True, False])
+def test_lookup_table_matcher_matches_regex(
+    elements: List[Text], text: Text, case_sensitive: bool, use_word_boundaries: bool
+):
+    regex = pattern_utils._generate_lookup_regex(
+        {"name": "table", "elements": [element for element in elements if element]},
+        use_word_boundaries,
+    )
+    flags = 0 if case_sensitive else re.IGNORECASE
+    expected = [match.span() for match in re.finditer(regex, text, flags=flags)]
+
+    matcher = pattern_utils.LookupTableMatcher(
+        elements, case_sensitive, use_word_boundaries
+    )
+
+    assert matcher.find(text) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, text, expected_matches",
+    [
+        (
+            {"name": "zipcode", "pattern": "[0-9]{5}"},
+            "10115 and 80331",
+            [(0, 5), (10, 15)],
+        ),
+        (
+            {"name": "person", "elements": ["Max", "John"]},
+            "max and John",
+            [(0, 3), (8, 12)],
+        ),
+        (
+            {"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"},
+            "max or Maxi",
+            [(0, 3)],
+        ),
+    ],
+)
+def test_create_pattern_matcher(
+    pattern: Dict[Text, Text], text: Text, expected_matches: List[Tuple[int, int]]
+):
+    find_matches = pattern_utils.create_pattern_matcher(pattern, case_sensitive=False)
+
+    assert find_matches(text) == expected_matches
+
+
+def test_lookup_table_matcher_without_elements():
+    matcher = pattern_utils.LookupTableMatcher(["", ""])
+
+    assert matcher.find("nothing to find") == []
+
+
+def test_pattern_matchers_are_shared():
+    regex = {"name": "zipcode", "pattern": "[0-9]{5}"}
+    lookup_table = {"name": "person", "elements": ["Max", "John"]}
+
+    find_zipcodes = pattern_utils.create_pattern_matcher(regex, case_sensitive=False)
+    find_persons = pattern_utils.create_pattern_matcher(
+        lookup_table, case_sensitive=False
+    )
+
+    assert (
+        pattern_utils.create_pattern_matcher(dict(regex), case_sensitive=False).__self__
+        is find_zipcodes.__self__
+    )
+    assert (
+        pattern_utils.create_pattern_matcher(
+            {"name": "person", "elements": ["Max", "John"]}, case_sensitive=False
+        ).__self__
+        is find_persons.__self__
+    )
+    # matchers for other options must not be shared
+    assert (
+        pattern_utils.create_pattern_matcher(regex, case_sensitive=True).__self__
+        is not find_zipcodes.__self__
+    )
+    assert (
+        pattern_utils.create_pattern_matcher(
+            lookup_table, case_sensitive=False, use_word_boundaries=False
+        ).__self__
+        is not find_persons.__self__
+    )
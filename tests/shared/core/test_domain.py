@@ -1277,6 +1277,57 @@ def test_domain_deepcopy(domain: Domain):
     assert new_domain.action_names_or_texts is not domain.action_names_or_texts
 
 
+def test_domain_as_dict_returns_new_serialization(domain: Domain):
+    serialized = domain.as_dict()
+    serialized[KEY_INTENTS].clear()
+    serialized[KEY_SLOTS].clear()
+
+    serialized_again = domain.as_dict()
+    assert serialized_again[KEY_INTENTS]
+    assert serialized_again[KEY_SLOTS]
+
+
+def test_domain_merge_does_not_modify_serialized_domains():
+    domain = Domain.from_yaml(
+        """
+        config:
+          store_entities_as_slots: true
+        actions:
+        - action_custom
+        """
+    )
+    other = Domain.from_yaml(
+        """
+        config:
+          store_entities_as_slots: false
+        actions:
+        - my_form
+        forms:
+          my_form:
+            required_slots: []
+        """
+    )
+    serialized_domain = copy.deepcopy(domain.as_dict())
+    serialized_other = copy.deepcopy(other.as_dict())
+
+    merged = other.merge(domain, override=True)
+
+    assert merged.store_entities_as_slots
+    assert domain.as_dict() == serialized_domain
+    assert other.as_dict() == serialized_other
+
+
+def test_domain_copy_is_serialized_again(domain: Domain):
+    fingerprint = domain.fingerprint()
+
+    domain_without_responses = copy.copy(domain)
+    domain_without_responses.responses = {}
+
+    assert domain_without_responses.as_dict()["responses"] == {}
+    assert domain_without_responses.fingerprint() != fingerprint
+    assert domain.fingerprint() == fingerprint
+
+
 @pytest.mark.parametrize(
     "response_key, validation",
     [("utter_chitchat/faq", True), ("utter_chitchat", False)],
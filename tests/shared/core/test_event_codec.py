@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from rasa.shared.core import event_codec
+from rasa.shared.core.events import (
+    ActionExecuted,
+    BotUttered,
+    Event,
+    SessionStarted,
+    SlotSet,
+    UserUttered,
+)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        UserUttered(
+            "Hällo / 👋",
+            {"name": "greet", "confidence": 0.987654321},
+            [{"entity": "name", "value": "Rasa", "start": 0, "end": 5}],
+            timestamp=1634567890.1234567,
+        ),
+        BotUttered("hi", {"buttons": [{"title": "a", "payload": "/a"}]}),
+        SlotSet("amount", 2 ** 40),
+        SlotSet("empty", None),
+        ActionExecuted("action_listen", policy="RulePolicy", confidence=1.0),
+        SessionStarted(metadata={"channel": "rest"}),
+    ],
+)
+def test_event_round_trip(event: Event):
+    serialised = event_codec.serialise_event(event)
+
+    assert json.loads(serialised) == event.as_dict()
+    assert event_codec.loads(serialised) == event.as_dict()
+    assert event_codec.loads(serialised.encode()) == event.as_dict()
+    assert Event.from_parameters(event_codec.loads(serialised)) == event
+
+
+def test_dumps_falls_back_to_json_for_unsupported_values():
+    too_large_integer = 2 ** 70
+
+    serialised = event_codec.dumps({"value": too_large_integer})
+
+    assert json.loads(serialised) == {"value": too_large_integer}
+
+
+def test_dumps_with_value_which_is_not_json_serializable():
+    with pytest.raises(TypeError):
+        event_codec.dumps({"value": object()})
@@ -1,4 +1,5 @@
 import copy
+import gc
 
 import pytest
 import pytz
@@ -783,3 +784,27 @@ def test_event_fingerprint_uniqueness(event: Event):
 
 def test_session_started_event_is_not_serialised():
     assert SessionStarted().as_story_string() is None
+
+
+def test_resolve_by_type_finds_event_classes_which_are_defined_later():
+    assert Event.resolve_by_type("action") is ActionExecuted
+
+    class CustomActionExecuted(ActionExecuted):
+        type_name = "custom_action"
+
+    try:
+        assert Event.resolve_by_type("custom_action") is CustomActionExecuted
+        assert Event.resolve_by_type("action") is ActionExecuted
+    finally:
+        # don't keep the event class known in other tests
+        del CustomActionExecuted
+        gc.collect()
+        Event._classes_by_type_name = None
+
+
+def test_resolve_by_type_with_unknown_type_name():
+    assert Event.resolve_by_type("unknown", default=ActionExecuted) is ActionExecuted
+    assert Event.resolve_by_type("topic") is None
+
+    with pytest.raises(ValueError):
+        Event.resolve_by_type("unknown")
@@ -393,6 +393,44 @@ def test_restart_event(domain: Domain):
     assert len(list(recovered.generate_all_prior_trackers())) == 1
 
 
+def test_events_since_persisted_events():
+    tracker = DialogueStateTracker.from_events("test", [UserUttered("hi")])
+
+    # it's unknown which events are persisted
+    assert tracker.events_since_persisted_events() is None
+
+    tracker.mark_events_as_persisted()
+    assert tracker.events_since_persisted_events() == []
+
+    new_events = [BotUttered("hello"), ActionExecuted(ACTION_LISTEN_NAME)]
+    tracker.update_with_events(new_events, None)
+    assert tracker.events_since_persisted_events() == new_events
+
+
+def test_events_since_persisted_events_of_empty_tracker():
+    tracker = DialogueStateTracker("test", None)
+    tracker.mark_events_as_persisted()
+
+    tracker.update(UserUttered("hi"))
+
+    assert tracker.events_since_persisted_events() == [UserUttered("hi")]
+
+
+def test_events_since_persisted_events_with_max_event_history():
+    tracker = DialogueStateTracker.from_events(
+        "test", [UserUttered("hi"), BotUttered("hello")], max_event_history=3
+    )
+    tracker.mark_events_as_persisted()
+
+    tracker.update(UserUttered("how are you?"))
+    assert tracker.events_since_persisted_events() == [UserUttered("how are you?")]
+
+    # the last persisted event was dropped from the tracker
+    tracker.update(BotUttered("good"))
+    tracker.update(UserUttered("great"))
+    assert tracker.events_since_persisted_events() is None
+
+
 def test_session_start(domain: Domain):
     tracker = DialogueStateTracker("default", domain.slots)
     # the retrieved tracker should be empty
@@ -516,6 +554,68 @@ def test_traveling_back_in_time(domain: Domain):
     assert len(list(tracker.generate_all_prior_trackers())) == 2
 
 
+def _states_without_cache(
+    tracker: DialogueStateTracker, domain: Domain
+) -> List[Dict[Text, Any]]:
+    return [
+        domain.get_active_state(prior_tracker)
+        for prior_tracker, _ in tracker.generate_all_prior_trackers()
+    ]
+
+
+@pytest.mark.parametrize(
+    "reverting_event", [ActionReverted(), UserUtteranceReverted(), Restarted()]
+)
+def test_past_states_are_updated_incrementally(
+    moodbot_domain: Domain, reverting_event: Event
+):
+    tracker = DialogueStateTracker("default", moodbot_domain.slots)
+    events = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("greet"),
+        ActionExecuted("utter_greet"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("mood_unhappy"),
+        ActionExecuted("utter_cheer_up"),
+        reverting_event,
+        ActionExecuted("utter_did_that_help"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("affirm"),
+    ]
+
+    for event in events:
+        tracker.update(event)
+        assert tracker.past_states(moodbot_domain) == _states_without_cache(
+            tracker, moodbot_domain
+        )
+
+
+def test_past_states_cache_is_reused(moodbot_domain: Domain):
+    tracker = tracker_from_dialogue(TEST_MOODBOT_DIALOGUE, moodbot_domain)
+
+    states = tracker.past_states(moodbot_domain)
+    cache = tracker._prior_states_cache
+
+    # modifying the returned states must not modify the cached states
+    states[0].clear()
+
+    assert tracker.past_states(moodbot_domain) == _states_without_cache(
+        tracker, moodbot_domain
+    )
+    assert tracker._prior_states_cache is cache
+
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+    assert tracker.past_states(moodbot_domain) == _states_without_cache(
+        tracker, moodbot_domain
+    )
+    assert tracker._prior_states_cache is cache
+
+    tracker.update(UserUtteranceReverted())
+
+    assert tracker._prior_states_cache is None
+
+
 def test_tracker_init_copy(domain: Domain):
     sender_id = "some-id"
     tracker = DialogueStateTracker(sender_id, domain.slots)
@@ -0,0 +1,897 @@
+"""Benchmarks which make sure that performance critical code paths scale well.
+
+The benchmarks don't compare absolute timings (which depend on the machine running
+the tests) but how the timings change when the size of the input grows.
+"""
+from http import HTTPStatus
+import asyncio
+import json
+from pathlib import Path
+import random
+import re
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Type
+
+import numpy as np
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.core.agent import load_agent
+from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
+from rasa.core.featurizers.tracker_featurizers import (
+    IntentMaxHistoryTrackerFeaturizer,
+    MaxHistoryTrackerFeaturizer,
+)
+from rasa.core.featurizers.training_tracker_states import TrainingTrackerStates
+from rasa.core.lock_store import InMemoryLockStore, LockStore
+from rasa.core.policies.rule_policy import RuleIndex, RulePolicy
+from rasa.core.policies.ted_policy import TEDPolicy
+from rasa.core.tracker_store import SQLTrackerStore
+from rasa.engine.graph import ExecutionContext, GraphModelConfiguration, GraphSchema
+from rasa.engine.storage.local_model_storage import LocalModelStorage
+from rasa.engine.storage.model_archive import ArchiveFormat, MODEL_ARCHIVE_FORMAT_ENV
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.nlu.classifiers.diet_classifier import DIETClassifier
+from rasa.nlu.featurizers.dense_featurizer.lm_featurizer import LanguageModelFeaturizer
+from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+    CountVectorsFeaturizer,
+)
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+import rasa.nlu.utils.pattern_utils as pattern_utils
+from rasa.shared.core import event_codec
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, PREVIOUS_ACTION, USER
+from rasa.shared.core.domain import State
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, BotUttered, Event, SessionStarted
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.importers.autoconfig import TrainingType
+from rasa.shared.importers.rasa import RasaFileImporter
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT, TEXT
+from rasa.shared.nlu.training_data.message import Message
+from rasa.shared.nlu.training_data.training_data import TrainingData
+from rasa.utils.tensorflow.constants import EPOCHS
+from rasa.utils.tensorflow.models import RasaModel
+import rasa.core.training
+import rasa.server
+import rasa.shared.utils.common
+from tests.core.utilities import user_uttered
+
+
+def _median_duration(function: Callable[[], None], repetitions: int = 5) -> float:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations)
+
+
+def _latency_percentiles(
+    function: Callable[[], None], repetitions: int = 30
+) -> Tuple[float, float]:
+    durations: List[float] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return np.percentile(durations, 50), np.percentile(durations, 99)
+
+
+def _add_turn(tracker: DialogueStateTracker) -> None:
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(user_uttered("greet"))
+
+
+@pytest.mark.parametrize("number_of_turns", [10, 100, 500])
+def test_past_states_per_turn_is_independent_of_conversation_length(
+    moodbot_domain: Domain, monkeypatch: MonkeyPatch, number_of_turns: int
+):
+    tracker = DialogueStateTracker("benchmark", moodbot_domain.slots)
+    for _ in range(number_of_turns):
+        _add_turn(tracker)
+        tracker.past_states(moodbot_domain)
+        tracker.update(ActionExecuted("utter_greet"))
+
+    _add_turn(tracker)
+
+    computed_states = []
+    get_active_state = moodbot_domain.get_active_state
+
+    def spy(*args, **kwargs):
+        computed_states.append(args)
+        return get_active_state(*args, **kwargs)
+
+    monkeypatch.setattr(moodbot_domain, "get_active_state", spy)
+
+    # every policy asks for the states during a single prediction
+    for _ in range(4):
+        tracker.past_states(moodbot_domain)
+
+    # only the states before the two new actions have to be computed once, the
+    # current state of the tracker is computed on every call
+    assert len(computed_states) == 2 + 4
+
+
+def test_cached_past_states_are_faster_for_long_conversations(moodbot_domain: Domain,):
+    def latency_for_conversation_length(number_of_turns: int) -> float:
+        tracker = DialogueStateTracker("benchmark", moodbot_domain.slots)
+        for _ in range(number_of_turns):
+            _add_turn(tracker)
+            tracker.past_states(moodbot_domain)
+            tracker.update(ActionExecuted("utter_greet"))
+
+        def next_turn() -> None:
+            _add_turn(tracker)
+            tracker.past_states(moodbot_domain)
+            tracker.update(ActionExecuted("utter_greet"))
+
+        return _median_duration(next_turn)
+
+    def uncached_latency_for_conversation_length(number_of_turns: int) -> float:
+        tracker = DialogueStateTracker("benchmark", moodbot_domain.slots)
+        for _ in range(number_of_turns):
+            _add_turn(tracker)
+            tracker.update(ActionExecuted("utter_greet"))
+
+        def next_turn() -> None:
+            _add_turn(tracker)
+            tracker.clear_prior_states_cache()
+            tracker.past_states(moodbot_domain)
+            tracker.update(ActionExecuted("utter_greet"))
+
+        return _median_duration(next_turn)
+
+    cached = latency_for_conversation_length(500)
+    uncached = uncached_latency_for_conversation_length(500)
+
+    assert cached * 3 < uncached
+
+
+def _rule_states(rule_number: int) -> List[State]:
+    intent = f"intent_{rule_number}"
+    return [
+        {PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME}, USER: {INTENT: intent}},
+        {
+            PREVIOUS_ACTION: {ACTION_NAME: f"utter_{rule_number}"},
+            USER: {INTENT: intent},
+        },
+    ]
+
+
+def _rule_keys(number_of_rules: int) -> List[Text]:
+    return [
+        json.dumps(_rule_states(rule_number), sort_keys=True)
+        for rule_number in range(number_of_rules)
+    ]
+
+
+@pytest.mark.parametrize("number_of_rules", [100, 1000, 10000])
+def test_rule_lookup_is_independent_of_number_of_rules(
+    monkeypatch: MonkeyPatch, number_of_rules: int
+):
+    index = RuleIndex.from_rule_keys(_rule_keys(number_of_rules))
+    conversation = [{}, *_rule_states(42)]
+
+    checked_rule_states = []
+    does_rule_state_match_turn = RulePolicy._does_rule_state_match_turn
+
+    def spy(rule_state: State, conversation_state: State) -> bool:
+        checked_rule_states.append(rule_state)
+        return does_rule_state_match_turn(rule_state, conversation_state)
+
+    monkeypatch.setattr(RulePolicy, "_does_rule_state_match_turn", spy)
+
+    assert list(index.applicable_rules(conversation)) == _rule_keys(43)[42:]
+    # only the states of the applicable rule have to be checked
+    assert len(checked_rule_states) == 2
+
+
+def test_indexed_rule_lookup_is_faster_than_checking_every_rule():
+    number_of_rules = 10000
+    rule_keys = _rule_keys(number_of_rules)
+    conversation = [{}, *_rule_states(number_of_rules - 1)]
+    index = RuleIndex.from_rule_keys(rule_keys)
+
+    def check_every_rule() -> None:
+        for rule_key in rule_keys:
+            reversed_rule_states = list(reversed(json.loads(rule_key)))
+            all(
+                RulePolicy._does_rule_state_match_turn(rule_state, state)
+                for rule_state, state in zip(
+                    reversed_rule_states, reversed(conversation)
+                )
+            )
+
+    indexed = _median_duration(lambda: list(index.applicable_rules(conversation)))
+    linear = _median_duration(check_every_rule)
+
+    assert indexed * 100 < linear
+
+
+SEQUENCE_LENGTHS = [8, 16, 32, 64, 128]
+
+
+def _compare_eager_and_compiled_inference(
+    model: RasaModel, predictions: List[Callable[[], None]]
+) -> None:
+    def predict_all() -> None:
+        for predict in predictions:
+            predict()
+
+    # inputs of every length share the same trace of the prediction function
+    predict_all()
+    assert model._tf_predict_step.experimental_get_tracing_count() == 1
+
+    compiled_p50, compiled_p99 = _latency_percentiles(predict_all)
+
+    model.run_eagerly = True
+    eager_p50, eager_p99 = _latency_percentiles(predict_all)
+    model.run_eagerly = False
+
+    assert model._tf_predict_step.experimental_get_tracing_count() == 1
+    assert compiled_p50 * 1.5 < eager_p50
+    # tail latencies are noisy on shared hosts, they must just not get much worse
+    assert compiled_p99 < eager_p99 * 2
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_compiled_diet_inference_is_faster_than_eager_inference(
+    nlu_data_path: Text,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+):
+    training_data = RasaFileImporter(training_data_paths=[nlu_data_path]).get_nlu_data()
+    tokenizer = WhitespaceTokenizer(WhitespaceTokenizer.get_default_config())
+    featurizer = CountVectorsFeaturizer.create(
+        CountVectorsFeaturizer.get_default_config(),
+        default_model_storage,
+        Resource("CountVectorsFeaturizer"),
+        default_execution_context,
+    )
+    diet = DIETClassifier.create(
+        {**DIETClassifier.get_default_config(), EPOCHS: 1},
+        default_model_storage,
+        Resource("DIETClassifier"),
+        default_execution_context,
+    )
+
+    tokenizer.process_training_data(training_data)
+    featurizer.train(training_data)
+    featurizer.process_training_data(training_data)
+    diet.train(training_data)
+
+    messages = [
+        Message(data={TEXT: " ".join(["great"] * length)})
+        for length in SEQUENCE_LENGTHS
+    ]
+    tokenizer.process(messages)
+    featurizer.process(messages)
+
+    _compare_eager_and_compiled_inference(
+        diet.model,
+        [lambda message=message: diet._predict(message) for message in messages],
+    )
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_compiled_ted_inference_is_faster_than_eager_inference(
+    stories_path: Text,
+    domain: Domain,
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+):
+    policy = TEDPolicy.create(
+        {**TEDPolicy.get_default_config(), EPOCHS: 1},
+        default_model_storage,
+        Resource("TEDPolicy"),
+        default_execution_context,
+    )
+    training_trackers = rasa.core.training.load_data(
+        stories_path, domain, augmentation_factor=0
+    )
+    policy.train(training_trackers, domain)
+
+    def tracker_with_turns(number_of_turns: int) -> DialogueStateTracker:
+        tracker = DialogueStateTracker("benchmark", domain.slots)
+        for _ in range(number_of_turns):
+            _add_turn(tracker)
+            tracker.update(ActionExecuted("utter_greet"))
+        return tracker
+
+    trackers = [tracker_with_turns(length) for length in SEQUENCE_LENGTHS]
+
+    _compare_eager_and_compiled_inference(
+        policy.model,
+        [
+            lambda tracker=tracker: policy.predict_action_probabilities(tracker, domain)
+            for tracker in trackers
+        ],
+    )
+
+
+async def _startup_until_first_parse(model_path: Text) -> float:
+    start = time.perf_counter()
+
+    agent = await load_agent(model_path=model_path)
+    app = rasa.server.create_app(agent=agent)
+    _, response = await app.asgi_client.post("/model/parse", json={"text": "hello"})
+
+    assert response.status == HTTPStatus.OK
+    return time.perf_counter() - start
+
+
+@pytest.mark.timeout(600, func_only=True)
+async def test_startup_is_faster_when_models_are_loaded_without_training_step(
+    trained_moodbot_path: Text, monkeypatch: MonkeyPatch
+):
+    # load once so that both measurements start with warm imports and file caches
+    await _startup_until_first_parse(trained_moodbot_path)
+
+    startup_for_prediction = await _startup_until_first_parse(trained_moodbot_path)
+
+    load = RasaModel.load.__func__
+
+    def load_with_training_step(
+        cls: Type[RasaModel], *args: Any, **kwargs: Any
+    ) -> RasaModel:
+        # models which are finetuned are built by training them on one example
+        return load(cls, *args, **{**kwargs, "finetune_mode": True})
+
+    monkeypatch.setattr(RasaModel, "load", classmethod(load_with_training_step))
+    startup_with_training_step = await _startup_until_first_parse(trained_moodbot_path)
+
+    assert startup_for_prediction * 2 < startup_with_training_step
+
+
+def _package_and_load_model(
+    tmp_path: Path, monkeypatch: MonkeyPatch, archive_format: ArchiveFormat
+) -> float:
+    monkeypatch.setenv(MODEL_ARCHIVE_FORMAT_ENV, archive_format.value)
+    storage_path = tmp_path / archive_format.value / "storage"
+    storage_path.mkdir(parents=True)
+    storage = LocalModelStorage.create(storage_path)
+    with storage.write_to(Resource("weights")) as directory:
+        # trained weights hardly compress
+        np.random.default_rng(0).random(8_000_000, dtype=np.float32).tofile(
+            directory / "weights.data"
+        )
+
+    archive_path = tmp_path / archive_format.value / "model.tar.gz"
+    loaded_storage_path = tmp_path / archive_format.value / "loaded"
+    loaded_storage_path.mkdir()
+
+    start = time.perf_counter()
+    storage.create_model_package(
+        archive_path,
+        GraphModelConfiguration(
+            GraphSchema({}), GraphSchema({}), TrainingType.BOTH, None, None, "nlu"
+        ),
+        Domain.empty(),
+    )
+    LocalModelStorage.from_model_archive(loaded_storage_path, archive_path)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("archive_format", [ArchiveFormat.TAR, ArchiveFormat.ZSTD])
+def test_archive_format_is_faster_than_gzip_for_large_models(
+    tmp_path: Path, monkeypatch: MonkeyPatch, archive_format: ArchiveFormat
+):
+    if archive_format == ArchiveFormat.ZSTD:
+        pytest.importorskip("zstandard")
+
+    gzip_duration = _package_and_load_model(tmp_path, monkeypatch, ArchiveFormat.GZIP)
+    duration = _package_and_load_model(tmp_path, monkeypatch, archive_format)
+
+    assert duration * 2 < gzip_duration
+
+
+def _conversation_with_sessions(
+    sender_id: Text, number_of_sessions: int, events_per_session: int = 10
+) -> DialogueStateTracker:
+    tracker = DialogueStateTracker(sender_id, [])
+    timestamp = 0
+    for _ in range(number_of_sessions):
+        timestamp += 1
+        tracker.update(SessionStarted(timestamp=timestamp))
+        for _ in range(events_per_session - 1):
+            timestamp += 1
+            tracker.update(user_uttered("greet", timestamp=timestamp))
+    return tracker
+
+
+def test_sql_latest_session_retrieval_is_independent_of_conversation_history(
+    tmp_path: Path, moodbot_domain: Domain
+):
+    tracker_store = SQLTrackerStore(moodbot_domain, db=str(tmp_path / "rasa.db"))
+    # other conversations share the table
+    for conversation in range(100):
+        tracker_store.save(_conversation_with_sessions(f"other {conversation}", 10))
+
+    tracker_store.save(_conversation_with_sessions("short", 1))
+    tracker_store.save(_conversation_with_sessions("long", 2000))
+
+    def retrieve(sender_id: Text) -> Callable[[], None]:
+        def retrieve_latest_session() -> None:
+            assert len(tracker_store.retrieve(sender_id).events) == 10
+
+        return retrieve_latest_session
+
+    short = _median_duration(retrieve("short"), repetitions=20)
+    long = _median_duration(retrieve("long"), repetitions=20)
+
+    assert long < short * 2
+
+
+def test_sql_bulk_insert_is_faster_than_adding_events_one_by_one(
+    tmp_path: Path, moodbot_domain: Domain
+):
+    tracker_store = SQLTrackerStore(moodbot_domain, db=str(tmp_path / "rasa.db"))
+    trackers = [_conversation_with_sessions(f"{i}", 200) for i in range(2)]
+
+    def add_events_one_by_one() -> None:
+        with tracker_store.session_scope() as session:
+            for event in trackers[0].events:
+                session.add(
+                    tracker_store.SQLEvent(
+                        **tracker_store._event_row(trackers[0].sender_id, event)
+                    )
+                )
+            session.commit()
+
+    bulk = _median_duration(lambda: tracker_store.save(trackers[1]), repetitions=1)
+    one_by_one = _median_duration(add_events_one_by_one, repetitions=1)
+
+    assert bulk * 2 < one_by_one
+
+
+async def _queued_message_latencies(
+    lock_store: LockStore,
+    number_of_senders: int = 5,
+    messages_per_sender: int = 5,
+    wait_time_in_seconds: float = 0.1,
+) -> List[float]:
+    """Measures how long queued messages wait after the previous one was handled."""
+    latencies = []
+    releases = {}
+
+    async def handle_message(sender_id: Text) -> None:
+        async with lock_store.lock(
+            sender_id, wait_time_in_seconds=wait_time_in_seconds
+        ):
+            if sender_id in releases:
+                latencies.append(time.perf_counter() - releases[sender_id])
+            # processing the message
+            await asyncio.sleep(0.005)
+            releases[sender_id] = time.perf_counter()
+
+    # every sender sends a burst of messages at once
+    await asyncio.gather(
+        *(
+            handle_message(f"sender {sender}")
+            for sender in range(number_of_senders)
+            for _ in range(messages_per_sender)
+        )
+    )
+
+    return latencies
+
+
+async def test_queued_messages_are_handled_when_lock_is_released():
+    class PollingLockStore(InMemoryLockStore):
+        async def _wait_for_lock_release(
+            self, conversation_id: Text, wait_time_in_seconds: float
+        ) -> None:
+            await LockStore._wait_for_lock_release(
+                self, conversation_id, wait_time_in_seconds
+            )
+
+    notified = await _queued_message_latencies(InMemoryLockStore())
+    polled = await _queued_message_latencies(PollingLockStore())
+
+    assert len(notified) == len(polled) == 5 * 4
+    assert np.percentile(notified, 99) * 10 < np.percentile(polled, 50)
+
+
+def _conversation_with_events(
+    sender_id: Text, number_of_events: int
+) -> DialogueStateTracker:
+    tracker = DialogueStateTracker(sender_id, [])
+    while len(tracker.events) < number_of_events:
+        _add_turn(tracker)
+        tracker.update(ActionExecuted("utter_greet"))
+        tracker.update(BotUttered("Hey!", metadata={"utter_action": "utter_greet"}))
+    return tracker
+
+
+def _tracker_store_throughput(
+    tracker_store: SQLTrackerStore, number_of_events: int, repetitions: int = 5
+) -> Tuple[float, float]:
+    """Measures how many events per second are saved and loaded."""
+    save_durations = []
+    load_durations = []
+    for repetition in range(repetitions):
+        tracker = _conversation_with_events(
+            f"{number_of_events} {repetition} {time.time()}", number_of_events
+        )
+
+        start = time.perf_counter()
+        tracker_store.save(tracker)
+        save_durations.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        assert len(tracker_store.retrieve(tracker.sender_id).events) == len(
+            tracker.events
+        )
+        load_durations.append(time.perf_counter() - start)
+
+    return (
+        number_of_events / statistics.median(save_durations),
+        number_of_events / statistics.median(load_durations),
+    )
+
+
+@pytest.mark.parametrize(
+    "number_of_events, minimum_speedup", [(10, None), (100, 2), (1000, 3)]
+)
+def test_event_codec_tracker_store_throughput(
+    tmp_path: Path,
+    moodbot_domain: Domain,
+    monkeypatch: MonkeyPatch,
+    record_property: Callable[[Text, Any], None],
+    number_of_events: int,
+    minimum_speedup: Optional[int],
+):
+    tracker_store = SQLTrackerStore(moodbot_domain, db=str(tmp_path / "rasa.db"))
+
+    saved_per_second, loaded_per_second = _tracker_store_throughput(
+        tracker_store, number_of_events
+    )
+
+    def scan_event_classes() -> Dict[Text, Type[Event]]:
+        return {
+            event_class.type_name: event_class
+            for event_class in reversed(rasa.shared.utils.common.all_subclasses(Event))
+        }
+
+    # resolve event classes and (de)serialize JSON like before the event codec
+    monkeypatch.setattr(
+        Event, "_event_classes_by_type_name", staticmethod(scan_event_classes)
+    )
+    monkeypatch.setattr(event_codec, "_dumps", json.dumps)
+    monkeypatch.setattr(event_codec, "_loads", json.loads)
+
+    (
+        saved_per_second_without_codec,
+        loaded_per_second_without_codec,
+    ) = _tracker_store_throughput(tracker_store, number_of_events)
+
+    record_property("saved_events_per_second", saved_per_second)
+    record_property("loaded_events_per_second", loaded_per_second)
+    record_property(
+        "saved_events_per_second_without_codec", saved_per_second_without_codec
+    )
+    record_property(
+        "loaded_events_per_second_without_codec", loaded_per_second_without_codec
+    )
+
+    # short conversations are dominated by the queries of the tracker store
+    if minimum_speedup:
+        assert loaded_per_second > loaded_per_second_without_codec * minimum_speedup
+
+
+LOOKUP_TABLE_MESSAGE = (
+    "I would like to fly from Berlin to some other city tomorrow morning and then "
+    "travel back to Berlin on Sunday evening please"
+)
+
+
+def _lookup_table(number_of_elements: int) -> List[Text]:
+    rng = random.Random(42)
+
+    def word() -> Text:
+        return "".join(
+            rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 12))
+        )
+
+    elements = [
+        word() if rng.random() < 0.7 else f"{word()} {word()}"
+        for _ in range(number_of_elements - 1)
+    ]
+    elements.insert(number_of_elements // 2, "berlin")
+    return elements
+
+
+def _lookup_table_matching_duration(elements: List[Text]) -> float:
+    find_matches = pattern_utils.create_pattern_matcher(
+        {"name": "city", "elements": elements}, case_sensitive=False
+    )
+    assert find_matches(LOOKUP_TABLE_MESSAGE) == [(25, 31), (92, 98)]
+
+    return _median_duration(lambda: find_matches(LOOKUP_TABLE_MESSAGE), 50)
+
+
+@pytest.mark.parametrize("number_of_elements", [10_000, 100_000, 1_000_000])
+def test_lookup_table_matching_is_independent_of_table_size(
+    record_property: Callable[[Text, Any], None], number_of_elements: int
+):
+    small_table_duration = _lookup_table_matching_duration(_lookup_table(1000))
+    duration = _lookup_table_matching_duration(_lookup_table(number_of_elements))
+
+    record_property("matching_duration_1000_elements", small_table_duration)
+    record_property(f"matching_duration_{number_of_elements}_elements", duration)
+
+    assert duration < small_table_duration * 3
+
+
+def test_lookup_table_matcher_is_faster_than_regex(
+    record_property: Callable[[Text, Any], None]
+):
+    elements = _lookup_table(10_000)
+
+    matcher_duration = _lookup_table_matching_duration(elements)
+
+    lookup_regex = pattern_utils._generate_lookup_regex(
+        {"name": "city", "elements": elements}
+    )
+    regex = pattern_utils.create_pattern_matcher(
+        {"name": "city", "pattern": lookup_regex}, case_sensitive=False
+    )
+    assert regex(LOOKUP_TABLE_MESSAGE) == [(25, 31), (92, 98)]
+    regex_duration = _median_duration(lambda: regex(LOOKUP_TABLE_MESSAGE))
+
+    record_property("matcher_duration", matcher_duration)
+    record_property("regex_duration", regex_duration)
+
+    assert matcher_duration * 5 < regex_duration
+
+
+def _regex_patterns(number_of_patterns: int) -> List[Dict[Text, Text]]:
+    return [
+        {"name": f"pattern_{index}", "pattern": f"\\b{index}[a-z]+\\d{{2,4}}\\b"}
+        for index in range(number_of_patterns)
+    ]
+
+
+@pytest.mark.parametrize(
+    "number_of_patterns, minimum_speedup", [(100, None), (600, 10), (1000, 10)]
+)
+def test_precompiled_regex_patterns_per_message_cost(
+    record_property: Callable[[Text, Any], None],
+    number_of_patterns: int,
+    minimum_speedup: Optional[int],
+):
+    patterns = _regex_patterns(number_of_patterns)
+    message = "my order 42abc123 has not arrived yet, please check 7xyz99 for me"
+    pattern_matchers = [
+        pattern_utils.create_pattern_matcher(pattern, case_sensitive=False)
+        for pattern in patterns
+    ]
+
+    def match_precompiled() -> None:
+        for find_matches in pattern_matchers:
+            find_matches(message)
+
+    def match_raw_patterns() -> None:
+        for pattern in patterns:
+            list(re.finditer(pattern["pattern"], message, flags=re.IGNORECASE))
+
+    precompiled_duration = _median_duration(match_precompiled)
+    raw_patterns_duration = _median_duration(match_raw_patterns)
+
+    record_property("precompiled_duration_per_message", precompiled_duration)
+    record_property("raw_patterns_duration_per_message", raw_patterns_duration)
+
+    # `re` caches up to 512 compiled patterns, more patterns are compiled again
+    # for every message
+    if minimum_speedup:
+        assert precompiled_duration * minimum_speedup < raw_patterns_duration
+
+
+def _tokenized_messages(number_of_messages: int) -> List[Message]:
+    rng = random.Random(42)
+    words = ["hello", "there", "book", "a", "flight", "to", "berlin", "please"]
+    tokenizer = WhitespaceTokenizer(WhitespaceTokenizer.get_default_config())
+
+    messages = [
+        Message(data={TEXT: " ".join(rng.choices(words, k=rng.randint(3, 12)))})
+        for _ in range(number_of_messages)
+    ]
+    tokenizer.process(messages)
+    return messages
+
+
+@pytest.mark.timeout(600, func_only=True)
+@pytest.mark.parametrize(
+    "number_of_messages, minimum_speedup", [(1000, 2), (10_000, 2), (100_000, None)]
+)
+def test_batched_count_vectors_featurization_throughput(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    record_property: Callable[[Text, Any], None],
+    number_of_messages: int,
+    minimum_speedup: Optional[int],
+):
+    featurizer = CountVectorsFeaturizer.create(
+        {**CountVectorsFeaturizer.get_default_config(), "analyzer": "char_wb"},
+        default_model_storage,
+        Resource("CountVectorsFeaturizer"),
+        default_execution_context,
+    )
+    featurizer.train(TrainingData(_tokenized_messages(100)))
+
+    messages = _tokenized_messages(number_of_messages)
+    start = time.perf_counter()
+    featurizer.process(messages)
+    messages_per_second = number_of_messages / (time.perf_counter() - start)
+    record_property("batched_messages_per_second", messages_per_second)
+
+    # featurizing all messages one by one takes too long for large batches
+    if minimum_speedup:
+        messages = _tokenized_messages(number_of_messages)
+        start = time.perf_counter()
+        for message in messages:
+            featurizer.process([message])
+        single_messages_per_second = number_of_messages / (time.perf_counter() - start)
+        record_property("single_messages_per_second", single_messages_per_second)
+
+        assert messages_per_second > single_messages_per_second * minimum_speedup
+
+
+def _fixed_size_batches(number_of_examples: int, batch_size: int) -> List[List[int]]:
+    return [
+        list(range(start, min(start + batch_size, number_of_examples)))
+        for start in range(0, number_of_examples, batch_size)
+    ]
+
+
+def _simulated_language_model_duration(
+    batches: List[List[int]], sequence_lengths: List[int]
+) -> float:
+    # the cost of a language model grows with the padded size of its input batch
+    weights = np.ones((64, 64), dtype=np.float32)
+
+    def run_model() -> None:
+        for batch in batches:
+            padded_length = max(sequence_lengths[index] for index in batch)
+            np.ones((len(batch), padded_length, 64), dtype=np.float32) @ weights
+
+    return _median_duration(run_model, repetitions=3)
+
+
+@pytest.mark.parametrize("number_of_examples", [1000, 10_000])
+def test_length_bucketed_language_model_batches_reduce_padding(
+    record_property: Callable[[Text, Any], None], number_of_examples: int
+):
+    rng = random.Random(42)
+    # mostly short examples with a few long ones, as in typical NLU training data
+    sequence_lengths = [
+        rng.randint(3, 15) if rng.random() < 0.9 else rng.randint(50, 250)
+        for _ in range(number_of_examples)
+    ]
+    actual_tokens = sum(sequence_lengths)
+
+    bucketed_batches = LanguageModelFeaturizer._create_length_bucketed_batches(
+        sequence_lengths,
+        LanguageModelFeaturizer.get_default_config()["batch_token_budget"],
+    )
+    fixed_batches = _fixed_size_batches(number_of_examples, 64)
+
+    def padded_tokens(batches: List[List[int]]) -> int:
+        return sum(
+            len(batch) * max(sequence_lengths[index] for index in batch)
+            for batch in batches
+        )
+
+    bucketed_padded_tokens = padded_tokens(bucketed_batches)
+    fixed_padded_tokens = padded_tokens(fixed_batches)
+    record_property(
+        "padding_share_bucketed", 1 - actual_tokens / bucketed_padded_tokens
+    )
+    record_property("padding_share_fixed", 1 - actual_tokens / fixed_padded_tokens)
+
+    assert sorted(index for batch in bucketed_batches for index in batch) == list(
+        range(number_of_examples)
+    )
+    assert bucketed_padded_tokens * 5 < fixed_padded_tokens
+
+    bucketed_duration = _simulated_language_model_duration(
+        bucketed_batches, sequence_lengths
+    )
+    fixed_duration = _simulated_language_model_duration(fixed_batches, sequence_lengths)
+    record_property(
+        "bucketed_examples_per_second", number_of_examples / bucketed_duration
+    )
+    record_property("fixed_examples_per_second", number_of_examples / fixed_duration)
+
+    assert bucketed_duration * 2 < fixed_duration
+
+
+@pytest.mark.parametrize("number_of_turns, minimum_speedup", [(100, 3), (1000, 10)])
+def test_state_encoding_scales_with_number_of_distinct_states(
+    moodbot_domain: Domain,
+    record_property: Callable[[Text, Any], None],
+    number_of_turns: int,
+    minimum_speedup: int,
+):
+    rng = random.Random(42)
+    tracker = DialogueStateTracker("benchmark", moodbot_domain.slots)
+    for _ in range(number_of_turns):
+        tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+        tracker.update(user_uttered(rng.choice(moodbot_domain.intents)))
+        tracker.update(ActionExecuted(rng.choice(moodbot_domain.user_actions)))
+
+    state_featurizer = SingleStateFeaturizer()
+    tracker_featurizer = MaxHistoryTrackerFeaturizer(state_featurizer, max_history=5)
+    tracker_featurizer.prepare_for_featurization(moodbot_domain)
+    trackers_as_states, _ = tracker_featurizer.training_states_and_labels(
+        [tracker], moodbot_domain
+    )
+    number_of_states = sum(len(states) for states in trackers_as_states)
+
+    def encode_every_state() -> None:
+        for states in trackers_as_states:
+            for state in states:
+                state_featurizer.encode_state(state, None)
+
+    uncached_duration = _median_duration(encode_every_state, repetitions=3)
+    cached_duration = _median_duration(
+        lambda: tracker_featurizer._featurize_states(trackers_as_states, None),
+        repetitions=3,
+    )
+
+    encoded_states = []
+    encode_state = state_featurizer.encode_state
+
+    def spy(*args, **kwargs):
+        encoded_states.append(args)
+        return encode_state(*args, **kwargs)
+
+    state_featurizer.encode_state = spy
+    tracker_featurizer._featurize_states(trackers_as_states, None)
+
+    record_property("number_of_states", number_of_states)
+    record_property("number_of_distinct_states", len(encoded_states))
+    record_property("cached_states_per_second", number_of_states / cached_duration)
+    record_property("uncached_states_per_second", number_of_states / uncached_duration)
+
+    assert len(encoded_states) * minimum_speedup < number_of_states
+    assert cached_duration * minimum_speedup < uncached_duration
+
+
+def test_shared_training_tracker_states_speed_up_creating_training_examples(
+    record_property: Callable[[Text, Any], None],
+):
+    domain = Domain.load("examples/concertbot/domain.yml")
+    trackers = rasa.core.training.load_data(
+        "examples/concertbot/data", domain, augmentation_factor=20
+    )
+    # the tracker featurizers of the `MemoizationPolicy`, the `TEDPolicy` and the
+    # `UnexpecTEDIntentPolicy`
+    tracker_featurizers = [
+        MaxHistoryTrackerFeaturizer(None, max_history=5),
+        MaxHistoryTrackerFeaturizer(SingleStateFeaturizer(), max_history=8),
+        IntentMaxHistoryTrackerFeaturizer(SingleStateFeaturizer(), max_history=5),
+    ]
+
+    def create_training_examples(share_states: bool) -> None:
+        training_tracker_states = (
+            TrainingTrackerStates.from_trackers(trackers, domain)
+            if share_states
+            else None
+        )
+        for tracker_featurizer in tracker_featurizers:
+            tracker_featurizer.training_states_and_labels(
+                trackers, domain, training_tracker_states=training_tracker_states
+            )
+
+    unshared_duration = _median_duration(lambda: create_training_examples(False))
+    shared_duration = _median_duration(lambda: create_training_examples(True))
+    record_property("number_of_trackers", len(trackers))
+    record_property("unshared_trackers_per_second", len(trackers) / unshared_duration)
+    record_property("shared_trackers_per_second", len(trackers) / shared_duration)
+
+    assert shared_duration < unshared_duration
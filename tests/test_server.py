@@ -9,7 +9,7 @@ from http import HTTPStatus
 from multiprocessing import Process, Manager
 from multiprocessing.managers import DictProxy
 from pathlib import Path
-from typing import List, Text, Type, Generator, NoReturn, Dict, Optional
+from typing import Any, List, Text, Type, Generator, NoReturn, Dict, Optional
 from unittest.mock import Mock, ANY
 
 from _pytest.tmpdir import TempPathFactory
@@ -27,6 +27,7 @@ from sanic_testing.testing import SanicASGITestClient
 import rasa
 import rasa.constants
 import rasa.core.jobs
+from rasa.engine.exceptions import GraphRunQueueFull
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 import rasa.nlu
 import rasa.server
@@ -446,6 +447,18 @@ async def test_parse_on_invalid_emulation_mode(rasa_app: SanicASGITestClient,):
     assert response.status == HTTPStatus.BAD_REQUEST
 
 
+async def test_parse_if_graph_runner_queue_is_full(
+    rasa_app: SanicASGITestClient, monkeypatch: MonkeyPatch
+):
+    async def run(*args: Any, **kwargs: Any) -> None:
+        raise GraphRunQueueFull()
+
+    monkeypatch.setattr(rasa_app.sanic_app.agent.graph_executor, "run", run)
+
+    _, response = await rasa_app.post("/model/parse", json={"text": "hello"})
+    assert response.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+
 async def test_train_nlu_success(
     rasa_app: SanicASGITestClient,
     stack_config_path: Text,
@@ -2114,7 +2127,7 @@ async def test_update_conversation_with_events(
     model_id = agent.model_id
 
     if initial_tracker_events:
-        tracker = agent.processor.get_tracker(conversation_id)
+        tracker = await agent.processor.get_tracker(conversation_id)
         tracker.update_with_events(initial_tracker_events, domain)
         tracker_store.save(tracker)
 
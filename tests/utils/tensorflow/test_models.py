@@ -125,6 +125,46 @@ def test_batch_inference(
     )
 
 
+def test_inference_runs_in_graph_mode_and_is_traced_once():
+    model = RasaModel()
+    executed_eagerly = []
+
+    def _batch_predict(
+        batch_in: Tuple[np.ndarray],
+    ) -> Dict[Text, Union[np.ndarray, Dict[Text, np.ndarray]]]:
+        executed_eagerly.append(tf.executing_eagerly())
+        return {"dummy_output": batch_in[0]}
+
+    model.batch_predict = _batch_predict
+
+    for number_of_data_points, sequence_length in [(1, 8), (3, 16), (2, 128)]:
+        model_data = RasaModelData(
+            label_key=LABEL,
+            label_sub_key=IDS,
+            data={
+                TEXT: {
+                    SENTENCE: [
+                        FeatureArray(
+                            np.random.rand(number_of_data_points, sequence_length, 2),
+                            number_of_dimensions=3,
+                        ),
+                    ]
+                }
+            },
+        )
+        output = model.run_inference(model_data, batch_size=number_of_data_points)
+
+        assert output["dummy_output"].shape == (
+            number_of_data_points,
+            sequence_length,
+            2,
+        )
+
+    # the prediction function was traced once and is reused for every input shape
+    assert executed_eagerly == [False]
+    assert model._tf_predict_step.experimental_get_tracing_count() == 1
+
+
 @pytest.mark.parametrize(
     "new_sparse_feature_sizes, old_sparse_feature_sizes, raise_exception",
     [
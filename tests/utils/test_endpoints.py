@@ -4,6 +4,8 @@ from typing import Text, Optional, Union
 from unittest.mock import Mock
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
 
 from rasa.shared.exceptions import FileNotFoundException
@@ -103,7 +105,7 @@ async def test_endpoint_config_with_cafile(tmp_path: Path):
         )
 
         mocked.post(
-            "https://example.com/", status=200,
+            "https://example.com/", status=200, repeat=True,
         )
 
         await endpoint.request("post",)
@@ -114,6 +116,11 @@ async def test_endpoint_config_with_cafile(tmp_path: Path):
         certs = ssl_context.get_ca_certs()
         assert certs[0]["subject"][4][0] == ("organizationalUnitName", "rasa")
 
+        # the certificates are only loaded once
+        await endpoint.request("post",)
+        request = latest_request(mocked, "post", "https://example.com/")[-1]
+        assert request.kwargs["ssl"] is ssl_context
+
 
 async def test_endpoint_config_with_non_existent_cafile(tmp_path: Path):
     cafile = "data/test_endpoints/no_file.pem"
@@ -158,6 +165,83 @@ async def test_request_non_json_response():
         assert not response
 
 
+async def test_requests_reuse_pooled_session():
+    with aioresponses() as mocked:
+        endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+        mocked.post("https://example.com/", payload={"ok": True}, repeat=True)
+
+        await endpoint.request("post")
+        session = endpoint.pooled_session()
+        await endpoint.request("post")
+
+        assert endpoint.pooled_session() is session
+        assert not session.closed
+
+        await endpoint.close()
+        assert session.closed
+
+        # a new session is created for subsequent requests
+        await endpoint.request("post")
+        assert endpoint.pooled_session() is not session
+        await endpoint.close()
+
+
+async def test_requests_reuse_connections():
+    connections = set()
+
+    async def handler(request: web.Request) -> web.Response:
+        connections.add(request.transport.get_extra_info("sockname"))
+        connections.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+
+    async with TestServer(app) as server:
+        endpoint = endpoint_utils.EndpointConfig(str(server.make_url("/")))
+
+        for _ in range(5):
+            assert await endpoint.request("post") == {"ok": True}
+
+        await endpoint.close()
+
+    # one server socket and one client socket
+    assert len(connections) == 2
+
+
+async def test_session_is_configured():
+    endpoint = endpoint_utils.EndpointConfig.from_dict(
+        {
+            "url": "https://example.com/",
+            "request_timeout": 5,
+            "connection_limit": 10,
+            "connection_limit_per_host": 2,
+            "keepalive_timeout": 30,
+            "dns_cache_ttl": 60,
+        }
+    )
+
+    async with endpoint.session() as session:
+        assert session.timeout.total == 5
+        assert session.connector.limit == 10
+        assert session.connector.limit_per_host == 2
+        assert session.connector._keepalive_timeout == 30
+        assert session.connector.use_dns_cache
+        assert session.connector._cached_hosts._ttl == 60
+
+    assert endpoint.copy().connection_limit == 10
+    assert endpoint.kwargs == {}
+
+
+async def test_close_endpoint_without_session():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+    await endpoint.close()
+
+    assert endpoint.pooled_session()
+    await endpoint.close()
+
+
 @pytest.mark.parametrize(
     "filename, endpoint_type",
     [("data/test_endpoints/example_endpoints.yml", "tracker_store"),],